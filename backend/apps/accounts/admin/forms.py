@@ -0,0 +1,20 @@
+from unfold.forms import UserChangeForm, UserCreationForm
+
+from apps.accounts.models import User
+
+
+class CustomUserCreationForm(UserCreationForm):
+    """
+    Used by the Admin Panel.
+    Keeps default behavior (including usable_password) so Admin doesn't crash.
+    """
+
+    class Meta:
+        model = User
+        fields = ("username", "email")
+
+
+class CustomUserChangeForm(UserChangeForm):
+    class Meta:
+        model = User
+        fields = "__all__"
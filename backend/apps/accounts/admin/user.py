@@ -4,9 +4,11 @@ from django.contrib.auth.models import Group
 from unfold.admin import ModelAdmin
 from unfold.forms import AdminPasswordChangeForm
 
-from apps.accounts.forms import CustomUserChangeForm, CustomUserCreationForm
+from apps.accounts.admin.forms import CustomUserChangeForm, CustomUserCreationForm
 from apps.accounts.models import User
 from apps.profiles.admin import PlayerProfileInline
+from apps.profiles.models import PlayerProfile
+from apps.tasks.services.deletion import purge_profile_logs
 
 admin.site.unregister(Group)
 
@@ -51,3 +53,12 @@ class UserAdmin(BaseUserAdmin, ModelAdmin):
         return getattr(obj.profile, "rank", "-")
 
     get_rank.short_description = "Rank"
+
+    def delete_model(self, request, obj):
+        # Drop the completion history in one statement before the cascade
+        purge_profile_logs(PlayerProfile.objects.filter(user=obj).values("pk"))
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        purge_profile_logs(PlayerProfile.objects.filter(user__in=queryset).values("pk"))
+        super().delete_queryset(request, queryset)
@@ -1,27 +1,15 @@
-from unfold.forms import UserChangeForm, UserCreationForm
+from django.contrib.auth.forms import UserCreationForm
 
 from apps.accounts.models import User
 
 
-class CustomUserCreationForm(UserCreationForm):
-    """
-    Used by the Admin Panel.
-    Keeps default behavior (including usable_password) so Admin doesn't crash.
-    """
-
-    class Meta:
-        model = User
-        fields = ("username", "email")
-
-
 class PublicUserCreationForm(UserCreationForm):
     """
     Used by the Register View.
-    Removes the admin-only 'usable_password' field and adds styling.
+    Built on Django's form (not Unfold's), so the site doesn't load the Admin theme.
+    Adds styling.
     """
 
-    usable_password = None
-
     class Meta:
         model = User
         fields = (
@@ -47,9 +35,3 @@ class PublicUserCreationForm(UserCreationForm):
             # Add specific classes for email/password if needed
             if field_name == "email":
                 field.widget.attrs.update({"class": "form-control email-field"})
-
-
-class CustomUserChangeForm(UserChangeForm):
-    class Meta:
-        model = User
-        fields = "__all__"
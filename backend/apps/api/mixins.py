@@ -0,0 +1,43 @@
+from django.utils.cache import patch_cache_control
+from django.utils.http import quote_etag
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+
+from apps.profiles.services.player import get_player_etag
+
+
+class NotModified(APIException):
+    status_code = status.HTTP_304_NOT_MODIFIED
+
+
+class PlayerETagMixin:
+    """
+    Conditional GET for endpoints built from the player's data.
+    The ETag is the player's data watermark (see get_player_etag),
+    checked right after authentication, before the handler runs.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.etag = None
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        self.etag = quote_etag(get_player_etag(request, request.player))
+        if_none_match = request.headers.get("If-None-Match", "")
+        if self.etag in (tag.strip() for tag in if_none_match.split(",")):
+            raise NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            # 304s carry no body
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if getattr(self, "etag", None) and response.status_code in (200, 304):
+            response["ETag"] = self.etag
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
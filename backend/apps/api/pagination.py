@@ -0,0 +1,78 @@
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from apps.tasks.services.history import get_feed_page
+
+
+class HistoryCursorPagination(BasePagination):
+    """
+    Keyset pagination for the completion history (see get_feed_page):
+    the cost of a page doesn't grow with how far back the client scrolls,
+    and the compacted months follow the raw logs instead of cutting them off.
+    The view provides the compacted months with get_summaries().
+    """
+
+    cursor_query_param = "cursor"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page, self.next_cursor = get_feed_page(
+            queryset,
+            view.get_summaries(),
+            request.query_params.get(self.cursor_query_param),
+            self.get_page_size(request),
+        )
+        return page
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": (
+                    f"Number of results per page (max {self.max_page_size})."
+                ),
+                "schema": {"type": "integer"},
+            },
+        ]
@@ -0,0 +1,31 @@
+"""
+OpenAPI annotations of the API views.
+drf_spectacular is only installed with the full settings: the slim web profile
+(core/settings/web.py) doesn't import it, the annotations are then no-ops.
+"""
+
+from django.conf import settings
+
+if "drf_spectacular" in settings.INSTALLED_APPS:
+    from drf_spectacular.types import OpenApiTypes
+    from drf_spectacular.utils import (
+        OpenApiParameter,
+        extend_schema,
+        inline_serializer,
+    )
+else:
+
+    def extend_schema(*args, **kwargs):
+        return lambda target: target
+
+    def OpenApiParameter(*args, **kwargs):  # noqa: N802 (same name as the class)
+        return None
+
+    def inline_serializer(*args, **kwargs):
+        return None
+
+    class OpenApiTypes:
+        BINARY = None
+
+
+__all__ = ["OpenApiParameter", "OpenApiTypes", "extend_schema", "inline_serializer"]
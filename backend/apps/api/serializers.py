@@ -0,0 +1,344 @@
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import serializers
+
+from apps.gate.models import DailyEntry
+from apps.gate.services.gate import decode_task_cursor
+from apps.gate.services.highlights import MAX_HIGHLIGHTS
+from apps.profiles.models import PlayerProfile, PlayerStats
+from apps.profiles.services.affinity import get_affinity
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services.rollup import SERIES_BUCKETS
+
+
+class SparseFieldsetMixin:
+    """
+    Sparse fieldsets: '?fields=level,xp_current' keeps only those fields.
+    Nested serializers are built without a context, so only the top-level
+    one (or each item of a list response) is filtered.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        fields = request.query_params.get("fields") if request else None
+        if not fields:
+            return
+
+        wanted = {name.strip() for name in fields.split(",") if name.strip()}
+        for name in set(self.fields) - wanted:
+            self.fields.pop(name)
+
+
+# --- Player ---
+class PlayerStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PlayerStats
+        fields = [
+            f"{stat.lower()}_{suffix}"
+            for stat in PlayerStats.StatType.values
+            for suffix in ("level", "xp")
+        ]
+
+
+class PlayerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    username = serializers.CharField(source="user.username")
+    xp_required = serializers.IntegerField()
+    xp_percent = serializers.FloatField()
+    stats = PlayerStatsSerializer()
+    affinity = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PlayerProfile
+        fields = [
+            "username",
+            "level",
+            "xp_current",
+            "xp_required",
+            "xp_percent",
+            "rank",
+            "job_class",
+            "stats",
+            "affinity",
+        ]
+
+    def get_affinity(self, profile) -> dict:
+        return get_affinity(profile.stats)
+
+
+# --- Habit Grid ---
+class HabitDaySerializer(serializers.Serializer):
+    date = serializers.DateField()
+    status = serializers.BooleanField()
+    state = serializers.CharField()
+    is_today = serializers.BooleanField()
+
+
+class HabitRowSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    status = HabitDaySerializer(many=True)
+
+
+class HabitGridSerializer(SparseFieldsetMixin, serializers.Serializer):
+    month = serializers.CharField()
+    month_days = serializers.ListField(child=serializers.IntegerField())
+    habit_grid = HabitRowSerializer(many=True)
+    habit_counts_data = serializers.ListField(child=serializers.IntegerField())
+    habit_titles_data = serializers.ListField(
+        child=serializers.ListField(child=serializers.CharField())
+    )
+    total_active_habits = serializers.IntegerField()
+
+
+# --- Habit Heatmap ---
+class HabitHeatmapQuerySerializer(serializers.Serializer):
+    year = serializers.IntegerField(
+        required=False,
+        min_value=1300,
+        max_value=1500,
+        help_text="Jalali year. Defaults to the current one.",
+    )
+
+
+class HabitBitmapSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    completions = serializers.IntegerField()
+    bitmap = serializers.CharField(
+        help_text=(
+            "Base64. Bit N (byte N // 8, least significant bit first) "
+            "is set if the habit was completed on day N of the year."
+        )
+    )
+
+
+class HabitHeatmapSerializer(SparseFieldsetMixin, serializers.Serializer):
+    year = serializers.IntegerField()
+    start = serializers.DateField(help_text="Gregorian date of day 0 (1 Farvardin)")
+    days = serializers.IntegerField(help_text="365 or 366")
+    habits = HabitBitmapSerializer(many=True)
+
+
+# --- Calendar ---
+class CalendarDaySerializer(serializers.Serializer):
+    day = serializers.IntegerField()
+    is_today = serializers.BooleanField()
+    is_past = serializers.BooleanField()
+    is_future = serializers.BooleanField()
+    has_log = serializers.BooleanField()
+    full_date = serializers.CharField(help_text="Jalali date (YYYY-MM-DD)")
+
+
+class CalendarSerializer(SparseFieldsetMixin, serializers.Serializer):
+    today = serializers.CharField(help_text="Jalali date (YYYY-MM-DD)")
+    current_month_str = serializers.CharField()
+    # Leading nulls pad the first week (0=Sat ... 6=Fri)
+    calendar_days = serializers.ListField(
+        child=CalendarDaySerializer(allow_null=True)
+    )
+
+
+# --- Agenda ---
+class AgendaTaskSerializer(serializers.ModelSerializer):
+    final_rank = serializers.CharField()
+    xp_reward = serializers.IntegerField()
+    is_completed = serializers.SerializerMethodField()
+    subtasks = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Task
+        fields = [
+            "id",
+            "title",
+            "final_rank",
+            "primary_stat",
+            "secondary_stat",
+            "xp_reward",
+            "is_completed",
+            "subtasks",
+        ]
+
+    def get_is_completed(self, task) -> bool:
+        return task.id in self.context.get("completed_task_ids", ())
+
+    def get_subtasks(self, task) -> list:
+        if getattr(task, "subtask_count", 0) == 0:
+            return []
+        return AgendaTaskSerializer(
+            task.subtasks.all(), many=True, context=self.context
+        ).data
+
+
+class AgendaQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the agenda: filters of the standalone tasks and the
+    'tasks_cursor' of the previous page.
+    """
+
+    stat = serializers.ChoiceField(choices=PlayerStats.StatType.choices, required=False)
+    rank = serializers.ChoiceField(choices=Task.Rank.choices, required=False)
+    cursor = serializers.CharField(required=False)
+
+    def validate_cursor(self, value):
+        if decode_task_cursor(value) is None:
+            raise serializers.ValidationError("Invalid cursor.")
+        return value
+
+
+class AgendaSerializer(SparseFieldsetMixin, serializers.Serializer):
+    date = serializers.DateField()
+    routines = AgendaTaskSerializer(many=True)
+    tasks = AgendaTaskSerializer(many=True)
+    tasks_cursor = serializers.CharField(
+        allow_null=True, help_text="Cursor of the next page of tasks (null: last page)"
+    )
+
+
+# --- History ---
+class TaskLogSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    A completion, or a completed day of a compacted month ('summarized'):
+    no id, 'completed_at' at the start of the day and no reward.
+    """
+
+    task_title = serializers.CharField(source="task.title")
+    xp_earned = serializers.IntegerField(allow_null=True)
+    xp_distribution = serializers.SerializerMethodField()
+    summarized = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TaskLog
+        fields = [
+            "id",
+            "task",
+            "task_title",
+            "completed_at",
+            "xp_earned",
+            "xp_distribution",
+            "summarized",
+        ]
+
+    def get_xp_distribution(self, log) -> dict[str, int] | None:
+        return None if log.pk is None else log.xp_distribution
+
+    def get_summarized(self, log) -> bool:
+        return log.pk is None
+
+
+# --- Completion Charts ---
+class CompletionSeriesQuerySerializer(serializers.Serializer):
+    """
+    Query parameters of the completion chart endpoint.
+    'start' defaults to 30 days, 12 months or 5 years before 'end' (today).
+    """
+
+    bucket = serializers.ChoiceField(choices=SERIES_BUCKETS, default="day")
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        end = attrs.setdefault("end", timezone.localdate())
+        if "start" not in attrs:
+            if attrs["bucket"] == "day":
+                attrs["start"] = end - timedelta(days=29)
+            elif attrs["bucket"] == "month":
+                attrs["start"] = end.replace(year=end.year - 1, day=1)
+            else:
+                attrs["start"] = end.replace(year=end.year - 4, month=1, day=1)
+        if attrs["start"] > end:
+            raise serializers.ValidationError("'start' must not be after 'end'.")
+        return attrs
+
+
+class CompletionPeriodSerializer(serializers.Serializer):
+    period = serializers.DateField(help_text="First day of the period")
+    completions = serializers.IntegerField()
+    habit_completions = serializers.IntegerField()
+    habits_due = serializers.IntegerField()
+    xp = serializers.IntegerField()
+    str_xp = serializers.IntegerField()
+    int_xp = serializers.IntegerField()
+    cha_xp = serializers.IntegerField()
+    wil_xp = serializers.IntegerField()
+    wis_xp = serializers.IntegerField()
+
+
+class CompletionSeriesSerializer(SparseFieldsetMixin, serializers.Serializer):
+    bucket = serializers.CharField()
+    start = serializers.DateField()
+    end = serializers.DateField()
+    series = CompletionPeriodSerializer(many=True)
+
+
+# --- Export ---
+class ExportQuerySerializer(serializers.Serializer):
+    """Query parameters of the export endpoint."""
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    gzip = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if attrs.get("start") and attrs.get("end") and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError("'start' must not be after 'end'.")
+        return attrs
+
+
+# --- Journal Search ---
+class JournalSearchQuerySerializer(serializers.Serializer):
+    """Query parameters of the journal search endpoint."""
+
+    q = serializers.CharField(max_length=200, help_text="Words, \"phrases\", or, -word")
+    cursor = serializers.CharField(required=False)
+
+
+class JournalSearchResultSerializer(serializers.ModelSerializer):
+    rank = serializers.FloatField()
+    headline = serializers.CharField(help_text="HTML, matches wrapped in <mark>")
+
+    class Meta:
+        model = DailyEntry
+        fields = ["id", "date", "event", "rating", "emoji", "rank", "headline"]
+
+
+# --- Journal Highlights ---
+class HighlightRowSerializer(serializers.Serializer):
+    id = serializers.IntegerField(
+        required=False, allow_null=True, help_text="Omit (or null) for a new row"
+    )
+    content = serializers.CharField(max_length=255, allow_blank=True)
+
+
+class JournalHighlightsSerializer(serializers.Serializer):
+    """The full, ordered highlight lists of a day (missing rows are deleted)."""
+
+    date = serializers.DateField()
+    positive = HighlightRowSerializer(many=True, max_length=MAX_HIGHLIGHTS)
+    negative = HighlightRowSerializer(many=True, max_length=MAX_HIGHLIGHTS)
+
+
+class JournalHighlightIdsSerializer(serializers.Serializer):
+    """The ids of the saved highlights, in the submitted order."""
+
+    date = serializers.DateField()
+    positive = serializers.ListField(child=serializers.IntegerField())
+    negative = serializers.ListField(child=serializers.IntegerField())
+
+
+# --- Reordering ---
+class MoveSerializer(serializers.Serializer):
+    """Where to put the row (drag and drop)."""
+
+    after = serializers.IntegerField(
+        allow_null=True, help_text="Id of the sibling now above the row; null: first"
+    )
+
+
+class MoveResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    order = serializers.IntegerField()
+    rebalanced = serializers.BooleanField(
+        help_text="The siblings had no room left and were renumbered"
+    )
@@ -0,0 +1,53 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.tasks.models import Task
+from apps.tasks.services import completion
+from apps.tasks.tests.utils import make_player, plain_static
+
+
+@plain_static
+class PlayerETagTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.client.force_login(self.profile.user)
+
+    def assert_conditional(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        cached = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b"")
+
+        # Completing a task changes the player's data: full response again
+        completion.complete(Task.objects.create(profile=self.profile, title="Run"))
+        fresh = self.client.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(fresh.status_code, 200)
+        self.assertNotEqual(fresh["ETag"], etag)
+
+    def test_api_endpoints(self):
+        for name in ["player", "agenda", "calendar", "habit_grid"]:
+            with self.subTest(name):
+                self.assert_conditional(reverse(f"api:{name}"))
+
+    def test_gate_page(self):
+        url = reverse("gate:gate")
+        # The page's ETag includes the CSRF secret: set by the first visit
+        self.client.get(url)
+        self.assert_conditional(url)
+
+    def test_writes_are_not_conditional(self):
+        url = reverse("api:journal_highlights")
+        etag = self.client.get(reverse("api:player"))["ETag"]
+
+        response = self.client.put(
+            url,
+            {"date": "2025-01-01", "positive": [], "negative": []},
+            content_type="application/json",
+            headers={"If-None-Match": etag},
+        )
+
+        self.assertEqual(response.status_code, 200)
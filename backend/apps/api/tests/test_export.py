@@ -0,0 +1,86 @@
+import json
+from datetime import date, datetime
+from unittest import mock
+
+from django.test import AsyncClient, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.gate.services.export import stream_export
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.compaction import compact_logs
+from apps.tasks.tests.utils import make_player
+
+
+@mock.patch("apps.gate.services.export.EXPORT_CHUNK_SIZE", 2)
+class ExportStreamTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        task = Task.objects.create(profile=self.profile, title="Run")
+        completion.complete_many([task] * 5)
+        self.url = reverse("api:export", args=["logs", "jsonl"])
+
+    def read_lines(self, content):
+        return [json.loads(line) for line in content.decode().splitlines()]
+
+    def test_wsgi_streams_a_sync_iterator(self):
+        self.client.force_login(self.profile.user)
+
+        response = self.client.get(self.url)
+
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.is_async)
+        chunks = list(response.streaming_content)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(len(self.read_lines(b"".join(chunks))), 5)
+
+    async def test_asgi_streams_an_async_iterator(self):
+        client = AsyncClient()
+        await client.aforce_login(self.profile.user)
+
+        response = await client.get(self.url)
+
+        # Django sends async iterators chunk by chunk instead of list()-ing them
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        self.assertEqual(len(chunks), 3)
+        rows = self.read_lines(b"".join(chunks))
+        self.assertEqual([row["task"] for row in rows], ["Run"] * 5)
+
+
+class LogsExportTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        task = Task.objects.create(profile=self.profile, title="Run", manual_rank="E")
+        completion.save_completions(
+            [
+                TaskLog(task=task, completed_at=timezone.make_aware(when))
+                for when in [
+                    datetime(2024, 8, 3, 8),
+                    datetime(2024, 8, 3, 9),
+                    datetime(2024, 8, 4, 8),
+                    datetime(2025, 1, 5, 8),
+                ]
+            ]
+        )
+        compact_logs(date(2024, 9, 1))
+
+    def export(self, **dates):
+        content = b"".join(stream_export("logs", "jsonl", self.profile.user, **dates))
+        return [json.loads(line) for line in content.decode().splitlines()]
+
+    def test_compacted_days_are_exported_as_summarized_rows(self):
+        rows = self.export()
+
+        self.assertEqual(
+            [(row["completed_at"][:10], row["summarized"]) for row in rows],
+            [("2024-08-03", True), ("2024-08-04", True), ("2025-01-05", False)],
+        )
+        self.assertEqual((rows[0]["id"], rows[0]["xp_earned"]), (None, None))
+        self.assertEqual(rows[2]["xp_earned"], 15)
+
+    def test_date_range_applies_to_compacted_days(self):
+        rows = self.export(start=date(2024, 8, 4), end=date(2024, 8, 31))
+
+        self.assertEqual([row["completed_at"][:10] for row in rows], ["2024-08-04"])
@@ -0,0 +1,45 @@
+from datetime import date, datetime
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.compaction import compact_logs
+from apps.tasks.tests.utils import make_player
+
+
+class HistoryAPITests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        task = Task.objects.create(profile=self.profile, title="Read", manual_rank="E")
+        completion.save_completions(
+            [
+                TaskLog(task=task, completed_at=timezone.make_aware(when))
+                for when in [
+                    datetime(2024, 8, 3, 8),
+                    datetime(2024, 8, 4, 8),
+                    datetime(2025, 1, 5, 8),
+                ]
+            ]
+        )
+        compact_logs(date(2024, 9, 1))
+        self.client.force_login(self.profile.user)
+
+    def test_compacted_days_are_listed_as_summarized(self):
+        first = self.client.get(reverse("api:history"), {"page_size": 2}).json()
+        last = self.client.get(first["next"]).json()
+
+        self.assertIsNone(last["next"])
+        rows = first["results"] + last["results"]
+        self.assertEqual(
+            [(row["summarized"], row["xp_earned"]) for row in rows],
+            [(False, 15), (True, None), (True, None)],
+        )
+        self.assertEqual(
+            [row["completed_at"][:10] for row in rows],
+            ["2025-01-05", "2024-08-04", "2024-08-03"],
+        )
+        self.assertEqual(rows[1]["task_title"], "Read")
+        self.assertIsNone(rows[1]["id"])
@@ -0,0 +1,44 @@
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.tasks.models import Task
+from apps.tasks.tests.utils import make_player
+
+
+class TaskMoveTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.routine = Task.objects.create(profile=self.profile, title="Morning")
+        self.steps = [
+            Task.objects.create(profile=self.profile, parent=self.routine, title=title)
+            for title in ["Wake", "Stretch", "Shower"]
+        ]
+        self.client.force_login(self.profile.user)
+
+    def move(self, task, after):
+        return self.client.post(
+            reverse("api:task_move", args=[task.pk]),
+            {"after": after and after.pk},
+            content_type="application/json",
+        )
+
+    def test_moves_only_the_row(self):
+        wake, stretch, shower = self.steps
+
+        response = self.move(shower, wake)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()["rebalanced"])
+        self.assertQuerySetEqual(
+            self.routine.subtasks.order_by("order"), [wake, shower, stretch]
+        )
+        stretch.refresh_from_db()
+        self.assertEqual(stretch.order, self.steps[1].order)
+
+    def test_other_players_rows_are_not_found(self):
+        other = make_player("other")
+        self.client.force_login(other.user)
+
+        response = self.move(self.steps[2], None)
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+from django.test import SimpleTestCase
+
+SLIM_IMPORTS = """
+import sys
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(",".join(sorted(m for m in sys.modules if m.startswith("drf_spectacular"))))
+"""
+
+
+class SlimProfileTests(SimpleTestCase):
+    def test_api_views_load_without_drf_spectacular(self):
+        result = subprocess.run(
+            [sys.executable, "-c", SLIM_IMPORTS],
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "core.settings.web"},
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
@@ -0,0 +1,60 @@
+from django.apps import apps
+from django.urls import path, re_path
+
+from apps.api import views
+from apps.gate.services.export import EXPORT_DATASETS, EXPORT_FORMATS
+
+app_name = "api"
+
+urlpatterns = [
+    # Read-only player data
+    path("v1/player/", views.PlayerView.as_view(), name="player"),
+    path("v1/habits/grid/", views.HabitGridView.as_view(), name="habit_grid"),
+    path(
+        "v1/habits/heatmap/", views.HabitHeatmapView.as_view(), name="habit_heatmap"
+    ),
+    path("v1/calendar/", views.CalendarView.as_view(), name="calendar"),
+    path("v1/agenda/", views.AgendaView.as_view(), name="agenda"),
+    path("v1/history/", views.HistoryView.as_view(), name="history"),
+    path(
+        "v1/charts/completions/",
+        views.CompletionSeriesView.as_view(),
+        name="completion_series",
+    ),
+    path(
+        "v1/journal/search/",
+        views.JournalSearchView.as_view(),
+        name="journal_search",
+    ),
+    # Writes
+    path(
+        "v1/journal/highlights/",
+        views.JournalHighlightsView.as_view(),
+        name="journal_highlights",
+    ),
+    path(
+        "v1/journal/highlights/<int:pk>/move/",
+        views.HighlightMoveView.as_view(),
+        name="highlight_move",
+    ),
+    path("v1/tasks/<int:pk>/move/", views.TaskMoveView.as_view(), name="task_move"),
+    # Downloads (e.g. v1/export/logs.csv?start=2025-01-01&gzip=true)
+    re_path(
+        r"^v1/export/(?P<dataset>{})\.(?P<file_format>{})$".format(
+            "|".join(EXPORT_DATASETS), "|".join(EXPORT_FORMATS)
+        ),
+        views.ExportView.as_view(),
+        name="export",
+    ),
+]
+
+# Schema & Docs (not installed in the slim web profile)
+if apps.is_installed("drf_spectacular"):
+    from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
+
+    urlpatterns += [
+        path("schema/", SpectacularAPIView.as_view(), name="schema"),
+        path(
+            "docs/", SpectacularSwaggerView.as_view(url_name="api:schema"), name="docs"
+        ),
+    ]
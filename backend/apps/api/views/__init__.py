@@ -0,0 +1,28 @@
+from .dashboard import (
+    AgendaView,
+    CalendarView,
+    CompletionSeriesView,
+    HabitGridView,
+    HabitHeatmapView,
+    PlayerView,
+)
+from .export import ExportView
+from .history import HistoryView
+from .journal import JournalHighlightsView
+from .ordering import HighlightMoveView, TaskMoveView
+from .search import JournalSearchView
+
+__all__ = [
+    "AgendaView",
+    "CalendarView",
+    "CompletionSeriesView",
+    "HabitGridView",
+    "HabitHeatmapView",
+    "PlayerView",
+    "ExportView",
+    "HistoryView",
+    "JournalHighlightsView",
+    "HighlightMoveView",
+    "TaskMoveView",
+    "JournalSearchView",
+]
@@ -0,0 +1,156 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.api.mixins import PlayerETagMixin
+from apps.api.schema import OpenApiParameter, extend_schema
+from apps.api.serializers import (
+    AgendaQuerySerializer,
+    AgendaSerializer,
+    CalendarSerializer,
+    CompletionSeriesQuerySerializer,
+    CompletionSeriesSerializer,
+    HabitGridSerializer,
+    HabitHeatmapQuerySerializer,
+    HabitHeatmapSerializer,
+    PlayerSerializer,
+)
+from apps.gate.services import calendar as calendar_service
+from apps.gate.services import gate as gate_service
+from apps.gate.services import index as index_service
+from apps.tasks.services.heatmap import get_year_heatmap
+from apps.tasks.services.rollup import get_completion_series
+
+FIELDS_PARAMETER = OpenApiParameter(
+    "fields", str, description="Comma-separated list of fields to return."
+)
+
+
+class PlayerDataView(PlayerETagMixin, APIView):
+    """
+    Base for the read-only endpoints built on the dashboard services.
+    Subclasses set 'serializer_class' and define get_data(request),
+    the object it serializes.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.serializer_class is None or not callable(getattr(cls, "get_data", None)):
+            raise ImproperlyConfigured(
+                f"{cls.__name__} must set 'serializer_class' and define get_data()."
+            )
+
+    def get_serializer_context(self, data):
+        return {"request": self.request}
+
+    def get(self, request, *args, **kwargs):
+        data = self.get_data(request)
+        serializer = self.serializer_class(
+            data, context=self.get_serializer_context(data)
+        )
+        return Response(serializer.data)
+
+
+@extend_schema(parameters=[FIELDS_PARAMETER])
+class PlayerView(PlayerDataView):
+    """Profile, level progress, stats and affinity."""
+
+    serializer_class = PlayerSerializer
+
+    def get_data(self, request):
+        return request.player
+
+
+@extend_schema(parameters=[FIELDS_PARAMETER])
+class HabitGridView(PlayerDataView):
+    """Habit completion grid and daily counts for the current Jalali month."""
+
+    serializer_class = HabitGridSerializer
+
+    def get_data(self, request):
+        month_info = calendar_service.get_current_month_info()
+        habit_context = index_service.get_habit_grid_context(
+            request.user, request.player, month_info
+        )
+        return {
+            "month": month_info["j_today"].strftime("%B %Y"),
+            "month_days": month_info["month_days"],
+            **habit_context,
+        }
+
+
+@extend_schema(parameters=[HabitHeatmapQuerySerializer, FIELDS_PARAMETER])
+class HabitHeatmapView(PlayerDataView):
+    """Year-at-a-glance: one completion bitmap per active habit for a Jalali year."""
+
+    serializer_class = HabitHeatmapSerializer
+
+    def get_data(self, request):
+        query = HabitHeatmapQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return get_year_heatmap(request.player, query.validated_data.get("year"))
+
+
+@extend_schema(parameters=[FIELDS_PARAMETER])
+class CalendarView(PlayerDataView):
+    """Jalali calendar of the current month with the days that have an entry."""
+
+    serializer_class = CalendarSerializer
+
+    def get_data(self, request):
+        calendar_data = calendar_service.get_jalali_calendar_context(request.user)
+        return {
+            **calendar_data,
+            "today": calendar_data["j_today"].strftime("%Y-%m-%d"),
+        }
+
+
+@extend_schema(parameters=[AgendaQuerySerializer, FIELDS_PARAMETER])
+class AgendaView(PlayerDataView):
+    """
+    Today's routines and standalone tasks, with their completion status.
+    The standalone tasks come one page at a time: pass 'tasks_cursor' back
+    as 'cursor' for the next one.
+    """
+
+    serializer_class = AgendaSerializer
+
+    def get_data(self, request):
+        query = AgendaQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        today = timezone.now().date()
+        tasks_context = gate_service.get_tasks_context(
+            request.player, today, **query.validated_data
+        )
+        return {"date": today, **tasks_context}
+
+    def get_serializer_context(self, data):
+        context = super().get_serializer_context(data)
+        context["completed_task_ids"] = data["completed_task_ids"]
+        return context
+
+
+@extend_schema(parameters=[CompletionSeriesQuerySerializer, FIELDS_PARAMETER])
+class CompletionSeriesView(PlayerDataView):
+    """
+    Completions, habits done vs due and XP per stat, by day, month or year.
+    Read from the daily rollups: one row per day, whatever the range.
+    """
+
+    serializer_class = CompletionSeriesSerializer
+
+    def get_data(self, request):
+        query = CompletionSeriesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        options = query.validated_data
+        return {
+            **options,
+            "series": get_completion_series(
+                request.player, options["start"], options["end"], options["bucket"]
+            ),
+        }
@@ -0,0 +1,77 @@
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from apps.api.schema import OpenApiTypes, extend_schema
+from apps.api.serializers import ExportQuerySerializer
+from apps.gate.services.export import get_export_filename, stream_export
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/x-ndjson; charset=utf-8",
+}
+
+
+class ExportView(APIView):
+    """
+    Downloads the player's history (logs, entries or highlights) as CSV or JSONL.
+    Streamed in chunks, so memory stays flat whatever the size of the history.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def perform_content_negotiation(self, request, force=False):
+        # The body is a file, not a rendered Response: any Accept header is fine
+        return super().perform_content_negotiation(request, force=True)
+
+    @extend_schema(
+        operation_id="v1_export_retrieve",
+        parameters=[ExportQuerySerializer],
+        responses={(200, "application/octet-stream"): OpenApiTypes.BINARY},
+    )
+    def get(self, request, dataset, file_format):
+        query = ExportQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        options = query.validated_data
+
+        chunks = stream_export(
+            dataset,
+            file_format,
+            request.user,
+            start=options.get("start"),
+            end=options.get("end"),
+            gzip=options["gzip"],
+        )
+        response = StreamingHttpResponse(
+            get_streaming_content(request, chunks),
+            content_type=(
+                "application/gzip" if options["gzip"] else CONTENT_TYPES[file_format]
+            ),
+        )
+        filename = get_export_filename(dataset, file_format, gzip=options["gzip"])
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["Cache-Control"] = "private, no-store"
+        return response
+
+
+def get_streaming_content(request, chunks):
+    """
+    Under ASGI (SERVER_INTERFACE=asgi), Django reads a sync iterator into a list
+    before sending it: the export gets an async iterator there instead.
+    """
+    if isinstance(request._request, ASGIRequest):
+        return aiter_chunks(chunks)
+    return chunks
+
+
+async def aiter_chunks(chunks):
+    """
+    Pulls one chunk at a time from a sync iterator. Thread-sensitive, so the
+    queries run in the same thread (and connection) as the rest of the request.
+    """
+    chunks = iter(chunks)
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
@@ -0,0 +1,29 @@
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAuthenticated
+
+from apps.api.mixins import PlayerETagMixin
+from apps.api.pagination import HistoryCursorPagination
+from apps.api.schema import extend_schema
+from apps.api.serializers import TaskLogSerializer
+from apps.api.views.dashboard import FIELDS_PARAMETER
+from apps.tasks.models import MonthlyTaskSummary, TaskLog
+
+
+@extend_schema(parameters=[FIELDS_PARAMETER])
+class HistoryView(PlayerETagMixin, ListAPIView):
+    """
+    Completion history, newest first (cursor paginated). The completed days of
+    the compacted months follow the raw logs, marked 'summarized'.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = TaskLogSerializer
+    pagination_class = HistoryCursorPagination
+
+    def get_queryset(self):
+        return TaskLog.objects.filter(profile=self.request.player).select_related(
+            "task"
+        )
+
+    def get_summaries(self):
+        return MonthlyTaskSummary.objects.filter(profile=self.request.player)
@@ -0,0 +1,47 @@
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.api.schema import extend_schema
+from apps.api.serializers import (
+    JournalHighlightIdsSerializer,
+    JournalHighlightsSerializer,
+)
+from apps.gate.models import DailyHighlight
+from apps.gate.services.highlights import save_highlights
+
+CATEGORIES = {
+    "positive": DailyHighlight.Category.POSITIVE,
+    "negative": DailyHighlight.Category.NEGATIVE,
+}
+
+
+class JournalHighlightsView(APIView):
+    """
+    Saves all the highlights of a day at once: the submitted ordered lists
+    replace the stored ones (created, updated and deleted in bulk).
+    Returns the ids of the rows, so new ones can be updated next time.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=JournalHighlightsSerializer,
+        responses=JournalHighlightIdsSerializer,
+    )
+    def put(self, request):
+        serializer = JournalHighlightsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        ids = save_highlights(
+            request.user,
+            data["date"],
+            {category: data[key] for key, category in CATEGORIES.items()},
+        )
+        return Response(
+            {
+                "date": data["date"],
+                **{key: ids[category] for key, category in CATEGORIES.items()},
+            }
+        )
@@ -0,0 +1,79 @@
+from django.core.exceptions import ImproperlyConfigured
+from django.shortcuts import get_object_or_404
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.api.schema import extend_schema
+from apps.api.serializers import MoveResultSerializer, MoveSerializer
+from apps.gate.models import DailyHighlight
+from apps.profiles.services.player import bump_data_version
+from apps.tasks.models import Task
+from apps.tasks.ordering import move_after
+
+
+class MoveView(APIView):
+    """
+    Moves one row after a sibling (drag and drop). Only the moved row is
+    written, unless its neighbours have no room left between their keys.
+    Subclasses set 'model' (with a get_siblings() method) and 'owner_lookup',
+    the path from a row to its User.
+    """
+
+    permission_classes = [IsAuthenticated]
+    model = None
+    owner_lookup = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.model is None or cls.owner_lookup is None:
+            raise ImproperlyConfigured(
+                f"{cls.__name__} must set 'model' and 'owner_lookup'."
+            )
+
+    def get_object(self, pk):
+        return get_object_or_404(
+            self.model, pk=pk, **{self.owner_lookup: self.request.user}
+        )
+
+    def changed(self, obj):
+        """Invalidates what shows the order (page ETags)."""
+        bump_data_version(user_id=self.request.user.pk)
+
+    @extend_schema(request=MoveSerializer, responses=MoveResultSerializer)
+    def post(self, request, pk):
+        serializer = MoveSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        obj = self.get_object(pk)
+        siblings = obj.get_siblings()
+        after = None
+        if serializer.validated_data["after"] is not None:
+            after = (
+                siblings.exclude(pk=obj.pk)
+                .filter(pk=serializer.validated_data["after"])
+                .first()
+            )
+            if after is None:
+                raise serializers.ValidationError(
+                    {"after": ["Not a sibling of this row."]}
+                )
+
+        rebalanced = move_after(obj, siblings, after)
+        self.changed(obj)
+        return Response({"id": obj.pk, "order": obj.order, "rebalanced": rebalanced})
+
+
+class TaskMoveView(MoveView):
+    """Reorders a subtask within its routine (or a task within the top level)."""
+
+    model = Task
+    owner_lookup = "profile__user"
+
+
+class HighlightMoveView(MoveView):
+    """Reorders a highlight within its day and category."""
+
+    model = DailyHighlight
+    owner_lookup = "entry__user"
@@ -0,0 +1,53 @@
+from rest_framework import serializers
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from apps.api.schema import extend_schema, inline_serializer
+from apps.api.serializers import (
+    JournalSearchQuerySerializer,
+    JournalSearchResultSerializer,
+)
+from apps.gate.services.search import search_entries
+
+
+class JournalSearchView(APIView):
+    """
+    Full-text search over the Daily Entries and their highlights,
+    best matches first, with a snippet of each (cursor paginated).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        parameters=[JournalSearchQuerySerializer],
+        responses=inline_serializer(
+            "JournalSearchPage",
+            {
+                "next": serializers.URLField(allow_null=True),
+                "results": JournalSearchResultSerializer(many=True),
+            },
+        ),
+    )
+    def get(self, request):
+        query = JournalSearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        entries, next_cursor = search_entries(
+            request.user,
+            query.validated_data["q"],
+            cursor=query.validated_data.get("cursor"),
+        )
+
+        next_url = None
+        if next_cursor:
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "cursor", next_cursor
+            )
+        return Response(
+            {
+                "next": next_url,
+                "results": JournalSearchResultSerializer(entries, many=True).data,
+            }
+        )
@@ -1,7 +1,6 @@
 from django import forms
-from django.forms import HiddenInput, TextInput, inlineformset_factory
 
-from apps.gate.models import DailyEntry, DailyHighlight
+from apps.gate.models import DailyEntry
 
 # Create explicit choices for the Score (1-10)
 RATING_CHOICES = [(i, str(i)) for i in range(1, 11)]
@@ -79,33 +78,3 @@ class DailyEntryForm(forms.ModelForm):
                 }
             ),
         }
-
-
-# Base widget config for the highlight rows
-HighlightWidget = TextInput(
-    attrs={
-        "class": "form-control bg-dark text-white border-secondary",
-        "placeholder": "Write here...",
-        "autocomplete": "off",
-    }
-)
-
-# Factory for Positives
-PositiveHighlightFormSet = inlineformset_factory(
-    DailyEntry,
-    DailyHighlight,
-    fields=["content", "category"],
-    widgets={"content": HighlightWidget, "category": HiddenInput()},
-    extra=0,
-    can_delete=True,
-)
-
-# Factory for Negatives
-NegativeHighlightFormSet = inlineformset_factory(
-    DailyEntry,
-    DailyHighlight,
-    fields=["content", "category"],
-    widgets={"content": HighlightWidget, "category": HiddenInput()},
-    extra=0,
-    can_delete=True,
-)
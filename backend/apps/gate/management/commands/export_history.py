@@ -0,0 +1,72 @@
+import sys
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.gate.services.export import EXPORT_DATASETS, EXPORT_FORMATS, stream_export
+
+
+def parse_date(value, option):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise CommandError(f"Invalid {option} date, expected YYYY-MM-DD.")
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports a user's history (task logs, day pages or highlights) as CSV or JSONL. "
+        "Rows are streamed, so memory stays flat whatever the size of the history."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Owner of the history.")
+        parser.add_argument(
+            "--dataset", choices=list(EXPORT_DATASETS), default="logs"
+        )
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+        parser.add_argument("--start", help="First day (YYYY-MM-DD), inclusive.")
+        parser.add_argument("--end", help="Last day (YYYY-MM-DD), inclusive.")
+        parser.add_argument(
+            "--gzip", action="store_true", help="Compress the output (needs --output)."
+        )
+        parser.add_argument(
+            "--output", help="File to write to. Defaults to the standard output."
+        )
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"User '{options['username']}' does not exist.")
+
+        start = parse_date(options["start"], "--start") if options["start"] else None
+        end = parse_date(options["end"], "--end") if options["end"] else None
+        if start and end and start > end:
+            raise CommandError("--start must not be after --end.")
+        if options["gzip"] and not options["output"]:
+            raise CommandError("--gzip needs --output.")
+
+        chunks = stream_export(
+            options["dataset"],
+            options["format"],
+            user,
+            start=start,
+            end=end,
+            gzip=options["gzip"],
+        )
+
+        if not options["output"]:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.flush()
+            return
+
+        written = 0
+        with open(options["output"], "wb") as output:
+            for chunk in chunks:
+                output.write(chunk)
+                written += len(chunk)
+        self.stderr.write(
+            self.style.SUCCESS(f"Wrote {written} bytes to {options['output']}.")
+        )
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:11
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+# Same weights as apps.gate.services.search.SEARCH_WEIGHTS
+WEIGHTED_FIELDS = [
+    ("e.event", "A"),
+    ("e.lesson_of_day", "A"),
+    ("(SELECT string_agg(h.content, ' ') FROM gate_dailyhighlight AS h WHERE h.entry_id = e.id)", "A"),
+    ("e.diary", "B"),
+    ("e.quote", "C"),
+    ("e.notes_tomorrow", "C"),
+    ("e.financial_notes", "C"),
+]
+
+BACKFILL_SQL = (
+    "UPDATE gate_dailyentry AS e SET search_vector = "
+    + " || ".join(
+        f"setweight(to_tsvector('simple', COALESCE({column}, '')), '{weight}')"
+        for column, weight in WEIGHTED_FIELDS
+    )
+    + ";"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gate', '0004_remove_dailyentry_negatives_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailyentry',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        # Existing entries (new writes are indexed by apps.gate.signals)
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='dailyentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='dailyentry_search_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:30
+
+from django.db import migrations
+
+# Spreads the existing keys 1024 apart (apps.tasks.ordering.ORDER_GAP),
+# keeping the displayed order (creation order for equal keys)
+RENUMBER_SQL = """
+UPDATE gate_dailyhighlight AS h SET "order" = ranked.position * 1024
+FROM (
+    SELECT id, row_number() OVER (
+        PARTITION BY entry_id, category ORDER BY "order", created_at, id
+    ) AS position
+    FROM gate_dailyhighlight
+) AS ranked
+WHERE h.id = ranked.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('gate', '0005_dailyentry_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='dailyhighlight',
+            options={'ordering': ['order', 'created_at']},
+        ),
+        migrations.RunSQL(RENUMBER_SQL, migrations.RunSQL.noop),
+    ]
@@ -1,4 +1,6 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils import timezone
@@ -81,6 +83,10 @@ class DailyEntry(models.Model):
         help_text=_("e.g., 😎, 😴, 🚀"),
     )
 
+    # --- Search ---
+    # Text fields + highlights, kept in sync by apps.gate.signals
+    search_vector = SearchVectorField(null=True, editable=False)
+
     # --- Timestamps ---
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -91,6 +97,9 @@ class DailyEntry(models.Model):
         ordering = ["-date"]  # Newest days first
         # Crucial: A user creates only ONE log per specific date
         unique_together = ["user", "date"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="dailyentry_search_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user.username} | {self.date}"
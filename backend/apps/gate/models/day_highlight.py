@@ -14,8 +14,15 @@ class DailyHighlight(models.Model):
     )
     content = models.CharField(_("Highlight"), max_length=255, blank=True)
     category = models.CharField(_("Category"), max_length=3, choices=Category.choices)
+    # Gap-based keys within the entry and category, see apps.tasks.ordering
     order = models.PositiveIntegerField(_("Order"), default=0)
     created_at = models.DateTimeField(_("Created at"), auto_now_add=True)
 
     class Meta:
-        ordering = ["created_at"]
+        ordering = ["order", "created_at"]
+
+    def get_siblings(self):
+        """The highlights ordered with this one: same entry and category."""
+        return DailyHighlight.objects.filter(
+            entry_id=self.entry_id, category=self.category
+        )
@@ -0,0 +1,91 @@
+import gzip
+import hashlib
+from functools import lru_cache
+
+from django.conf import settings
+
+EMOJI_DATA_PATH = settings.BASE_DIR / "static" / "vendor" / "emoji-picker" / "data.json"
+
+# Compressed encodings served (gzip only: the stdlib has no brotli)
+ENCODINGS = ["gzip"]
+
+
+@lru_cache(maxsize=1)
+def get_emoji_dataset():
+    """
+    Loads the emoji dataset once per process.
+    Returns {"etag": sha256 of the JSON, "variants": {encoding: bytes}}.
+    The gzip variant comes from the file written by update_vendor.py
+    (data.json.gz) and is only computed here if missing or stale.
+    Raises FileNotFoundError if the dataset isn't installed.
+    """
+    identity = EMOJI_DATA_PATH.read_bytes()
+    variants = {"identity": identity}
+
+    gzipped = _read_variant(".gz", gzip.decompress, identity)
+    variants["gzip"] = gzipped or gzip.compress(identity, compresslevel=9, mtime=0)
+
+    return {"etag": hashlib.sha256(identity).hexdigest(), "variants": variants}
+
+
+def _read_variant(suffix, decompress, identity):
+    """Pre-compressed file next to data.json, if it matches the current data."""
+    path = EMOJI_DATA_PATH.with_name(EMOJI_DATA_PATH.name + suffix)
+    try:
+        content = path.read_bytes()
+        return content if decompress(content) == identity else None
+    except Exception:  # Missing, unreadable or corrupt file
+        return None
+
+
+def negotiate_encoding(accept_encoding, available):
+    """
+    Picks the best encoding allowed by an Accept-Encoding header.
+    Returns 'identity' if no compressed variant is acceptable.
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    for encoding in ENCODINGS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if encoding in available and quality > 0:
+            return encoding
+    return "identity"
+
+
+def parse_range(range_header, length):
+    """
+    Parses a single 'bytes=start-end' range.
+    Returns (start, end) inclusive, None to ignore the header (serve everything),
+    or False if the range can't be satisfied.
+    Multiple ranges are ignored (allowed by RFC 9110).
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    start, _, end = spec.strip().partition("-")
+    try:
+        if start:
+            start = int(start)
+            end = int(end) if end else length - 1
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(end)
+            if suffix == 0:
+                return False
+            start, end = max(length - suffix, 0), length - 1
+    except ValueError:
+        return None
+
+    if start >= length or start > end:
+        return False
+    return start, min(end, length - 1)
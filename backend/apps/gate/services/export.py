@@ -0,0 +1,289 @@
+import csv
+import heapq
+import io
+import json
+from datetime import date, datetime, time, timedelta
+from itertools import groupby
+from operator import itemgetter
+
+from django.db.models import Count, DateField, Sum, Value
+from django.db.models.functions import TruncDate, TruncMonth
+from django.utils import timezone
+from django.utils.text import compress_sequence
+
+from apps.gate.models import DailyEntry, DailyHighlight
+from apps.tasks.models import MonthlyTaskSummary, TaskLog
+from apps.tasks.services.compaction import iter_compacted_days
+from apps.tasks.services.partitions import next_month, start_of_day
+
+# Rows fetched per round trip (server-side cursor) and written per chunk
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = ["csv", "jsonl"]
+
+# Dataset -> (model, {column: ORM path}, ordering, date filter)
+# The date filter is the field compared to the requested date range.
+EXPORT_DATASETS = {
+    "logs": (
+        TaskLog,
+        {
+            "id": "id",
+            "task_id": "task_id",
+            "task": "task__title",
+            "completed_at": "completed_at",
+            "xp_earned": "xp_earned",
+            "str_xp": "str_xp",
+            "int_xp": "int_xp",
+            "cha_xp": "cha_xp",
+            "wil_xp": "wil_xp",
+            "wis_xp": "wis_xp",
+            # Completed day of a compacted month: no id, time or reward
+            "summarized": "summarized",
+        },
+        ("completed_at", "id"),
+        "completed_at",
+    ),
+    # Per task and month, over the raw logs and the compacted months alike
+    "months": (
+        MonthlyTaskSummary,
+        {
+            "month": "month",
+            "task_id": "task_id",
+            "task": "task__title",
+            "completions": "completions",
+            "days": "days",
+            "xp_earned": "xp_earned",
+            "str_xp": "str_xp",
+            "int_xp": "int_xp",
+            "cha_xp": "cha_xp",
+            "wil_xp": "wil_xp",
+            "wis_xp": "wis_xp",
+        },
+        ("month", "task_id"),
+        "month",
+    ),
+    "entries": (
+        DailyEntry,
+        {
+            "id": "id",
+            "date": "date",
+            "event": "event",
+            "sleep_time": "sleep_time",
+            "wake_up_time": "wake_up_time",
+            "nap_duration": "nap_duration",
+            "quote": "quote",
+            "lesson_of_day": "lesson_of_day",
+            "diary": "diary",
+            "notes_tomorrow": "notes_tomorrow",
+            "financial_notes": "financial_notes",
+            "rating": "rating",
+            "emoji": "emoji",
+            "created_at": "created_at",
+            "updated_at": "updated_at",
+        },
+        ("date",),
+        "date",
+    ),
+    "highlights": (
+        DailyHighlight,
+        {
+            "id": "id",
+            "date": "entry__date",
+            "category": "category",
+            "content": "content",
+            "order": "order",
+            "created_at": "created_at",
+        },
+        ("entry__date", "order", "id"),
+        "entry__date",
+    ),
+}
+
+
+def get_export_rows(dataset, user, start=None, end=None):
+    """
+    Lazily yields the user's rows of 'dataset' as tuples (see get_export_columns).
+    'start'/'end' are inclusive dates. Rows are read through a server-side cursor,
+    EXPORT_CHUNK_SIZE at a time, so memory doesn't grow with the history.
+    """
+    model, columns, ordering, date_field = EXPORT_DATASETS[dataset]
+
+    if model is MonthlyTaskSummary:
+        return get_monthly_rows(user, start, end)
+    if model is TaskLog:
+        return get_log_rows(user, start, end)
+
+    owner = "user" if model is DailyEntry else "entry__user"
+    rows = model.objects.filter(**{owner: user})
+    if start:
+        rows = rows.filter(**{f"{date_field}__gte": start})
+    if end:
+        rows = rows.filter(**{f"{date_field}__lte": end})
+
+    return (
+        rows.order_by(*ordering)
+        .values_list(*columns.values())
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def get_log_rows(user, start=None, end=None):
+    """
+    Lazily yields the 'logs' rows: the logs, and one 'summarized' row per
+    completed day of the compacted months (at the start of the day, no reward),
+    merged in time order so compaction doesn't cut the export short.
+    """
+    columns = EXPORT_DATASETS["logs"][1]
+    logs = TaskLog.objects.filter(profile__user=user)
+    summaries = MonthlyTaskSummary.objects.filter(profile__user=user)
+    # Compare with the day boundaries: keeps the (profile, completed_at) index usable
+    if start:
+        logs = logs.filter(completed_at__gte=start_of_day(start))
+        summaries = summaries.filter(month__gte=start.replace(day=1))
+    if end:
+        logs = logs.filter(completed_at__lt=start_of_day(end + timedelta(days=1)))
+        summaries = summaries.filter(month__lte=end)
+
+    raw = (
+        logs.annotate(summarized=Value(False))
+        .order_by("completed_at", "id")
+        .values_list(*columns.values())
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    empty = [None] * len(MonthlyTaskSummary.COUNTER_FIELDS[1:])
+    compacted = (
+        (None, task_id, title, start_of_day(day), *empty, True)
+        for day, task_id, title in iter_compacted_days(
+            summaries, chunk_size=EXPORT_CHUNK_SIZE
+        )
+        if (not start or day >= start) and (not end or day <= end)
+    )
+    # On the same instant, the compacted day (00:00) comes first
+    return heapq.merge(compacted, raw, key=itemgetter(3))
+
+
+def get_monthly_rows(user, start=None, end=None):
+    """
+    Lazily yields the 'months' rows: the compacted months and the logs
+    grouped the same way (completions, completed days, XP), merged in
+    (month, task) order. Months overlapping 'start'/'end' are included whole.
+    """
+    summaries = MonthlyTaskSummary.objects.filter(profile__user=user)
+    logs = TaskLog.objects.filter(profile__user=user)
+    if start:
+        summaries = summaries.filter(month__gte=start.replace(day=1))
+        logs = logs.filter(completed_at__gte=start_of_day(start.replace(day=1)))
+    if end:
+        summaries = summaries.filter(month__lte=end)
+        logs = logs.filter(completed_at__lt=start_of_day(next_month(end)))
+
+    reward_fields = MonthlyTaskSummary.COUNTER_FIELDS[1:]
+    compacted = (
+        (month, task_id, title, completions, bit_count(days), *rewards)
+        for month, task_id, title, completions, days, *rewards in summaries.order_by(
+            "month", "task_id"
+        )
+        .values_list(*EXPORT_DATASETS["months"][1].values())
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    # Aliased: annotations can't reuse the names of the model's fields
+    raw = (
+        logs.order_by()
+        .annotate(log_month=TruncMonth("completed_at", output_field=DateField()))
+        .values("log_month", "task_id", "task__title")
+        .annotate(
+            log_count=Count("id"),
+            log_days=Count(TruncDate("completed_at"), distinct=True),
+            **{f"total_{field}": Sum(field) for field in reward_fields},
+        )
+        .order_by("log_month", "task_id")
+        .values_list(
+            "log_month",
+            "task_id",
+            "task__title",
+            "log_count",
+            "log_days",
+            *(f"total_{field}" for field in reward_fields),
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+    # A month imported after its compaction has rows on both sides: add them up
+    merged = heapq.merge(compacted, raw, key=lambda row: row[:2])
+    for _, rows in groupby(merged, key=lambda row: row[:2]):
+        rows = list(rows)
+        totals = [sum(values) for values in zip(*(row[3:] for row in rows))]
+        yield (*rows[0][:3], *totals)
+
+
+def bit_count(days):
+    return int.from_bytes(bytes(days), "little").bit_count()
+
+
+def get_export_columns(dataset):
+    return list(EXPORT_DATASETS[dataset][1])
+
+
+def iter_csv(columns, rows):
+    """Yields the CSV as UTF-8 chunks of EXPORT_CHUNK_SIZE rows (header first)."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(format_row(row))
+        if count % EXPORT_CHUNK_SIZE == 0:
+            yield _drain(buffer)
+    yield _drain(buffer)
+
+
+def iter_jsonl(columns, rows):
+    """Yields one JSON object per line, as UTF-8 chunks of EXPORT_CHUNK_SIZE rows."""
+    lines = []
+    for row in rows:
+        lines.append(
+            json.dumps(dict(zip(columns, format_row(row))), ensure_ascii=False)
+        )
+        if len(lines) == EXPORT_CHUNK_SIZE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def format_row(row):
+    return [format_value(value) for value in row]
+
+
+def format_value(value):
+    """Same text for both formats: ISO 8601 dates/times, datetimes in local time."""
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return value
+
+
+def _drain(buffer):
+    data = buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    return data
+
+
+def stream_export(dataset, file_format, user, start=None, end=None, gzip=False):
+    """
+    The export as an iterator of bytes chunks, ready for StreamingHttpResponse
+    or a file. 'gzip' compresses the stream on the fly.
+    """
+    columns = get_export_columns(dataset)
+    rows = get_export_rows(dataset, user, start, end)
+    render = iter_csv if file_format == "csv" else iter_jsonl
+
+    chunks = render(columns, rows)
+    return compress_sequence(chunks) if gzip else chunks
+
+
+def get_export_filename(dataset, file_format, gzip=False):
+    suffix = ".gz" if gzip else ""
+    return f"apex-{dataset}-{timezone.localdate():%Y-%m-%d}.{file_format}{suffix}"
@@ -1,18 +1,20 @@
-from datetime import datetime
+from datetime import UTC, datetime
 
 import jdatetime
-from django.db.models import Count
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
-from apps.gate.forms import (
-    DailyEntryForm,
-    NegativeHighlightFormSet,
-    PositiveHighlightFormSet,
-)
+from apps.gate.forms import DailyEntryForm
 from apps.gate.models import DailyEntry, DailyHighlight
+from apps.gate.services.highlights import get_highlights
+from apps.profiles.models import PlayerStats
 from apps.tasks.forms import GateTaskForm
 from apps.tasks.models import Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.partitions import completed_on
+
+TASK_PAGE_SIZE = 30
 
 
 def get_date_context():
@@ -23,6 +25,16 @@ def get_date_context():
     return today, jalali_date_str
 
 
+def get_daily_entry(user, date):
+    """
+    Returns the DailyEntry for the given user and date (read-only).
+    If the day has no entry yet, returns an unsaved instance:
+    the row is only inserted by the first autosave.
+    """
+    entry = DailyEntry.objects.filter(user=user, date=date).first()
+    return entry or DailyEntry(user=user, date=date)
+
+
 def get_or_create_daily_entry(user, date):
     """Gets or creates the DailyEntry for the given user and date."""
     entry, _ = DailyEntry.objects.get_or_create(user=user, date=date)
@@ -31,41 +43,24 @@ def get_or_create_daily_entry(user, date):
 
 def initialize_forms(daily_entry, post_data=None):
     """
-    Initializes the Main Form and both Highlight Formsets.
+    Initializes the Main Form and the day's highlights.
     Handles both GET (empty/bound to instance) and POST (bound to data).
+    Highlights are saved separately, as JSON (see services.highlights).
     """
     daily_entry_form = DailyEntryForm(post_data, instance=daily_entry)
-
-    # specific querysets to separate positive/negative in the UI
-    pos_qs = daily_entry.highlights.filter(category=DailyHighlight.Category.POSITIVE)
-    neg_qs = daily_entry.highlights.filter(category=DailyHighlight.Category.NEGATIVE)
-
-    pos_formset = PositiveHighlightFormSet(
-        post_data,
-        instance=daily_entry,
-        queryset=pos_qs,
-        prefix="pos",
-        initial=[{"category": DailyHighlight.Category.POSITIVE}],
-    )
-    neg_formset = NegativeHighlightFormSet(
-        post_data,
-        instance=daily_entry,
-        queryset=neg_qs,
-        prefix="neg",
-        initial=[{"category": DailyHighlight.Category.NEGATIVE}],
-    )
+    highlights = get_highlights(daily_entry)
 
     task_form = GateTaskForm()
 
     return {
         "form": daily_entry_form,
-        "pos_formset": pos_formset,
-        "neg_formset": neg_formset,
+        "pos_highlights": highlights[DailyHighlight.Category.POSITIVE],
+        "neg_highlights": highlights[DailyHighlight.Category.NEGATIVE],
         "task_form": task_form,
     }
 
 
-def create_standalone_task(user, data):
+def create_standalone_task(profile, data):
     """
     Validates and creates a new standalone task for the user.
     Returns (success: bool, result: Task|Errors).
@@ -73,63 +68,135 @@ def create_standalone_task(user, data):
     form = GateTaskForm(data)
     if form.is_valid():
         task = form.save(commit=False)
-        task.profile = user.profile
+        task.profile = profile
         # Standalone tasks have no parent or schedule by definition here
         task.save()
         return True, task
     return False, form.errors
 
 
-def archive_task(user, task_id):
+def archive_task(profile, task_id):
     """
     Soft-deletes a task (sets is_active=False).
     """
     # specific queryset to ensure user owns the task
-    task = get_object_or_404(Task, id=task_id, profile__user=user)
+    task = get_object_or_404(Task, id=task_id, profile=profile)
     task.is_active = False
     task.save()
     return True
 
 
-def get_tasks_context(user, today):
+def get_tasks_context(profile, today, stat=None, rank=None, cursor=None):
     """
-    Fetches tasks, splits them into Routines/Standalone,
-    and identifies which are completed today.
+    Fetches the routines and a page of standalone tasks (the first one
+    by default, see get_task_page), and identifies which are completed today.
     """
-    # 1. Fetch Top-Level Tasks
-    all_tasks = (
-        Task.objects.filter(profile__user=user, is_active=True, parent__isnull=True)
+    # 1. Routines: containers (have subtasks) with a schedule
+    scheduled = (
+        Task.objects.filter(
+            profile=profile,
+            is_active=True,
+            parent__isnull=True,
+            schedule__isnull=False,
+        )
         .prefetch_related("subtasks")
         .select_related("schedule")
         .annotate(subtask_count=Count("subtasks"))
         .order_by("order", "created_at")
     )
+    routines = [t for t in scheduled if t.is_routine]
 
-    # 2. Split into Categories
-    # Routines: Tasks that are containers (have subtasks) AND have a schedule.
-    routines = [t for t in all_tasks if t.is_routine]
-
-    # Standalone Tasks: One-time tasks only (No Schedule).
-    # We explicitly exclude anything that is a 'Habit' (has a schedule).
-    standalone_tasks = [t for t in all_tasks if not t.is_habit]
+    # 2. Standalone Tasks: one page at a time, the next ones on scroll
+    tasks, next_cursor = get_task_page(profile, cursor, stat=stat, rank=rank)
 
     # 3. Fetch Completed Items for TODAY
-    completed_task_ids = set(
-        TaskLog.objects.filter(
-            task__profile__user=user, completed_at__date=today
-        ).values_list("task_id", flat=True)
-    )
+    completed_task_ids = get_completed_task_ids(profile, today)
 
     return {
         "routines": routines,
-        "tasks": standalone_tasks,
+        "tasks": tasks,
+        "tasks_cursor": next_cursor,
+        "task_filters": {"stat": stat, "rank": rank},
         "completed_task_ids": completed_task_ids,
     }
 
 
+def get_completed_task_ids(profile, date, task_ids=None):
+    """Ids of the tasks completed on 'date' (among 'task_ids' if given)."""
+    logs = TaskLog.objects.filter(profile=profile, **completed_on(date))
+    if task_ids is not None:
+        logs = logs.filter(task_id__in=task_ids)
+    return set(logs.values_list("task_id", flat=True))
+
+
+# --- Standalone task list (keyset pagination) ---
+def clean_task_filters(params):
+    """{'stat', 'rank'} from request parameters; unknown values are ignored."""
+    stat = (params.get("stat") or "").upper()
+    rank = params.get("rank") or ""
+    return {
+        "stat": stat if stat in PlayerStats.StatType.values else None,
+        "rank": rank if rank in Task.Rank.values else None,
+    }
+
+
+def encode_task_cursor(task):
+    """Position of a task in the list: '<order>_<created_at ISO, UTC>_<id>'."""
+    # 'Z' rather than '+00:00': a raw '+' in a query string reads as a space
+    created_at = task.created_at.astimezone(UTC).isoformat().replace("+00:00", "Z")
+    return f"{task.order}_{created_at}_{task.pk}"
+
+
+def decode_task_cursor(cursor):
+    """Returns (order, created_at, id), or None if the cursor is malformed."""
+    try:
+        order, created_at, pk = cursor.split("_")
+        return int(order), datetime.fromisoformat(created_at), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def get_task_page(
+    profile, cursor=None, stat=None, rank=None, page_size=TASK_PAGE_SIZE
+):
+    """
+    One page of the active standalone (one-time, top-level) tasks, in the
+    Gate's order. Keyset paginated on (order, created_at, id): each page is one
+    range scan, however long the list. 'stat' keeps the tasks rewarding that
+    stat, 'rank' the tasks of that final rank.
+    Returns (tasks, next_cursor); next_cursor is None on the last page.
+    """
+    tasks = Task.objects.filter(
+        profile=profile,
+        is_active=True,
+        parent__isnull=True,
+        schedule__isnull=True,
+    ).order_by("order", "created_at", "id")
+    if stat:
+        tasks = tasks.filter(Q(primary_stat=stat) | Q(secondary_stat=stat))
+    if rank:
+        tasks = tasks.filter(rank=rank)
+
+    position = decode_task_cursor(cursor) if cursor else None
+    if position:
+        order, created_at, pk = position
+        tasks = tasks.filter(
+            Q(order__gt=order)
+            | Q(order=order, created_at__gt=created_at)
+            | Q(order=order, created_at=created_at, id__gt=pk)
+        )
+
+    # One extra row tells whether there is a next page
+    page = list(tasks[: page_size + 1])
+    if len(page) > page_size:
+        page = page[:page_size]
+        return page, encode_task_cursor(page[-1])
+    return page, None
+
+
 def process_autosave(user, post_data):
     """
-    Handles validation and saving of the DailyEntry and its Highlights.
+    Handles validation and saving of the DailyEntry fields.
     Returns a dict with status and optional errors.
     """
     # Date Handling: Default to today if not provided
@@ -144,64 +211,20 @@ def process_autosave(user, post_data):
     # Fetch or Create the DailyEntry for the target date
     daily_entry = get_or_create_daily_entry(user, target_date)
 
-    # Use helper to init forms with POST data
-    forms = initialize_forms(daily_entry, post_data)
-    form = forms["form"]
-    pos_formset = forms["pos_formset"]
-    neg_formset = forms["neg_formset"]
+    # Use helper to init the form with POST data
+    form = initialize_forms(daily_entry, post_data)["form"]
 
-    if form.is_valid() and pos_formset.is_valid() and neg_formset.is_valid():
+    if form.is_valid():
         form.save()
-        pos_map = _save_highlight_formset(pos_formset, DailyHighlight.Category.POSITIVE)
-        neg_map = _save_highlight_formset(neg_formset, DailyHighlight.Category.NEGATIVE)
+        return {"success": True}
+    else:
+        return {"success": False, "errors": {"main": form.errors}}
 
-        new_ids = {**pos_map, **neg_map}
 
-        return {"success": True, "new_ids": new_ids}
-    else:
-        return {
-            "success": False,
-            "errors": {
-                "main": form.errors,
-                "pos": pos_formset.errors,
-                "neg": neg_formset.errors,
-            },
-        }
-
-
-def _save_highlight_formset(formset, category):
-    """Helper to save a highlight formset with a specific category."""
-    instances = formset.save(commit=False)
-    for obj in instances:
-        obj.category = category
-        obj.save()
-    for obj in formset.deleted_objects:
-        obj.delete()
-
-    # Map form field names to their database IDs
-    saved_map = {}
-    for form in formset.forms:
-        # If the instance exists (was created or updated) and has an ID
-        if form.instance.pk:
-            # form.add_prefix('id') generates the HTML name, e.g., 'pos-0-id'
-            saved_map[form.add_prefix("id")] = form.instance.pk
-
-    return saved_map
-
-
-def toggle_task_completion(user, task_id):
+def toggle_task_completion(profile, task_id):
     """
     Toggles a Task's completion for today.
     Returns the new status ('added' or 'removed').
     """
-    task = get_object_or_404(Task, id=task_id, profile__user=user)
-    today = timezone.now().date()
-
-    logs = TaskLog.objects.filter(task=task, completed_at__date=today)
-
-    if logs.exists():
-        logs.delete()
-        return "removed"
-    else:
-        TaskLog.objects.create(task=task, completed_at=timezone.now())
-        return "added"
+    task = get_object_or_404(Task, id=task_id, profile=profile)
+    return completion.toggle(task, timezone.now().date())
@@ -0,0 +1,82 @@
+from django.db import transaction
+
+from apps.gate.models import DailyEntry, DailyHighlight
+from apps.gate.services.search import update_search_vectors
+from apps.profiles.services.player import bump_data_version
+from apps.tasks.ordering import ORDER_GAP
+from core.db import raw_delete
+
+# Highlights saved with one request, per category
+MAX_HIGHLIGHTS = 50
+
+
+def get_highlights(entry):
+    """{category: [highlights in display order]} of an entry (saved or not)."""
+    grouped = {category: [] for category in DailyHighlight.Category.values}
+    if entry.pk:
+        for highlight in entry.highlights.order_by("order", "created_at"):
+            grouped[highlight.category].append(highlight)
+    return grouped
+
+
+def save_highlights(user, date, highlights):
+    """
+    Replaces the highlights of a day with the submitted lists, as a diff:
+    one bulk_create for the new rows, one bulk_update for the changed ones
+    (content, category or position) and one DELETE for the missing ones.
+    'highlights' is {category: [{"id": int or None, "content": str}]}, in display
+    order. An id that isn't one of the day's highlights (e.g. deleted from another
+    tab) is saved as a new row.
+    Returns {category: [ids]}, in the submitted order.
+    """
+    if not any(highlights.values()) and not DailyEntry.objects.filter(
+        user=user, date=date
+    ).exists():
+        # Nothing written for this day yet: don't create an empty entry
+        return {category: [] for category in highlights}
+
+    with transaction.atomic():
+        entry, _ = DailyEntry.objects.get_or_create(user=user, date=date)
+        # Serializes concurrent saves of the same day
+        entry = DailyEntry.objects.select_for_update().get(pk=entry.pk)
+        existing = {highlight.pk: highlight for highlight in entry.highlights.all()}
+
+        to_create, to_update, saved = [], [], {}
+        for category, rows in highlights.items():
+            saved[category] = []
+            for position, row in enumerate(rows, start=1):
+                order = position * ORDER_GAP
+                highlight = existing.pop(row.get("id"), None)
+                if highlight is None:
+                    highlight = DailyHighlight(
+                        entry=entry,
+                        category=category,
+                        content=row["content"],
+                        order=order,
+                    )
+                    to_create.append(highlight)
+                elif (highlight.content, highlight.category, highlight.order) != (
+                    row["content"],
+                    category,
+                    order,
+                ):
+                    highlight.content = row["content"]
+                    highlight.category = category
+                    highlight.order = order
+                    to_update.append(highlight)
+                saved[category].append(highlight)
+
+        # bulk_* skip the signals: the search vector and ETag are updated once below
+        DailyHighlight.objects.bulk_create(to_create)
+        DailyHighlight.objects.bulk_update(to_update, ["content", "category", "order"])
+        if existing:
+            raw_delete(DailyHighlight.objects.filter(pk__in=existing))
+
+        if to_create or to_update or existing:
+            update_search_vectors([entry.pk])
+            bump_data_version(user_id=user.pk)
+
+    return {
+        category: [highlight.pk for highlight in rows]
+        for category, rows in saved.items()
+    }
@@ -5,15 +5,19 @@ from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
 from apps.gate.models import DailyEntry
-from apps.profiles.models import PlayerProfile
-from apps.tasks.models import Task, TaskLog
+from apps.profiles.services.affinity import get_affinity
+from apps.profiles.services.player import reload_player
+from apps.tasks.models import DailyCompletionRollup, Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.heatmap import get_bitmaps, get_year_bounds
+from apps.tasks.services.partitions import completed_on
 
 
-def get_player_stats(user):
+def get_player_stats(profile):
     """
-    Fetches the user's profile and formats stats for the radar chart.
+    Formats the player's profile and stats for the radar chart.
+    Expects the request's player (stats already loaded).
     """
-    profile, _ = PlayerProfile.objects.get_or_create(user=user)
     stats = getattr(profile, "stats", None)
 
     if stats:
@@ -25,13 +29,17 @@ def get_player_stats(user):
             stats.wil_level,
             stats.wis_level,
         ]
+        affinity = get_affinity(stats)
     else:
         values = [1, 1, 1, 1, 1]
+        affinity = {"current_level": [0] * 5, "lifetime": [0] * 5}
 
     return {
         "profile": profile,
         "stat_labels": ["STR", "INT", "CHA", "WIL", "WIS"],
         "stat_values": values,
+        "affinity_level": affinity["current_level"],
+        "affinity_lifetime": affinity["lifetime"],
     }
 
 
@@ -80,6 +88,8 @@ def get_sleep_data(user, month_info):
 def get_habit_grid_context(user, profile, month_info):
     """
     Builds the Habit Grid, Daily Counts, and Chart Data.
+    Read from the habits' year bitmaps (cells) and the daily rollups (counts),
+    not from the completion logs.
     """
     today = timezone.now().date()
     days_in_month = month_info["days_in_month"]
@@ -88,40 +98,31 @@ def get_habit_grid_context(user, profile, month_info):
     g_start = month_info["g_start"]
     g_end = month_info["g_end"]
 
-    # 1. Fetch Habits & Logs
-    habits = Task.objects.filter(
-        profile=profile,
-        is_active=True,
-        schedule__isnull=False,
-    ).select_related("schedule")
-
-    habit_logs = TaskLog.objects.filter(
-        task__in=habits,
-        completed_at__date__range=[g_start, g_end],
-    ).select_related("task")
-
-    # 2. Map Data
-    habit_completion_map = set()
-    daily_habit_counts_map = {}
-    daily_habit_titles_map = {}
-
-    for log in habit_logs:
-        c_date = log.completed_at.date()
-        c_date_str = c_date.strftime("%Y-%m-%d")
+    # 1. Fetch Habits, their completed days and the daily counts
+    habits = list(
+        Task.objects.filter(
+            profile=profile,
+            is_active=True,
+            schedule__isnull=False,
+        ).select_related("schedule")
+    )
 
-        habit_completion_map.add((log.task.id, c_date_str))
+    # A Jalali month is within one Jalali year: one bitmap per habit
+    year_start, _ = get_year_bounds(j_month_start.year)
+    bitmaps = get_bitmaps([habit.id for habit in habits], j_month_start.year)
 
-        daily_habit_counts_map[c_date_str] = (
-            daily_habit_counts_map.get(c_date_str, 0) + 1
-        )
-        if c_date_str not in daily_habit_titles_map:
-            daily_habit_titles_map[c_date_str] = []
-        daily_habit_titles_map[c_date_str].append(log.task.title)
+    daily_habit_counts_map = dict(
+        DailyCompletionRollup.objects.filter(
+            profile=profile, date__range=(g_start, g_end)
+        ).values_list("date", "habit_completions")
+    )
+    daily_habit_titles_map = {}
 
-    # 3. Build Grid Rows
+    # 2. Build Grid Rows
     habit_grid = []
     for habit in habits:
         row = []
+        bits = bitmaps[habit.id]
         start_date = (
             habit.schedule.start_time.date() if habit.schedule.start_time else None
         )
@@ -131,8 +132,11 @@ def get_habit_grid_context(user, profile, month_info):
             c_g_date = c_j_date.togregorian()
             c_g_date_str = c_g_date.strftime("%Y-%m-%d")
 
-            is_done = (habit.id, c_g_date_str) in habit_completion_map
+            index = (c_g_date - year_start).days
+            is_done = bool(bits[index // 8] >> (index % 8) & 1)
             is_today = c_j_date == j_today
+            if is_done:
+                daily_habit_titles_map.setdefault(c_g_date, []).append(habit.title)
 
             # Coloring State
             state = "future"
@@ -157,33 +161,28 @@ def get_habit_grid_context(user, profile, month_info):
 
         habit_grid.append({"id": habit.id, "title": habit.title, "status": row})
 
-    # 4. Build Chart Data
+    # 3. Build Chart Data
     habit_counts_data = []
     habit_titles_data = []
     for d in range(days_in_month):
-        c_j_date = j_month_start + timedelta(days=d)
-        c_g_date_str = c_j_date.togregorian().strftime("%Y-%m-%d")
+        c_g_date = (j_month_start + timedelta(days=d)).togregorian()
 
-        habit_counts_data.append(daily_habit_counts_map.get(c_g_date_str, 0))
-        habit_titles_data.append(daily_habit_titles_map.get(c_g_date_str, []))
+        habit_counts_data.append(daily_habit_counts_map.get(c_g_date, 0))
+        habit_titles_data.append(daily_habit_titles_map.get(c_g_date, []))
 
     return {
         "habit_grid": habit_grid,
         "habit_counts_data": habit_counts_data,
         "habit_titles_data": habit_titles_data,
-        "total_active_habits": habits.count(),
+        "total_active_habits": len(habits),
     }
 
 
-def perform_habit_toggle(user, task_id, date_str):
+def perform_habit_toggle(profile, task_id, date_str):
     """
     Toggles a habit log.
     Returns a dictionary of updated stats/icons for the frontend.
     """
-    profile = PlayerProfile.objects.filter(user=user).first()
-    if not profile:
-        raise ValueError("Profile not found")
-
     task = get_object_or_404(
         Task.objects.select_related("schedule"), id=task_id, profile=profile
     )
@@ -194,25 +193,10 @@ def perform_habit_toggle(user, task_id, date_str):
         raise ValueError("Invalid date format")
 
     # 1. Toggle Logic
-    logs = TaskLog.objects.filter(task=task, completed_at__date=date_obj)
+    status = completion.toggle(task, date_obj)
 
-    if logs.exists():
-        logs.delete()
-        status = "removed"
-    else:
-        now = timezone.now()
-        if date_obj == now.date():
-            log_time = now
-        else:
-            # Mid-day to avoid timezone edge cases
-            dt_naive = datetime.combine(date_obj, datetime.min.time().replace(hour=12))
-            log_time = timezone.make_aware(dt_naive)
-
-        TaskLog.objects.create(task=task, completed_at=log_time)
-        status = "added"
-
-    # 2. Refresh Stats
-    profile.refresh_from_db()
+    # 2. Refresh Stats (the reward was applied to a locked copy)
+    profile = reload_player(profile)
     stats = profile.stats
 
     xp_percent = 0
@@ -230,26 +214,32 @@ def perform_habit_toggle(user, task_id, date_str):
     # 3. Icon Logic (Presentation Helper)
     icon_html = _get_status_icon_html(status, date_obj, task)
 
-    # 4. Daily Count Calculation
-    habits = Task.objects.filter(
-        profile=profile, is_active=True, schedule__isnull=False
+    # 4. Daily Count (same source as the grid's chart: the day's rollup)
+    daily_count = (
+        DailyCompletionRollup.objects.filter(profile=profile, date=date_obj)
+        .values_list("habit_completions", flat=True)
+        .first()
     )
-    updated_logs = TaskLog.objects.filter(
-        task__in=habits, completed_at__date=date_obj
-    ).select_related("task")
+    daily_titles = TaskLog.objects.filter(
+        profile=profile,
+        task__is_active=True,
+        task__schedule__isnull=False,
+        **completed_on(date_obj),
+    ).values_list("task__title", flat=True)
 
     return {
         "status": status,
         "icon_html": icon_html,
         "date": date_str,
         "task_id": task_id,
-        "daily_count": updated_logs.count(),
-        "daily_titles": [log.task.title for log in updated_logs],
+        "daily_count": daily_count or 0,
+        "daily_titles": list(daily_titles),
         "new_level": profile.level,
         "new_xp_current": profile.xp_current,
         "new_xp_required": profile.xp_required,
         "new_xp_percent": round(xp_percent, 1),
         "new_stats": new_stats_values,
+        "new_affinity": get_affinity(stats),
     }
 
 
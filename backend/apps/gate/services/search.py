@@ -0,0 +1,168 @@
+from datetime import date
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Cast, Coalesce, Concat
+from django.utils.html import escape
+
+from apps.gate.models import DailyEntry, DailyHighlight
+
+# 'simple' doesn't stem: the journal mixes Persian and English,
+# and Postgres has no Persian dictionary.
+SEARCH_CONFIG = "simple"
+
+SEARCH_PAGE_SIZE = 20
+
+# Field -> weight. Highlights and lessons are the distilled part of a day.
+SEARCH_WEIGHTS = {
+    "event": "A",
+    "lesson_of_day": "A",
+    "highlights": "A",
+    "diary": "B",
+    "quote": "C",
+    "notes_tomorrow": "C",
+    "financial_notes": "C",
+}
+
+# Marks the matches in the headline, before the text is escaped
+MATCH_START, MATCH_STOP = "\x02", "\x03"
+
+
+def highlights_text():
+    """The entry's highlights as one string (a subquery, usable in UPDATE)."""
+    return Subquery(
+        DailyHighlight.objects.filter(entry=OuterRef("pk"))
+        .order_by()
+        .values("entry")
+        .annotate(text=StringAgg("content", " "))
+        .values("text")
+    )
+
+
+def search_vector():
+    """The weighted tsvector of an entry (see SEARCH_WEIGHTS)."""
+    vectors = [
+        SearchVector(
+            highlights_text() if field == "highlights" else field,
+            weight=weight,
+            config=SEARCH_CONFIG,
+        )
+        for field, weight in SEARCH_WEIGHTS.items()
+    ]
+    vector = vectors[0]
+    for other in vectors[1:]:
+        vector = vector + other
+    return vector
+
+
+def update_search_vectors(entry_ids):
+    """Recomputes the stored vector of the given entries (one UPDATE)."""
+    return DailyEntry.objects.filter(pk__in=entry_ids).update(
+        search_vector=search_vector()
+    )
+
+
+def encode_cursor(entry):
+    """Position of a result: '<rank>_<date ISO>_<id>'."""
+    return f"{entry.rank!r}_{entry.date.isoformat()}_{entry.pk}"
+
+
+def decode_cursor(cursor):
+    """Returns (rank, date, id), or None if the cursor is malformed."""
+    try:
+        rank, day, pk = cursor.split("_")
+        return float(rank), date.fromisoformat(day), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def search_entries(user, text, cursor=None, page_size=SEARCH_PAGE_SIZE):
+    """
+    Full-text search over the user's journal, best matches first
+    (then newest first). 'text' uses the web search syntax:
+    words, "quoted phrases", 'or' and '-excluded'.
+
+    Matches come from the GIN index; pages are keyset paginated on
+    (rank, date, id), and headlines are only built for the rows of the page.
+    Returns (entries, next_cursor); each entry has 'rank' and 'headline'.
+    """
+    query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+    entries = (
+        DailyEntry.objects.filter(user=user, search_vector=query)
+        # ts_rank() is a real: as a double, the cursor round-trips exactly
+        .annotate(rank=Cast(SearchRank(F("search_vector"), query), FloatField()))
+        .order_by("-rank", "-date", "-id")
+        .only("id", "date", "event", "rating", "emoji")
+    )
+
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        rank, day, pk = position
+        entries = entries.filter(
+            Q(rank__lt=rank)
+            | Q(rank=rank, date__lt=day)
+            | Q(rank=rank, date=day, id__lt=pk)
+        )
+
+    # One extra row tells whether there is a next page
+    page = list(entries[: page_size + 1])
+    next_cursor = None
+    if len(page) > page_size:
+        page = page[:page_size]
+        next_cursor = encode_cursor(page[-1])
+
+    headlines = get_headlines([entry.pk for entry in page], query)
+    for entry in page:
+        entry.headline = headlines.get(entry.pk, "")
+    return page, next_cursor
+
+
+def get_headlines(entry_ids, query):
+    """
+    {entry id: HTML snippet} with the matches wrapped in <mark>.
+    ts_headline re-parses the whole text, so it only runs on one page of ids.
+    """
+    if not entry_ids:
+        return {}
+
+    parts = []
+    for field in SEARCH_WEIGHTS:
+        expression = highlights_text() if field == "highlights" else F(field)
+        parts += [
+            Coalesce(expression, Value(""), output_field=TextField()),
+            Value(" \n "),
+        ]
+
+    rows = (
+        DailyEntry.objects.filter(pk__in=entry_ids)
+        .annotate(
+            headline=SearchHeadline(
+                Concat(*parts[:-1], output_field=TextField()),
+                query,
+                config=SEARCH_CONFIG,
+                start_sel=MATCH_START,
+                stop_sel=MATCH_STOP,
+                max_fragments=2,
+                max_words=25,
+                min_words=8,
+                fragment_delimiter=" … ",
+            )
+        )
+        .values_list("id", "headline")
+    )
+    return {pk: render_headline(headline) for pk, headline in rows}
+
+
+def render_headline(headline):
+    """Escapes the user's text, then turns the match markers into <mark> tags."""
+    return (
+        escape(" ".join(headline.split()))
+        .replace(MATCH_START, "<mark>")
+        .replace(MATCH_STOP, "</mark>")
+    )
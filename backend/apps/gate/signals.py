@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.gate.models import DailyEntry, DailyHighlight
+from apps.gate.services.search import update_search_vectors
+
+
+# The search vector includes the highlights, so it's computed in the
+# database (one UPDATE) after the entry or one of its highlights changes.
+@receiver(post_save, sender=DailyEntry)
+def index_daily_entry(sender, instance, **kwargs):
+    update_search_vectors([instance.pk])
+
+
+@receiver(post_save, sender=DailyHighlight)
+@receiver(post_delete, sender=DailyHighlight)
+def index_highlight_entry(sender, instance, **kwargs):
+    # Deleted with their entry: the UPDATE simply matches no row
+    update_search_vectors([instance.entry_id])
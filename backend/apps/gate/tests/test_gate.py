@@ -0,0 +1,66 @@
+from django.test import TestCase
+
+from apps.gate.services.gate import clean_task_filters, get_task_page
+from apps.tasks.models import Task, TaskSchedule
+from apps.tasks.tests.utils import make_player
+
+
+class TaskPageTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.tasks = [
+            Task.objects.create(
+                profile=self.profile,
+                title=f"Task {n}",
+                primary_stat="INT" if n % 2 else "STR",
+                manual_rank="C" if n % 3 else "E",
+            )
+            for n in range(7)
+        ]
+        # Out of the list: archived, routine, subtask
+        Task.objects.create(profile=self.profile, title="Old", is_active=False)
+        routine = Task.objects.create(profile=self.profile, title="Morning")
+        TaskSchedule.objects.create(task=routine)
+        Task.objects.create(profile=self.profile, parent=routine, title="Stretch")
+
+    def walk(self, page_size, **filters):
+        pages, cursor = [], None
+        while True:
+            page, cursor = get_task_page(
+                self.profile, cursor, page_size=page_size, **filters
+            )
+            pages.append([task.pk for task in page])
+            if cursor is None:
+                return pages
+
+    def test_pages_follow_the_gate_order(self):
+        pages = self.walk(page_size=3)
+
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual(sum(pages, []), [task.pk for task in self.tasks])
+
+    def test_ties_on_order_and_creation_are_broken_by_id(self):
+        first = self.tasks[0]
+        Task.objects.filter(pk__in=[task.pk for task in self.tasks[:4]]).update(
+            order=first.order, created_at=first.created_at
+        )
+
+        pages = self.walk(page_size=2)
+
+        self.assertEqual(sum(pages, []), [task.pk for task in self.tasks])
+
+    def test_filters_apply_to_every_page(self):
+        pages = self.walk(page_size=1, stat="INT", rank="C")
+
+        expected = [
+            task.pk
+            for task in self.tasks
+            if task.primary_stat == "INT" and task.final_rank == "C"
+        ]
+        self.assertEqual(sum(pages, []), expected)
+
+    def test_unknown_filters_are_ignored(self):
+        self.assertEqual(
+            clean_task_filters({"stat": "int", "rank": "Z"}),
+            {"stat": "INT", "rank": None},
+        )
@@ -0,0 +1,100 @@
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.gate.models import DailyEntry, DailyHighlight
+from apps.gate.services.highlights import get_highlights, save_highlights
+from apps.tasks.ordering import ORDER_GAP
+from apps.tasks.tests.utils import make_player
+
+DAY = date(2025, 10, 20)
+
+
+class SaveHighlightsTests(TestCase):
+    def setUp(self):
+        self.user = make_player("hunter").user
+        ids = save_highlights(
+            self.user,
+            DAY,
+            {
+                "POS": [{"content": "Ran 5k"}, {"content": "Read"}],
+                "NEG": [{"content": "Slept late"}],
+            },
+        )
+        (self.ran, self.read), (self.slept,) = ids["POS"], ids["NEG"]
+
+    def contents(self):
+        entry = DailyEntry.objects.get(user=self.user, date=DAY)
+        return {
+            category: [(h.pk, h.content, h.order) for h in rows]
+            for category, rows in get_highlights(entry).items()
+        }
+
+    def test_diff_creates_updates_moves_and_deletes(self):
+        ids = save_highlights(
+            self.user,
+            DAY,
+            {
+                "POS": [
+                    {"id": self.read, "content": "Read 20 pages"},
+                    {"id": None, "content": "Called mom"},
+                ],
+                # Moved to the other category, 'Ran 5k' is removed
+                "NEG": [{"id": self.slept, "content": "Slept late"}],
+            },
+        )
+
+        called = ids["POS"][1]
+        self.assertEqual(ids, {"POS": [self.read, called], "NEG": [self.slept]})
+        self.assertEqual(
+            self.contents(),
+            {
+                "POS": [
+                    (self.read, "Read 20 pages", ORDER_GAP),
+                    (called, "Called mom", 2 * ORDER_GAP),
+                ],
+                "NEG": [(self.slept, "Slept late", ORDER_GAP)],
+            },
+        )
+        self.assertFalse(DailyHighlight.objects.filter(pk=self.ran).exists())
+
+    def test_unknown_id_is_saved_as_a_new_row(self):
+        ids = save_highlights(
+            self.user, DAY, {"POS": [{"id": 10**9, "content": "Gone"}], "NEG": []}
+        )
+
+        (new,) = ids["POS"]
+        self.assertNotEqual(new, 10**9)
+        self.assertEqual(DailyHighlight.objects.get().content, "Gone")
+
+    def test_unchanged_lists_write_nothing(self):
+        with CaptureQueriesContext(connection) as queries:
+            save_highlights(
+                self.user,
+                DAY,
+                {
+                    "POS": [
+                        {"id": self.ran, "content": "Ran 5k"},
+                        {"id": self.read, "content": "Read"},
+                    ],
+                    "NEG": [{"id": self.slept, "content": "Slept late"}],
+                },
+            )
+
+        writes = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+        self.assertEqual(writes, [])
+
+    def test_empty_day_creates_no_entry(self):
+        other_day = date(2025, 10, 21)
+
+        self.assertEqual(
+            save_highlights(self.user, other_day, {"POS": [], "NEG": []}),
+            {"POS": [], "NEG": []},
+        )
+        self.assertFalse(DailyEntry.objects.filter(date=other_day).exists())
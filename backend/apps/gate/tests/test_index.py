@@ -0,0 +1,65 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.gate.services import calendar as calendar_service
+from apps.gate.services import index as index_service
+from apps.tasks.models import Task, TaskLog, TaskSchedule
+from apps.tasks.services import completion
+from apps.tasks.tests.utils import make_player
+
+
+class HabitGridTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.month = calendar_service.get_current_month_info()
+        self.habits = []
+        for title in ["Read", "Run"]:
+            habit = Task.objects.create(profile=self.profile, title=title)
+            TaskSchedule.objects.create(task=habit)
+            self.habits.append(habit)
+        self.first_day = self.month["g_start"]
+
+    def get_grid(self):
+        return index_service.get_habit_grid_context(
+            self.profile.user, self.profile, self.month
+        )
+
+    def test_cells_and_counts(self):
+        read, run = self.habits
+        completion.complete(read, completion.completion_time(self.first_day))
+        completion.complete(run, completion.completion_time(self.first_day))
+
+        grid = self.get_grid()
+
+        rows = {row["title"]: row["status"] for row in grid["habit_grid"]}
+        self.assertTrue(rows["Read"][0]["status"])
+        self.assertTrue(rows["Run"][0]["status"])
+        self.assertEqual(rows["Read"][0]["state"], "completed")
+        self.assertEqual(grid["habit_counts_data"][0], 2)
+        self.assertEqual(sorted(grid["habit_titles_data"][0]), ["Read", "Run"])
+        self.assertEqual(sum(grid["habit_counts_data"]), 2)
+        self.assertEqual(grid["total_active_habits"], 2)
+
+    def test_reads_no_completion_logs(self):
+        read = self.habits[0]
+        completion.complete(read, completion.completion_time(self.first_day))
+        self.get_grid()  # Stores the year bitmaps
+
+        with CaptureQueriesContext(connection) as queries:
+            grid = self.get_grid()
+
+        table = TaskLog._meta.db_table
+        self.assertFalse(any(table in query["sql"] for query in queries))
+        self.assertEqual(grid["habit_counts_data"][0], 1)
+
+    def test_undo_clears_the_cell(self):
+        read = self.habits[0]
+        completion.complete(read, completion.completion_time(self.first_day))
+        self.get_grid()
+
+        completion.uncomplete(read, self.first_day)
+
+        grid = self.get_grid()
+        self.assertFalse(grid["habit_grid"][0]["status"][0]["status"])
+        self.assertEqual(grid["habit_counts_data"][0], 0)
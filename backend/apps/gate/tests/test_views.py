@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+from django.urls import include, path
+
+from apps.gate.views import AsyncIndexView
+from apps.tasks.tests.utils import make_player, plain_static
+
+urlpatterns = [
+    path("async/", AsyncIndexView.as_view()),
+    path("", include("core.urls")),
+]
+
+
+@plain_static
+@override_settings(ROOT_URLCONF=__name__)
+class AsyncIndexViewTests(TransactionTestCase):
+    # The threaded sections use their own connections: the data must be committed
+    def setUp(self):
+        self.client.force_login(make_player("hunter").user)
+
+    def test_same_context_as_the_sync_view(self):
+        sync = self.client.get("/")
+        response = self.client.get("/async/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "index/index.html")
+        self.assertIn("habit_grid", response.context.keys())
+        self.assertEqual(
+            set(response.context.keys()) - {"view"},
+            set(sync.context.keys()) - {"view"},
+        )
+
+
+class AsyncDashboardSettingsTests(SimpleTestCase):
+    def load_settings(self, **env):
+        return subprocess.run(
+            [sys.executable, "-c", "import core.settings.base"],
+            env={**os.environ, **env},
+            capture_output=True,
+            text=True,
+        )
+
+    def test_requires_the_pool(self):
+        result = self.load_settings(ASYNC_DASHBOARD="True", DB_POOL="False")
+
+        self.assertNotEqual(result.returncode, 0)
+        self.assertIn("requires DB_POOL=True", result.stderr)
+
+    def test_pool_fits_a_dashboard_load(self):
+        result = self.load_settings(
+            ASYNC_DASHBOARD="True", DB_POOL="True", DB_POOL_MAX_SIZE="2"
+        )
+
+        self.assertIn("requires DB_POOL_MAX_SIZE >= 4", result.stderr)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, re_path
 
 from apps.gate import views
@@ -5,9 +6,15 @@ from apps.gate.views import assets
 
 app_name = "gate"
 
+# The async dashboard loads its sections concurrently (see AsyncIndexView)
+if getattr(settings, "ASYNC_DASHBOARD", False):
+    index_view = views.AsyncIndexView.as_view()
+else:
+    index_view = views.IndexView.as_view()
+
 urlpatterns = [
     # Home / Index View
-    path("", views.IndexView.as_view(), name="index"),
+    path("", index_view, name="index"),
     # Gate View
     path("gate/", views.gate_view, name="gate"),
     path("gate/autosave/", views.autosave_daily_entry, name="autosave_daily_entry"),
@@ -27,8 +34,11 @@ urlpatterns = [
         views.toggle_task_log,
         name="toggle_task_log",
     ),
+    # Stats
+    path("stats/affinity/", views.affinity_data_view, name="affinity_data"),
     # Task Manager
     path("task/add/", views.add_task_view, name="add_task"),
+    path("task/list/", views.task_list_view, name="task_list"),
     path("task/<int:task_id>/archive/", views.archive_task_view, name="archive_task"),
     # Assets
     path("assets/emoji-data.json", assets.emoji_data_view, name="emoji_data"),
@@ -3,16 +3,25 @@ from .view_gate import (
     archive_task_view,
     autosave_daily_entry,
     gate_view,
+    task_list_view,
     toggle_task_log,
 )
-from .view_index import IndexView, toggle_habit_log
+from .view_index import (
+    AsyncIndexView,
+    IndexView,
+    affinity_data_view,
+    toggle_habit_log,
+)
 
 __all__ = [
     "add_task_view",
     "archive_task_view",
     "autosave_daily_entry",
     "gate_view",
+    "task_list_view",
     "toggle_task_log",
+    "AsyncIndexView",
     "IndexView",
+    "affinity_data_view",
     "toggle_habit_log",
 ]
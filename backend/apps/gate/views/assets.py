@@ -1,39 +1,71 @@
-import os
-
-from django.conf import settings
 from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
 from django.views.decorators.http import require_http_methods
 
+from apps.gate.services import assets as assets_service
+
 
 @require_http_methods(["GET", "HEAD"])
 def emoji_data_view(request):
     """
-    Manually serves the emoji data.json with a strong ETag header.
+    Serves the emoji-picker data.json from memory with a strong ETag
+    (content hash, identical across containers), a pre-compressed gzip variant
+    (negotiated via Accept-Encoding) and single Range requests.
     This satisfies the emoji-picker-element efficiency check.
     """
-    # Build path to the file on disk
-    file_path = settings.BASE_DIR / "static" / "vendor" / "emoji-picker" / "data.json"
-
-    if not os.path.exists(file_path):
+    try:
+        dataset = assets_service.get_emoji_dataset()
+    except OSError:
         raise Http404("Emoji database not found")
 
-    # Generate a lightweight ETag based on modification time and file size
-    stats = os.stat(file_path)
-    etag = f'"{stats.st_mtime}-{stats.st_size}"'
+    variants = dataset["variants"]
+    encoding = assets_service.negotiate_encoding(
+        request.headers.get("Accept-Encoding", ""), variants
+    )
+    body = variants[encoding]
+
+    # Each representation has its own strong ETag
+    suffix = "" if encoding == "identity" else f"-{encoding}"
+    etag = f'"{dataset["etag"]}{suffix}"'
+    all_etags = {f'"{dataset["etag"]}{s}"' for s in ("", "-gzip")}
 
     # 1. Check if the browser already has this version (Efficiency Check)
-    if request.headers.get("If-None-Match") == etag:
-        return HttpResponseNotModified()
+    if_none_match = request.headers.get("If-None-Match", "")
+    if any(tag.strip() in all_etags for tag in if_none_match.split(",")):
+        response = HttpResponseNotModified()
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept-Encoding"])
+        return response
 
-    # 2. If not, read and serve the file
-    try:
-        with open(file_path, "rb") as f:
-            content = f.read()
-    except IOError:
-        raise Http404("Error reading emoji database")
+    # 2. Partial content (only if If-Range, when sent, still matches)
+    status = 200
+    content_range = None
+    range_header = request.headers.get("Range")
+    if range_header and request.headers.get("If-Range", etag) == etag:
+        byte_range = assets_service.parse_range(range_header, len(body))
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{len(body)}"
+            return response
+        if byte_range:
+            start, end = byte_range
+            content_range = f"bytes {start}-{end}/{len(body)}"
+            body = body[start : end + 1]
+            status = 206
 
-    response = HttpResponse(content, content_type="application/json")
+    response = HttpResponse(
+        b"" if request.method == "HEAD" else body,
+        content_type="application/json",
+        status=status,
+    )
+    response["Content-Length"] = len(body)
     response["ETag"] = etag
+    response["Accept-Ranges"] = "bytes"
+    if encoding != "identity":
+        response["Content-Encoding"] = encoding
+    if content_range:
+        response["Content-Range"] = content_range
+    patch_vary_headers(response, ["Accept-Encoding"])
     # Cache heavily (1 year) since we have a working ETag system now
     response["Cache-Control"] = "public, max-age=31536000"
     return response
@@ -1,14 +1,30 @@
+from datetime import date
+
 import jdatetime
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponseRedirect, JsonResponse
 from django.shortcuts import render
 from django.urls import reverse
-from django.views.decorators.http import require_POST
+from django.utils.http import urlencode
+from django.views.decorators.http import require_GET, require_POST
 
 from apps.gate.services import gate as gate_service
+from apps.profiles.decorators import player_etag
+from apps.profiles.models import PlayerStats
+from apps.tasks.models import Task
+
+
+def get_task_list_url(cursor, target_date, filters):
+    """URL of the next page of the standalone task list (None on the last page)."""
+    if not cursor:
+        return None
+    params = {"cursor": cursor, "date": target_date.isoformat()}
+    params.update({key: value for key, value in filters.items() if value})
+    return f"{reverse('gate:task_list')}?{urlencode(params)}"
 
 
 @login_required
+@player_etag
 def gate_view(request, date_str=None):
     """
     The 'Gate'.
@@ -33,23 +49,61 @@ def gate_view(request, date_str=None):
         # Default: Use Today
         target_date, jalali_date_str = gate_service.get_date_context()
 
-    # Get or Create the Entry for the TARGET date (not necessarily today)
-    daily_entry = gate_service.get_or_create_daily_entry(request.user, target_date)
+    # Entry for the TARGET date (not necessarily today).
+    # Unsaved if the day has no data yet: GETs never write, the first autosave does.
+    daily_entry = gate_service.get_daily_entry(request.user, target_date)
 
     # Forms & Data
     forms_context = gate_service.initialize_forms(daily_entry)
-    tasks_context = gate_service.get_tasks_context(request.user, target_date)
+    filters = gate_service.clean_task_filters(request.GET)
+    tasks_context = gate_service.get_tasks_context(
+        request.player, target_date, **filters
+    )
 
     context = {
         "daily_entry": daily_entry,
         "today": target_date,
         "jalali_date_str": jalali_date_str,
+        "tasks_next_url": get_task_list_url(
+            tasks_context["tasks_cursor"], target_date, filters
+        ),
+        "stat_choices": PlayerStats.StatType.choices,
+        "rank_choices": Task.Rank.choices,
         **forms_context,
         **tasks_context,
     }
     return render(request, "gate/gate.html", context)
 
 
+@login_required
+@require_GET
+def task_list_view(request):
+    """
+    AJAX Endpoint: The next page of standalone tasks, as rows (infinite scroll).
+    Takes the 'cursor' of the previous page, the Gate's 'date' and its filters.
+    """
+    try:
+        target_date = date.fromisoformat(request.GET.get("date", ""))
+    except ValueError:
+        target_date, _ = gate_service.get_date_context()
+
+    filters = gate_service.clean_task_filters(request.GET)
+    tasks, next_cursor = gate_service.get_task_page(
+        request.player, request.GET.get("cursor"), **filters
+    )
+    # Only this page's completions are needed
+    completed_task_ids = gate_service.get_completed_task_ids(
+        request.player, target_date, [task.id for task in tasks]
+    )
+
+    context = {
+        "tasks": tasks,
+        "completed_task_ids": completed_task_ids,
+        "tasks_next_url": get_task_list_url(next_cursor, target_date, filters),
+    }
+    return render(request, "gate/_task_rows.html", context)
+
+
 @login_required
 @require_POST
 def autosave_daily_entry(request):
@@ -59,7 +113,7 @@ def autosave_daily_entry(request):
     result = gate_service.process_autosave(request.user, request.POST)
 
     if result["success"]:
-        return JsonResponse({"status": "success", "new_ids": result.get("new_ids", {})})
+        return JsonResponse({"status": "success"})
 
     return JsonResponse({"status": "error", "errors": result["errors"]}, status=400)
 
@@ -70,7 +124,7 @@ def toggle_task_log(request, task_id):
     """
     AJAX Endpoint: Toggles a Task's completion for today.
     """
-    status = gate_service.toggle_task_completion(request.user, task_id)
+    status = gate_service.toggle_task_completion(request.player, task_id)
     return JsonResponse({"status": status, "task_id": task_id})
 
 
@@ -80,7 +134,7 @@ def add_task_view(request):
     """
     AJAX Endpoint: Creates a new task via Modal.
     """
-    success, result = gate_service.create_standalone_task(request.user, request.POST)
+    success, result = gate_service.create_standalone_task(request.player, request.POST)
 
     if success:
         # Return data needed to prepend the new task to the list without refresh
@@ -104,5 +158,5 @@ def archive_task_view(request, task_id):
     """
     AJAX Endpoint: Soft deletes a task.
     """
-    gate_service.archive_task(request.user, task_id)
+    gate_service.archive_task(request.player, task_id)
     return JsonResponse({"status": "success", "task_id": task_id})
@@ -1,15 +1,29 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.contrib.auth.views import redirect_to_login
+from django.db import connections
 from django.http import JsonResponse
+from django.shortcuts import render
 from django.utils import timezone
-from django.views.decorators.http import require_POST
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.http import quote_etag
+from django.views import View
+from django.views.decorators.http import require_GET, require_POST
 from django.views.generic import TemplateView
 
 from apps.gate.models import DailyEntry
 from apps.gate.services import calendar as calendar_service
 from apps.gate.services import index as index_service
+from apps.profiles.decorators import player_etag
+from apps.profiles.services.affinity import get_affinity
+from apps.profiles.services.player import get_player_etag
 
 
+@method_decorator(player_etag, name="dispatch")
 class IndexView(LoginRequiredMixin, TemplateView):
     """
     The 'Status Window' (Main Home Page).
@@ -21,40 +35,139 @@ class IndexView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
+        player = self.request.player
         today = timezone.now().date()
 
         # 1. Calendar Setup
         month_info = calendar_service.get_current_month_info()
 
-        # 2. Service Calls
-        player_context = index_service.get_player_stats(user)
-        sleep_data = index_service.get_sleep_data(user, month_info)
-        habit_context = index_service.get_habit_grid_context(
-            user, player_context["profile"], month_info
+        # 2. Service Calls & Simple Streak Data, merged
+        context.update(
+            get_index_context(
+                today,
+                month_info,
+                player_context=index_service.get_player_stats(player),
+                sleep_data=index_service.get_sleep_data(user, month_info),
+                habit_context=index_service.get_habit_grid_context(
+                    user, player, month_info
+                ),
+                calendar_data=calendar_service.get_jalali_calendar_context(user),
+                has_gate_log=DailyEntry.objects.filter(user=user, date=today).exists(),
+                streak_count=DailyEntry.objects.filter(user=user).count(),
+            )
         )
-        calendar_data = calendar_service.get_jalali_calendar_context(user)
 
-        # 3. Simple Streak Data
-        has_gate_log = DailyEntry.objects.filter(user=user, date=today).exists()
-        streak_count = DailyEntry.objects.filter(user=user).count()
+        return context
 
-        # 4. Merge Everything
-        context.update(
-            {
-                "today": today,
-                "has_gate_log": has_gate_log,
-                "streak": streak_count,
-                "month_days": month_info["month_days"],
-                "current_month_name": month_info["j_today"].strftime("%B"),
-                "current_day_number": month_info["j_today"].day,
-                "sleep_data": sleep_data,
-                **player_context,
-                **habit_context,
-                **calendar_data,
-            }
+
+def get_index_context(
+    today,
+    month_info,
+    *,
+    player_context,
+    sleep_data,
+    habit_context,
+    calendar_data,
+    has_gate_log,
+    streak_count,
+):
+    """Template context of the dashboard from its loaded sections."""
+    return {
+        "today": today,
+        "has_gate_log": has_gate_log,
+        "streak": streak_count,
+        "month_days": month_info["month_days"],
+        "current_month_name": month_info["j_today"].strftime("%B"),
+        "current_day_number": month_info["j_today"].day,
+        "sleep_data": sleep_data,
+        **player_context,
+        **habit_context,
+        **calendar_data,
+    }
+
+
+class AsyncIndexView(View):
+    """
+    Async variant of IndexView (same template and context).
+    The dashboard sections are independent, so they are loaded concurrently:
+    the response takes about as long as the slowest section, not their sum.
+    Served instead of IndexView when settings.ASYNC_DASHBOARD is on
+    (best under core/asgi.py).
+    Cost: a load holds settings.ASYNC_DASHBOARD_CONNECTIONS DB connections at
+    once (three threaded sections plus the async ORM's thread), which is why
+    ASYNC_DASHBOARD requires DB_POOL and sizes it.
+    """
+
+    template_name = IndexView.template_name
+
+    async def get(self, request, *args, **kwargs):
+        user = await request.auser()
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        player = await request.aplayer()
+
+        # Conditional GET: nothing changed since the last visit
+        etag = quote_etag(get_player_etag(request, player))
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            patch_cache_control(not_modified, private=True, no_cache=True)
+            return not_modified
+
+        today = timezone.now().date()
+        month_info = calendar_service.get_current_month_info()
+
+        player_context = index_service.get_player_stats(player)
+        (
+            sleep_data,
+            habit_context,
+            calendar_data,
+            has_gate_log,
+            streak_count,
+        ) = await asyncio.gather(
+            _in_thread(index_service.get_sleep_data, user, month_info),
+            _in_thread(index_service.get_habit_grid_context, user, player, month_info),
+            _in_thread(calendar_service.get_jalali_calendar_context, user),
+            DailyEntry.objects.filter(user=user, date=today).aexists(),
+            DailyEntry.objects.filter(user=user).acount(),
         )
 
-        return context
+        context = {
+            "view": self,
+            **get_index_context(
+                today,
+                month_info,
+                player_context=player_context,
+                sleep_data=sleep_data,
+                habit_context=habit_context,
+                calendar_data=calendar_data,
+                has_gate_log=has_gate_log,
+                streak_count=streak_count,
+            ),
+        }
+        # Context processors and templates are sync code
+        response = await sync_to_async(render)(request, self.template_name, context)
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+async def _in_thread(func, *args):
+    """
+    Runs a sync section in its own worker thread (and DB connection).
+    The async ORM runs every query on one shared thread, so only
+    thread_sensitive=False lets the sections really overlap.
+    The connection is taken from the pool and given back when the section ends;
+    without a pool it would be a new Postgres connection every time.
+    """
+
+    def run():
+        try:
+            return func(*args)
+        finally:
+            # Worker threads are reused: hand their connection back to the pool
+            connections.close_all()
+
+    return await sync_to_async(run, thread_sensitive=False)()
 
 
 @login_required
@@ -64,7 +177,7 @@ def toggle_habit_log(request, task_id, date_str):
     AJAX Endpoint: Toggles the completion status of a habit.
     """
     try:
-        data = index_service.perform_habit_toggle(request.user, task_id, date_str)
+        data = index_service.perform_habit_toggle(request.player, task_id, date_str)
         return JsonResponse(data)
     except ValueError as e:
         return JsonResponse({"error": str(e)}, status=400)
@@ -73,3 +186,13 @@ def toggle_habit_log(request, task_id, date_str):
         return JsonResponse(
             {"error": "An unexpected error occurred.", "details": str(e)}, status=500
         )
+
+
+@login_required
+@require_GET
+def affinity_data_view(request):
+    """
+    AJAX Endpoint: Returns the Affinity Chart data (current level & lifetime).
+    Reads the maintained counters, so the cost doesn't grow with history.
+    """
+    return JsonResponse(get_affinity(request.player.stats))
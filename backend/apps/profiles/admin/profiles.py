@@ -3,6 +3,7 @@ from unfold.admin import ModelAdmin, StackedInline
 
 from apps.profiles.admin.stats import PlayerStatsInline
 from apps.profiles.models import PlayerProfile
+from apps.tasks.services.deletion import purge_profile_logs
 
 
 class PlayerProfileInline(StackedInline):
@@ -36,3 +37,12 @@ class PlayerProfileAdmin(ModelAdmin):
         return f"{obj.xp_percent}%"
 
     xp_percent_display.short_description = "XP Progress"
+
+    def delete_model(self, request, obj):
+        # Drop the completion history in one statement before the cascade
+        purge_profile_logs([obj.pk])
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        purge_profile_logs(queryset.values("pk"))
+        super().delete_queryset(request, queryset)
@@ -0,0 +1,29 @@
+from functools import wraps
+
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from apps.profiles.services.player import get_player_etag
+
+
+def _request_player_etag(request, *args, **kwargs):
+    if not request.user.is_authenticated:
+        return None
+    return get_player_etag(request, request.player)
+
+
+def player_etag(view_func):
+    """
+    Conditional GET for pages built from the player's data.
+    Answers If-None-Match with a 304 before the view runs,
+    and makes browsers revalidate instead of reusing a stale page.
+    """
+    conditional_view = condition(etag_func=_request_player_etag)(view_func)
+
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        response = conditional_view(request, *args, **kwargs)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    return _wrapped_view
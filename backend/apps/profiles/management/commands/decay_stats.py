@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.profiles.services.decay import run_stat_decay
+
+
+class Command(BaseCommand):
+    help = (
+        "Applies daily stat decay ('Use it or lose it') to every player. "
+        "Safe to run several times a day; missed days are caught up."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            help="Process up to this date (YYYY-MM-DD). Defaults to today.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of PlayerStats rows updated per statement.",
+        )
+        parser.add_argument(
+            "--max-days",
+            type=int,
+            default=30,
+            help="Maximum number of missed days to catch up.",
+        )
+
+    def handle(self, *args, **options):
+        target_date = None
+        if options["date"]:
+            try:
+                target_date = datetime.strptime(options["date"], "%Y-%m-%d").date()
+            except ValueError:
+                raise CommandError("Invalid date format, expected YYYY-MM-DD.")
+
+        if options["batch_size"] < 1 or options["max_days"] < 1:
+            raise CommandError("--batch-size and --max-days must be positive.")
+
+        report = run_stat_decay(
+            target_date=target_date,
+            batch_size=options["batch_size"],
+            max_days=options["max_days"],
+        )
+
+        if not report:
+            self.stdout.write("Stat decay is already up to date.")
+            return
+
+        for day, decayed in report.items():
+            self.stdout.write(f"{day}: {decayed} stat(s) decayed")
+        self.stdout.write(self.style.SUCCESS("Stat decay applied."))
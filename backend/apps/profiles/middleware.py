@@ -0,0 +1,27 @@
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.functional import SimpleLazyObject
+
+from apps.profiles.services.player import get_player
+
+
+async def aplayer(request):
+    """Async counterpart of 'request.player' (like 'request.auser()')."""
+    if not hasattr(request, "_acached_player"):
+        user = await request.auser()
+        request._acached_player = await sync_to_async(get_player)(user)
+    return request._acached_player
+
+
+class PlayerMiddleware(MiddlewareMixin):
+    """
+    Adds 'request.player': the user's PlayerProfile with its stats,
+    loaded lazily with one query and shared by everything in the request.
+    Must come after AuthenticationMiddleware.
+    """
+
+    def process_request(self, request):
+        request.player = SimpleLazyObject(lambda: get_player(request.user))
+        request.aplayer = partial(aplayer, request)
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:34
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Q, Subquery
+
+
+def backfill_last_gain(apps, schema_editor):
+    """Seeds each stat's decay clock from the latest completion that rewarded it."""
+    PlayerStats = apps.get_model('profiles', 'PlayerStats')
+    TaskLog = apps.get_model('tasks', 'TaskLog')
+
+    for stat in ['STR', 'INT', 'CHA', 'WIL', 'WIS']:
+        latest_gain = (
+            TaskLog.objects.filter(task__profile=OuterRef('profile'))
+            .filter(Q(task__primary_stat=stat) | Q(task__secondary_stat=stat))
+            .values('task__profile')
+            .annotate(last=Max('completed_at'))
+            .values('last')
+        )
+        PlayerStats.objects.update(
+            **{f'{stat.lower()}_last_gain_at': Subquery(latest_gain)}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0001_initial'),
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playerstats',
+            name='cha_last_gain_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Charisma Last Gain'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='decay_applied_on',
+            field=models.DateField(blank=True, editable=False, null=True, verbose_name='Decay Applied On'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='int_last_gain_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Intellect Last Gain'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='str_last_gain_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Physique Last Gain'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='wil_last_gain_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Discipline Last Gain'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='wis_last_gain_at',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='Psyche Last Gain'),
+        ),
+        migrations.RunPython(backfill_last_gain, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,104 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:35
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+STAT_KEYS = ['STR', 'INT', 'CHA', 'WIL', 'WIS']
+
+
+def backfill_affinity(apps, schema_editor):
+    """
+    Seeds the Affinity counters from history with one grouped query.
+    The 'this level' share can't be reconstructed, so it is estimated
+    from the lifetime build scaled to the current level's XP.
+    """
+    PlayerStats = apps.get_model('profiles', 'PlayerStats')
+    TaskLog = apps.get_model('tasks', 'TaskLog')
+
+    totals = {}
+    rows = TaskLog.objects.values(
+        'task__profile', 'task__primary_stat', 'task__secondary_stat'
+    ).annotate(xp=Sum('xp_earned'))
+
+    for row in rows:
+        profile_totals = totals.setdefault(row['task__profile'], dict.fromkeys(STAT_KEYS, 0))
+        primary, secondary, xp = row['task__primary_stat'], row['task__secondary_stat'], row['xp'] or 0
+
+        if not secondary or secondary == primary:
+            profile_totals[primary] += xp
+        else:
+            # Same 60/40 split as Task.xp_distribution
+            profile_totals[primary] += xp * 6 // 10
+            profile_totals[secondary] += xp - xp * 6 // 10
+
+    for stats in PlayerStats.objects.filter(profile__in=totals.keys()).select_related('profile'):
+        profile_totals = totals[stats.profile_id]
+        grand_total = sum(profile_totals.values())
+        for key, xp in profile_totals.items():
+            prefix = key.lower()
+            setattr(stats, f'{prefix}_affinity_lifetime', xp)
+            if grand_total:
+                setattr(stats, f'{prefix}_affinity_level', xp * stats.profile.xp_current // grand_total)
+        stats.save()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0002_stat_decay_tracking'),
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='playerstats',
+            name='cha_affinity_level',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Charisma XP This Level'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='cha_affinity_lifetime',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Charisma Lifetime XP'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='int_affinity_level',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Intellect XP This Level'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='int_affinity_lifetime',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Intellect Lifetime XP'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='str_affinity_level',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Physique XP This Level'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='str_affinity_lifetime',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Physique Lifetime XP'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='wil_affinity_level',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Discipline XP This Level'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='wil_affinity_lifetime',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Discipline Lifetime XP'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='wis_affinity_level',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Psyche XP This Level'),
+        ),
+        migrations.AddField(
+            model_name='playerstats',
+            name='wis_affinity_lifetime',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='Psyche Lifetime XP'),
+        ),
+        migrations.RunPython(backfill_affinity, migrations.RunPython.noop),
+    ]
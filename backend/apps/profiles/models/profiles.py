@@ -51,6 +51,10 @@ class PlayerProfile(models.Model):
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
 
+    # Bumped whenever the player's pages change without saving the profile
+    # (tasks, schedules, daily entries). Part of the pages' ETag.
+    data_version = models.PositiveBigIntegerField(default=0, editable=False)
+
     def __str__(self):
         return f"Level {self.level} | {self.user.username}"
 
@@ -35,6 +35,67 @@ class PlayerStats(models.Model):
     wis_level = models.PositiveIntegerField(_("Psyche Level"), default=1)
     wis_xp = models.PositiveIntegerField(_("Psyche XP"), default=0)
 
+    # --- Decay Tracking ("Use it or lose it") ---
+    # Last moment each stat received XP. Stats idle for too long start decaying.
+    str_last_gain_at = models.DateTimeField(
+        _("Physique Last Gain"), blank=True, null=True
+    )
+    int_last_gain_at = models.DateTimeField(
+        _("Intellect Last Gain"), blank=True, null=True
+    )
+    cha_last_gain_at = models.DateTimeField(
+        _("Charisma Last Gain"), blank=True, null=True
+    )
+    wil_last_gain_at = models.DateTimeField(
+        _("Discipline Last Gain"), blank=True, null=True
+    )
+    wis_last_gain_at = models.DateTimeField(
+        _("Psyche Last Gain"), blank=True, null=True
+    )
+
+    # Last day the decay job processed this row (prevents double decay on re-runs)
+    decay_applied_on = models.DateField(
+        _("Decay Applied On"), blank=True, null=True, editable=False
+    )
+
+    # --- Affinity Counters ---
+    # XP earned per stat, lifetime and since the last (general) Level Up.
+    # Maintained with every reward so the Affinity Chart never scans TaskLog.
+    str_affinity_lifetime = models.PositiveBigIntegerField(
+        _("Physique Lifetime XP"), default=0, editable=False
+    )
+    str_affinity_level = models.PositiveIntegerField(
+        _("Physique XP This Level"), default=0, editable=False
+    )
+
+    int_affinity_lifetime = models.PositiveBigIntegerField(
+        _("Intellect Lifetime XP"), default=0, editable=False
+    )
+    int_affinity_level = models.PositiveIntegerField(
+        _("Intellect XP This Level"), default=0, editable=False
+    )
+
+    cha_affinity_lifetime = models.PositiveBigIntegerField(
+        _("Charisma Lifetime XP"), default=0, editable=False
+    )
+    cha_affinity_level = models.PositiveIntegerField(
+        _("Charisma XP This Level"), default=0, editable=False
+    )
+
+    wil_affinity_lifetime = models.PositiveBigIntegerField(
+        _("Discipline Lifetime XP"), default=0, editable=False
+    )
+    wil_affinity_level = models.PositiveIntegerField(
+        _("Discipline XP This Level"), default=0, editable=False
+    )
+
+    wis_affinity_lifetime = models.PositiveBigIntegerField(
+        _("Psyche Lifetime XP"), default=0, editable=False
+    )
+    wis_affinity_level = models.PositiveIntegerField(
+        _("Psyche XP This Level"), default=0, editable=False
+    )
+
     # --- Timestamps ---
     created_at = models.DateTimeField(_("Created At"), auto_now_add=True)
     updated_at = models.DateTimeField(_("Updated At"), auto_now=True)
@@ -0,0 +1,27 @@
+from apps.profiles.models import PlayerStats
+
+
+def get_affinity(stats: PlayerStats):
+    """
+    Builds the Affinity Chart data from the maintained counters (no TaskLog scan).
+    Returns raw XP and percentages for the current level and lifetime.
+    """
+    labels = PlayerStats.StatType.values  # ["STR", "INT", "CHA", "WIL", "WIS"]
+
+    level_xp = [getattr(stats, f"{key.lower()}_affinity_level") for key in labels]
+    lifetime_xp = [getattr(stats, f"{key.lower()}_affinity_lifetime") for key in labels]
+
+    return {
+        "labels": labels,
+        "current_level": _to_percentages(level_xp),
+        "lifetime": _to_percentages(lifetime_xp),
+        "current_level_xp": level_xp,
+        "lifetime_xp": lifetime_xp,
+    }
+
+
+def _to_percentages(values):
+    total = sum(values)
+    if not total:
+        return [0 for _ in values]
+    return [round(value * 100 / total, 1) for value in values]
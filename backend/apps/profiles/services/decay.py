@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Case, F, FloatField, IntegerField, Max, Min, Q, Value, When
+from django.db.models.functions import Ceil, Now, Power
+from django.utils import timezone
+
+from apps.profiles.models import PlayerStats
+
+# Scenario: "If 10 days has passed and you have not done any tasks for a stat,
+# from day 11 till you do a task for that stat your stat's xp will be reduced."
+DECAY_GRACE_DAYS = 10
+# 10% of the current level's required XP per day
+DECAY_RATE_PERCENT = 10
+
+STAT_PREFIXES = [stat.lower() for stat in PlayerStats.StatType.values]
+
+
+def xp_required_expression(level):
+    """
+    SQL mirror of PlayerStats.get_xp_required():
+    ceil( (100 * (1.06)^L * L) / 100 ) * 100  ==  ceil( 1.06^L * L ) * 100
+    """
+    return Ceil(
+        Power(Value(1.06), level, output_field=FloatField()) * level,
+        output_field=IntegerField(),
+    ) * Value(100)
+
+
+def decay_amount_expression(level):
+    """Daily decay: DECAY_RATE_PERCENT of the current level's required XP."""
+    return xp_required_expression(level) * Value(DECAY_RATE_PERCENT) / Value(100)
+
+
+def start_of_day(date_obj):
+    """Aware datetime for 00:00 of the given date in the current timezone."""
+    return timezone.make_aware(datetime.combine(date_obj, datetime.min.time()))
+
+
+def get_pending_days(target_date, max_days):
+    """
+    Returns the list of days that still need processing, oldest first.
+    Resumes from the oldest 'decay_applied_on' so missed runs are caught up,
+    but never reaches back more than 'max_days'.
+    """
+    last_applied = PlayerStats.objects.aggregate(last=Min("decay_applied_on"))["last"]
+
+    if last_applied is None:
+        first_day = target_date
+    else:
+        first_day = last_applied + timedelta(days=1)
+
+    first_day = max(first_day, target_date - timedelta(days=max_days - 1))
+
+    days = []
+    current = first_day
+    while current <= target_date:
+        days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def get_id_batches(batch_size):
+    """Yields (low, high) primary key ranges covering every PlayerStats row."""
+    bounds = PlayerStats.objects.aggregate(low=Min("pk"), high=Max("pk"))
+    if bounds["low"] is None:
+        return
+
+    low = bounds["low"]
+    while low <= bounds["high"]:
+        high = low + batch_size - 1
+        yield low, high
+        low = high + 1
+
+
+def apply_decay_for_day(day, id_range):
+    """
+    Applies one day of decay to every idle stat of the rows in 'id_range'.
+    Runs one UPDATE per stat plus one UPDATE to mark the day as processed.
+    Returns the number of decayed stats.
+    """
+    low, high = id_range
+    pending = PlayerStats.objects.filter(pk__gte=low, pk__lte=high).filter(
+        Q(decay_applied_on__lt=day) | Q(decay_applied_on__isnull=True)
+    )
+    # Last gain before this moment means the stat is past its grace period
+    idle_cutoff = start_of_day(day - timedelta(days=DECAY_GRACE_DAYS))
+
+    decayed = 0
+    with transaction.atomic():
+        for prefix in STAT_PREFIXES:
+            level = F(f"{prefix}_level")
+            xp = F(f"{prefix}_xp")
+            amount = decay_amount_expression(level)
+
+            # Decay never exceeds the previous level's requirement,
+            # so a single de-level per day is enough.
+            decayed += pending.filter(
+                **{f"{prefix}_last_gain_at__lt": idle_cutoff}
+            ).update(
+                **{
+                    f"{prefix}_xp": Case(
+                        When(**{f"{prefix}_xp__gte": amount}, then=xp - amount),
+                        When(
+                            **{f"{prefix}_level__gt": 1},
+                            then=xp - amount + xp_required_expression(level - 1),
+                        ),
+                        default=Value(0),
+                    ),
+                    f"{prefix}_level": Case(
+                        When(**{f"{prefix}_xp__gte": amount}, then=level),
+                        When(**{f"{prefix}_level__gt": 1}, then=level - 1),
+                        default=Value(1),
+                    ),
+                    "updated_at": Now(),
+                }
+            )
+
+        pending.update(decay_applied_on=day)
+
+    return decayed
+
+
+def run_stat_decay(target_date=None, batch_size=1000, max_days=30):
+    """
+    Processes every pending day up to 'target_date' for all players.
+    Returns a dict of {day: decayed_stats_count}.
+    """
+    if target_date is None:
+        target_date = timezone.localdate()
+
+    days = get_pending_days(target_date, max_days)
+    report = {day: 0 for day in days}
+
+    for id_range in get_id_batches(batch_size):
+        for day in days:
+            report[day] += apply_decay_for_day(day, id_range)
+
+    return report
@@ -0,0 +1,64 @@
+import hashlib
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from apps.profiles.models import PlayerProfile, PlayerStats
+
+
+def get_player(user):
+    """
+    Loads the player state (profile + stats) of a user with a single query.
+    Missing rows are created. Both directions of the user <-> profile relation
+    are cached, so 'user.profile' and 'profile.user' don't hit the database.
+    Returns None for anonymous users.
+    """
+    if not user.is_authenticated:
+        return None
+
+    profile = PlayerProfile.objects.select_related("stats").filter(user=user).first()
+    if profile is None:
+        profile, _ = PlayerProfile.objects.get_or_create(user=user)
+
+    if not hasattr(profile, "stats"):
+        profile.stats, _ = PlayerStats.objects.get_or_create(profile=profile)
+
+    user_field = PlayerProfile._meta.get_field("user")
+    user_field.set_cached_value(profile, user)
+    user_field.remote_field.set_cached_value(user, profile)
+    return profile
+
+
+def reload_player(profile):
+    """Fresh copy of a profile and its stats (one query), e.g. after a reward."""
+    fresh = PlayerProfile.objects.select_related("stats").get(pk=profile.pk)
+    if PlayerProfile.user.is_cached(profile):
+        PlayerProfile.user.field.set_cached_value(fresh, profile.user)
+    return fresh
+
+
+def bump_data_version(**filters):
+    """Marks the matching players' data as changed (invalidates their page ETags)."""
+    PlayerProfile.objects.filter(**filters).update(data_version=F("data_version") + 1)
+
+
+def get_player_etag(request, player):
+    """
+    Watermark of everything a player's page shows.
+    - data_version: tasks, schedules, daily entries (see profiles/signals.py)
+    - profile/stats 'updated_at': rewards, edits and the decay job
+    - the date: pages are built around 'today'
+    - the CSRF secret: a cached page must carry a valid token
+    - APP_VERSION: a deploy may change the templates
+    """
+    parts = [
+        player.pk,
+        player.data_version,
+        player.updated_at.isoformat(),
+        player.stats.updated_at.isoformat(),
+        timezone.now().date().isoformat(),
+        request.META.get("CSRF_COOKIE", ""),
+        settings.APP_VERSION,
+    ]
+    return hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
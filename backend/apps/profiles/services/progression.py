@@ -0,0 +1,171 @@
+from apps.profiles.models import PlayerProfile, PlayerStats
+
+
+def grant_xp(
+    profile: PlayerProfile,
+    stats: PlayerStats,
+    xp_amount: int,
+    distribution: dict,
+    gained_at=None,
+):
+    """
+    Applies a reward to the Player.
+    - Profile: general XP and Level Up.
+    - Stats: attribute XP, decay clock and Affinity counters.
+    'gained_at' is a datetime, or a dict of {stat_key: datetime} for batched rewards.
+    The caller is responsible for saving both objects.
+    """
+    # --- 1. Profile (Level Up) ---
+    profile.xp_current += xp_amount
+
+    levels_gained = 0
+    while profile.xp_current >= profile.xp_required:
+        profile.xp_current -= profile.xp_required
+        profile.level += 1
+        levels_gained += 1
+        # TODO: Add Notification logic here
+
+    # --- 2. Stats (Attribute Growth) ---
+    for stat_key, stat_xp in distribution.items():
+        stat_gained_at = gained_at
+        if isinstance(gained_at, dict):
+            stat_gained_at = gained_at.get(stat_key)
+        award_stat_xp(stats, stat_key, stat_xp, gained_at=stat_gained_at)
+
+    # --- 3. Affinity ---
+    record_affinity(
+        stats,
+        distribution,
+        reset_level=levels_gained > 0,
+        carried_xp=profile.xp_current,
+        total_xp=xp_amount,
+    )
+
+
+def revoke_xp(
+    profile: PlayerProfile, stats: PlayerStats, xp_amount: int, distribution: dict
+):
+    """
+    Reverts a reward previously applied with grant_xp().
+    The caller is responsible for saving both objects.
+    """
+    # --- 1. Profile (Level Down) ---
+    profile.xp_current -= xp_amount
+
+    # Handle Level Down if XP goes negative
+    while profile.xp_current < 0:
+        if profile.level <= 1:
+            profile.level = 1
+            profile.xp_current = 0
+            break
+
+        # Drop a level
+        profile.level -= 1
+        # Add the capacity of the *lower* level to the negative balance
+        # (e.g., -10 XP + 50 XP Max = 40 XP in the lower level)
+        profile.xp_current += profile.xp_required
+
+    # --- 2. Stats ---
+    for stat_key, stat_xp in distribution.items():
+        revoke_stat_xp(stats, stat_key, stat_xp)
+
+    # --- 3. Affinity ---
+    revoke_affinity(stats, distribution)
+
+
+def award_stat_xp(stats: PlayerStats, stat_key: str, amount: int, gained_at=None):
+    """
+    Helper to add XP to a specific stat (STR, INT, etc) and handle leveling.
+    If 'gained_at' is given, it refreshes the stat's decay clock.
+    """
+    prefix = stat_key.lower()  # STR -> str
+    level_field = f"{prefix}_level"
+    xp_field = f"{prefix}_xp"
+    last_gain_field = f"{prefix}_last_gain_at"
+
+    if not hasattr(stats, level_field) or not hasattr(stats, xp_field):
+        return
+
+    current_level = getattr(stats, level_field)
+    current_xp = getattr(stats, xp_field)
+
+    current_xp += amount
+
+    # Calculate Required XP for NEXT level using the model's method
+    required_xp = stats.get_xp_required(current_level)
+
+    while current_xp >= required_xp:
+        current_xp -= required_xp
+        current_level += 1
+        required_xp = stats.get_xp_required(current_level)
+
+    setattr(stats, level_field, current_level)
+    setattr(stats, xp_field, current_xp)
+
+    # Keep the most recent gain (back-filled logs must not rewind the clock)
+    if gained_at is not None:
+        last_gain = getattr(stats, last_gain_field)
+        if last_gain is None or gained_at > last_gain:
+            setattr(stats, last_gain_field, gained_at)
+
+
+def revoke_stat_xp(stats: PlayerStats, stat_key: str, amount: int):
+    """
+    Helper to remove XP from a specific stat and handle de-leveling.
+    """
+    prefix = stat_key.lower()
+    level_field = f"{prefix}_level"
+    xp_field = f"{prefix}_xp"
+
+    if not hasattr(stats, level_field) or not hasattr(stats, xp_field):
+        return
+
+    current_level = getattr(stats, level_field)
+    current_xp = getattr(stats, xp_field)
+
+    current_xp -= amount
+
+    # Handle De-Leveling
+    while current_xp < 0:
+        if current_level <= 1:
+            current_level = 1
+            current_xp = 0
+            break
+
+        current_level -= 1
+        # Get requirement of the *new* (lower) level to add back
+        req_xp = stats.get_xp_required(current_level)
+        current_xp += req_xp
+
+    setattr(stats, level_field, current_level)
+    setattr(stats, xp_field, current_xp)
+
+
+def record_affinity(stats, distribution, reset_level, carried_xp, total_xp):
+    """
+    Adds a reward to the Affinity counters.
+    On Level Up, the 'this level' counters restart with only the share
+    of the reward that carried over into the new level.
+    """
+    for stat_key in PlayerStats.StatType.values:
+        prefix = stat_key.lower()
+        amount = distribution.get(stat_key, 0)
+
+        lifetime_field = f"{prefix}_affinity_lifetime"
+        setattr(stats, lifetime_field, getattr(stats, lifetime_field) + amount)
+
+        level_field = f"{prefix}_affinity_level"
+        if reset_level:
+            carried = amount * carried_xp // total_xp if total_xp else 0
+            setattr(stats, level_field, carried)
+        else:
+            setattr(stats, level_field, getattr(stats, level_field) + amount)
+
+
+def revoke_affinity(stats, distribution):
+    """Removes a reward from the Affinity counters (never below zero)."""
+    for stat_key, amount in distribution.items():
+        prefix = stat_key.lower()
+        for field in (f"{prefix}_affinity_lifetime", f"{prefix}_affinity_level"):
+            if hasattr(stats, field):
+                setattr(stats, field, max(0, getattr(stats, field) - amount))
@@ -1,8 +1,10 @@
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from apps.profiles.models import PlayerProfile, PlayerStats
+from apps.profiles.services.player import bump_data_version
+from core.db import is_cascade
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
@@ -17,3 +19,39 @@ def create_user_profile(sender, instance, created, **kwargs):
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def save_user_profile(sender, instance, **kwargs):
     instance.profile.save()
+
+
+# --- Data Version (page ETags) ---
+# Changes that don't save the profile itself bump its 'data_version'.
+
+
+@receiver(post_save, sender="tasks.Task")
+@receiver(post_delete, sender="tasks.Task")
+def bump_on_task_change(sender, instance, **kwargs):
+    # Bulk deletes go through delete_tasks(), which bumps once for all rows
+    origin = kwargs.get("origin")
+    if origin is not None and origin is not instance:
+        return
+    bump_data_version(pk=instance.profile_id)
+
+
+@receiver(post_save, sender="tasks.TaskSchedule")
+@receiver(post_delete, sender="tasks.TaskSchedule")
+def bump_on_schedule_change(sender, instance, **kwargs):
+    bump_data_version(tasks__pk=instance.task_id)
+
+
+@receiver(post_save, sender="gate.DailyEntry")
+@receiver(post_delete, sender="gate.DailyEntry")
+def bump_on_daily_entry_change(sender, instance, **kwargs):
+    if is_cascade(instance, kwargs.get("origin")):
+        return
+    bump_data_version(user_id=instance.user_id)
+
+
+@receiver(post_save, sender="gate.DailyHighlight")
+@receiver(post_delete, sender="gate.DailyHighlight")
+def bump_on_highlight_change(sender, instance, **kwargs):
+    if is_cascade(instance, kwargs.get("origin")):
+        return
+    bump_data_version(user__day_pages__pk=instance.entry_id)
@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.profiles.services.decay import start_of_day
+from apps.tasks.tests.utils import make_player
+
+TODAY = date(2025, 10, 20)
+
+
+class StatDecayTests(TestCase):
+    def setUp(self):
+        self.stats = make_player("idle").stats
+        # Level 2 requires 300 XP: 30 XP decay per day
+        self.stats.str_level = 2
+        self.stats.str_xp = 1000
+        self.stats.str_last_gain_at = start_of_day(TODAY - timedelta(days=90))
+        self.stats.int_xp = 1000
+        self.stats.int_last_gain_at = start_of_day(TODAY)
+        self.stats.save()
+
+    def decay(self, *args):
+        out = StringIO()
+        call_command("decay_stats", "--date", str(TODAY), *args, stdout=out)
+        self.stats.refresh_from_db()
+        return out.getvalue()
+
+    def test_catch_up_is_bounded_by_max_days(self):
+        self.stats.decay_applied_on = TODAY - timedelta(days=60)
+        self.stats.save()
+
+        out = self.decay("--max-days", "5")
+
+        self.assertEqual(out.count("stat(s) decayed"), 5)
+        self.assertIn(f"{TODAY - timedelta(days=4)}: 1 stat(s) decayed", out)
+        self.assertEqual(self.stats.str_xp, 1000 - 5 * 30)
+        self.assertEqual(self.stats.int_xp, 1000)
+        self.assertEqual(self.stats.decay_applied_on, TODAY)
+
+    def test_catch_up_resumes_after_the_last_run(self):
+        self.stats.decay_applied_on = TODAY - timedelta(days=2)
+        self.stats.save()
+
+        self.decay("--max-days", "30")
+
+        self.assertEqual(self.stats.str_xp, 1000 - 2 * 30)
+
+    def test_rerun_does_not_decay_twice(self):
+        self.decay()
+        xp = self.stats.str_xp
+
+        out = self.decay()
+
+        self.assertIn("already up to date", out)
+        self.assertEqual(self.stats.str_xp, xp)
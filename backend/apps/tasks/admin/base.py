@@ -1,8 +1,21 @@
+from django.contrib import messages
+from django.contrib.admin import helpers
+from django.contrib.admin.utils import unquote
+from django.core.exceptions import PermissionDenied
 from django.db.models import Count
+from django.http import Http404
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+from django.utils import timezone
 from django.utils.html import format_html
 from unfold.admin import ModelAdmin
 
-from apps.tasks.forms import TaskForm
+from apps.tasks.admin.forms import TaskForm
+from apps.tasks.models import TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.deletion import delete_tasks, get_deletion_summary
+from apps.tasks.services.history import get_task_history
+from apps.tasks.services.partitions import completed_on
 
 
 class BaseTaskAdmin(ModelAdmin):
@@ -17,6 +30,7 @@ class BaseTaskAdmin(ModelAdmin):
         "created_at",
         "updated_at",
         "xp_distribution_display",
+        "completion_history_display",
     ]
 
     fieldsets = (
@@ -45,8 +59,17 @@ class BaseTaskAdmin(ModelAdmin):
                 "classes": ("collapse",),
             },
         ),
+        (
+            "Completion History",
+            {
+                "fields": ("completion_history_display",),
+                "classes": ("collapse",),
+            },
+        ),
     )
 
+    actions = ["complete_today", "uncomplete_today", "delete_and_revoke_xp"]
+
     class Media:
         js = ("js/admin_tasks.js",)
 
@@ -58,24 +81,144 @@ class BaseTaskAdmin(ModelAdmin):
         if not obj.pk:  # If creating a new object
             # Assumes the logged-in user has a PlayerProfile created
             # If not, this will raise an error (which is good, admins need profiles)
-            obj.profile = request.user.profile
+            obj.profile = request.player
         super().save_model(request, obj, form, change)
 
     def save_formset(self, request, form, formset, change):
         """
         Inject the user profile into Inlines (like Subtasks) before saving.
         """
+        if formset.model is TaskLog:
+            return self.save_log_formset(formset)
+
         instances = formset.save(commit=False)
         for instance in instances:
             # Check if the inline instance needs a profile (e.g., it's a Subtask)
             if hasattr(instance, "profile_id") and not instance.profile_id:
                 # Inherit profile from the parent task, or fallback to current user
                 parent_profile = getattr(formset.instance, "profile", None)
-                instance.profile = parent_profile or request.user.profile
+                instance.profile = parent_profile or request.player
 
             instance.save()
         formset.save_m2m()
 
+    def save_log_formset(self, formset):
+        """
+        Completion History edits go through the completion service:
+        new rows are completions at their entered time, deleted rows are undone.
+        Saved rows are read-only (see TaskLogInlineForm), so nothing else changes.
+        """
+        instances = formset.save(commit=False)
+        new_logs = [log for log in instances if log.pk is None]
+        for log in new_logs:
+            log.task = formset.instance
+        completion.save_completions(new_logs)
+
+        deleted_ids = [log.pk for log in formset.deleted_objects]
+        if deleted_ids:
+            completion.uncomplete_many(TaskLog.objects.filter(pk__in=deleted_ids))
+
+    def complete_today(self, request, queryset):
+        logs = completion.complete_many(list(queryset))
+        self.message_user(
+            request, f"Completed {len(logs)} task(s).", messages.SUCCESS
+        )
+
+    complete_today.short_description = "Mark selected as completed now"
+
+    def uncomplete_today(self, request, queryset):
+        removed = completion.uncomplete_many(
+            TaskLog.objects.filter(
+                task__in=queryset, **completed_on(timezone.localdate())
+            )
+        )
+        self.message_user(
+            request, f"Undid {removed} completion(s) from today.", messages.SUCCESS
+        )
+
+    uncomplete_today.short_description = "Undo today's completion of selected"
+
+    def delete_model(self, request, obj):
+        """
+        Fast cascade: the completion history is dropped in one statement.
+        Earned XP is kept (use the 'revoke XP' action to take it back).
+        """
+        delete_tasks(obj._meta.model.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        delete_tasks(queryset)
+
+    def delete_and_revoke_xp(self, request, queryset):
+        """
+        Deletes the selected tasks and reverts all XP their history granted.
+        Irreversible: a confirmation page comes first, like 'delete_selected'.
+        """
+        if request.POST.get("post"):
+            count = len(queryset)
+            self.log_deletions(request, queryset)
+            deleted_logs = delete_tasks(queryset, revoke_xp=True)
+            self.message_user(
+                request,
+                f"Deleted {count} task(s) and revoked the XP of "
+                f"{deleted_logs} completion(s).",
+                messages.SUCCESS,
+            )
+            # None: back to the change list
+            return None
+
+        request.current_app = self.admin_site.name
+        return TemplateResponse(
+            request,
+            "admin/tasks/delete_and_revoke_confirmation.html",
+            {
+                **self.admin_site.each_context(request),
+                "title": "Delete and revoke XP",
+                "opts": self.opts,
+                "queryset": queryset,
+                "summary": get_deletion_summary(queryset),
+                "action_checkbox_name": helpers.ACTION_CHECKBOX_NAME,
+                "media": self.media,
+            },
+        )
+
+    delete_and_revoke_xp.short_description = "Delete selected and revoke their XP"
+    delete_and_revoke_xp.allowed_permissions = ("delete",)
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        urls = [
+            path(
+                "<path:object_id>/completions/",
+                self.admin_site.admin_view(self.completion_history_view),
+                name="%s_%s_completions" % info,
+            ),
+        ]
+        # Before the defaults: their '<path:object_id>/' catch-all would match first
+        return urls + super().get_urls()
+
+    def completion_history_view(self, request, object_id):
+        """
+        HTML fragment for the 'Completion History' panel, loaded on demand.
+        The first page comes with the monthly summary, next ones only with rows.
+        """
+        task = self.get_object(request, unquote(object_id))
+        if task is None:
+            raise Http404
+        if not self.has_view_permission(request, task):
+            raise PermissionDenied
+
+        history = get_task_history(task, cursor=request.GET.get("cursor"))
+        return TemplateResponse(
+            request,
+            "admin/tasks/completion_history.html",
+            {
+                **history,
+                "task": task,
+                "rows_only": "cursor" in request.GET,
+                "history_url": request.path,
+            },
+        )
+
     def get_queryset(self, request):
         """Optimize queries for all children"""
         qs = super().get_queryset(request)
@@ -86,6 +229,7 @@ class BaseTaskAdmin(ModelAdmin):
         return f"{obj.xp_reward} XP"
 
     xp_reward_display.short_description = "Total XP"
+    xp_reward_display.admin_order_field = "reward_xp"
 
     def computed_rank_display(self, obj):
         # We wrap the value in a span with a specific class/ID so JS can find it
@@ -119,6 +263,21 @@ class BaseTaskAdmin(ModelAdmin):
     xp_distribution_display.short_description = "XP Split (Preview)"
     xp_distribution_display.allow_tags = True
 
+    def completion_history_display(self, obj):
+        """Placeholder filled by admin_tasks.js with the history panel when opened."""
+        if not obj.pk:
+            return "-"
+
+        info = self.opts.app_label, self.opts.model_name
+        return format_html(
+            '<div id="completion-history-panel" data-history-url="{}">'
+            '<button type="button" class="btn btn-secondary btn-sm">Load history</button>'
+            "</div>",
+            reverse("admin:%s_%s_completions" % info, args=[obj.pk]),
+        )
+
+    completion_history_display.short_description = "History"
+
     def subtask_count_display(self, obj):
         return obj.subtask_count
 
@@ -15,11 +15,11 @@ class HabitAdmin(BaseTaskAdmin):
     list_display = [
         "title",
         "frequency_display",  # Custom for Habits
-        "final_rank",
+        "rank",
         "xp_reward_display",
         "is_active",
     ]
-    list_filter = ["schedule__frequency", "is_active", "primary_stat"]
+    list_filter = ["schedule__frequency", "is_active", "primary_stat", "rank"]
 
     # Habits MUST have a schedule editor
     inlines = [TaskScheduleInline, SubTaskInline, TaskLogInline]
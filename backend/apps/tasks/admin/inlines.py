@@ -1,10 +1,11 @@
 from django import forms
 from django.db import models
+from django.forms.models import BaseInlineFormSet
 from django.urls import reverse
 from django.utils.html import format_html
 from unfold.admin import StackedInline, TabularInline
 
-from apps.tasks.forms import TaskScheduleAdminForm
+from apps.tasks.admin.forms import TaskLogInlineForm, TaskScheduleAdminForm
 from apps.tasks.models import Task, TaskLog, TaskSchedule
 
 
@@ -64,18 +65,53 @@ class SubTaskInline(TabularInline):
     edit_link.short_description = "Actions"
 
 
+class RecentTaskLogFormSet(BaseInlineFormSet):
+    """
+    Only the most recent logs of the Task, so the page doesn't grow with its history.
+    The full history is in the lazily loaded 'Completion History' panel.
+    """
+
+    recent_limit = 10
+
+    def get_queryset(self):
+        if not hasattr(self, "_recent_logs"):
+            logs = super().get_queryset()
+            if self.is_bound:
+                # The rows that were rendered (new completions may have shifted the window)
+                logs = logs.filter(pk__in=self.get_submitted_pks())
+            else:
+                logs = logs[: self.recent_limit]
+
+            for log in logs:
+                log.task = self.instance  # __str__ needs it, skip the query per row
+            self._recent_logs = logs
+        return self._recent_logs
+
+    def get_submitted_pks(self):
+        pk_name = self.model._meta.pk.name
+        return [
+            pk
+            for i in range(self.initial_form_count())
+            if (pk := self.data.get(f"{self.add_prefix(i)}-{pk_name}"))
+        ]
+
+
 class TaskLogInline(TabularInline):
     """
-    Shows the history of this task (when it was completed).
+    Shows the latest completions of this task (older ones are in the history panel).
     """
 
     model = TaskLog
+    formset = RecentTaskLogFormSet
     extra = 0
     can_delete = True
-    readonly_fields = ["completed_at", "xp_earned"]
-    ordering = ("-completed_at",)
-    verbose_name = "Completion History"
-    verbose_name_plural = "Completion History"
+    form = TaskLogInlineForm
+    # The reward snapshot is what undo reverts: never edited by hand
+    fields = ["completed_at", *TaskLog.REWARD_FIELDS]
+    readonly_fields = TaskLog.REWARD_FIELDS
+    ordering = ("-completed_at", "-id")
+    verbose_name = "Recent Completion"
+    verbose_name_plural = "Recent Completions"
     classes = ["collapse"]
 
 
@@ -14,13 +14,13 @@ class OneTimeTaskAdmin(BaseTaskAdmin):
 
     list_display = [
         "title",
-        "final_rank",
+        "rank",
         "stats_display",
         "xp_reward_display",
         "subtask_count_display",
         "is_active",
     ]
-    list_filter = ["is_active", "primary_stat", "computed_rank"]
+    list_filter = ["is_active", "primary_stat", "rank"]
 
     # We still allow TaskScheduleInline.
     # If user fills it, the task will technically 'move' to the Habit view after save.
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.profiles.models import PlayerProfile
+from apps.tasks.services.compaction import COMPACT_AFTER_DAYS, compact_logs, get_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Folds the old task logs into per-task monthly summaries "
+        "(completed days and XP totals), whole months only. "
+        "Rewards, rollups and heatmaps are unchanged. Run it monthly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "usernames", nargs="*", help="Players to compact. Defaults to everyone."
+        )
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=COMPACT_AFTER_DAYS,
+            help="Compact the months that ended more than N days ago.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be compacted without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than"] < 1:
+            raise CommandError("--older-than must be positive.")
+        before = get_cutoff(options["older_than"])
+
+        if options["usernames"]:
+            profiles = PlayerProfile.objects.filter(
+                user__username__in=options["usernames"]
+            ).order_by("pk")
+        else:
+            profiles = [None]  # Everyone at once: one pass per month
+
+        totals = {"months": 0, "logs": 0, "summaries": 0}
+        for profile in profiles:
+            result = compact_logs(before, profile=profile, dry_run=options["dry_run"])
+            for key, count in result.items():
+                totals[key] += count
+
+        summary = (
+            f"{totals['logs']} logs of {totals['months']} month(s) before "
+            f"{before:%Y-%m} into {totals['summaries']} summaries."
+        )
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run: {summary}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Compacted {summary}"))
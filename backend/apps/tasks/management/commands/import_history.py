@@ -0,0 +1,98 @@
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.profiles.services.player import get_player
+from apps.tasks.services.importer import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_FORMATS,
+    import_history,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports completion history (e.g. from another habit tracker) for a user. "
+        "One row per completion: task, completed_at and optionally primary_stat, "
+        "secondary_stat, rank and frequency (creates a Habit). "
+        "Unknown tasks are created, rewards are granted once at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Owner of the imported history.")
+        parser.add_argument("file", help="CSV, JSON or JSONL file.")
+        parser.add_argument(
+            "--format",
+            choices=IMPORT_FORMATS,
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="Rows validated and written per batch.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and report without saving anything.",
+        )
+
+    def handle(self, *args, **options):
+        user = get_user_model().objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"User '{options['username']}' does not exist.")
+
+        path = Path(options["file"])
+        if not path.is_file():
+            raise CommandError(f"File '{path}' does not exist.")
+
+        file_format = options["format"] or path.suffix.lstrip(".").lower()
+        if file_format not in IMPORT_FORMATS:
+            raise CommandError("Unknown file format, use --format.")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+
+        with path.open(encoding="utf-8", newline="") as stream:
+            try:
+                report = import_history(
+                    get_player(user),
+                    stream,
+                    file_format,
+                    batch_size=options["batch_size"],
+                    dry_run=options["dry_run"],
+                )
+            except ValueError as error:  # Not valid JSON at all
+                raise CommandError(f"Could not read the file: {error}")
+
+        self.print_report(report, options["dry_run"])
+
+    def print_report(self, report, dry_run):
+        rate = report["rows"] / report["seconds"] if report["seconds"] else 0
+        self.stdout.write(
+            f"{report['rows']} row(s) read in {report['seconds']:.2f}s ({rate:.0f} rows/s)"
+        )
+        self.stdout.write(f"  Imported:   {report['imported']}")
+        self.stdout.write(f"  Duplicates: {report['duplicates']}")
+        self.stdout.write(
+            f"  Created:    {report['tasks_created']} task(s), "
+            f"{report['schedules_created']} schedule(s)"
+        )
+
+        failed = report["failed"]
+        if failed:
+            self.stdout.write(self.style.WARNING(f"  Failed:     {len(failed)}"))
+            for line_number, errors in failed[:50]:
+                messages = "; ".join(
+                    f"{field}: {' '.join(error['message'] for error in field_errors)}"
+                    for field, field_errors in errors.items()
+                )
+                self.stdout.write(f"    line {line_number}: {messages}")
+            if len(failed) > 50:
+                self.stdout.write(f"    ... and {len(failed) - 50} more")
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING("Dry run: nothing was saved."))
+        else:
+            self.stdout.write(self.style.SUCCESS("History imported."))
@@ -0,0 +1,48 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.tasks.ordering import rebalance
+
+# Model -> fields grouping the siblings
+ORDERED_MODELS = {
+    "tasks.Task": ("profile_id", "parent_id"),
+    "gate.DailyHighlight": ("entry_id", "category"),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Renumbers the ordering keys of subtasks and highlights where the gaps "
+        "between neighbours ran out (after many moves to the same place). "
+        "Run it weekly; moves renumber a group themselves when they must."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Renumber every group, not only the crowded ones.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the groups to renumber without changing anything.",
+        )
+
+    def handle(self, *args, **options):
+        for label, group_by in ORDERED_MODELS.items():
+            model = apps.get_model(label)
+            result = rebalance(
+                model.objects.all(),
+                group_by,
+                force=options["all"],
+                dry_run=options["dry_run"],
+            )
+            self.stdout.write(
+                f"  {label}: {result['groups']} group(s), {result['rows']} row(s)"
+            )
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("Dry run: nothing was changed."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Ordering keys rebalanced."))
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.profiles.models import PlayerProfile
+from apps.tasks.services.rollup import rebuild_rollups
+
+
+def parse_date(value, option):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise CommandError(f"Invalid {option} date, expected YYYY-MM-DD.")
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes the daily completion rollups from the task logs "
+        "and fixes the rows that drifted (e.g. after direct database edits). "
+        "Run it daily with --days 2 to also record the days with no completion."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "usernames", nargs="*", help="Players to repair. Defaults to everyone."
+        )
+        parser.add_argument("--start", help="First day (YYYY-MM-DD), inclusive.")
+        parser.add_argument("--end", help="Last day (YYYY-MM-DD), inclusive.")
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Only the last N days (up to today). Overrides --start/--end.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the drift without fixing it.",
+        )
+
+    def handle(self, *args, **options):
+        start = parse_date(options["start"], "--start") if options["start"] else None
+        end = parse_date(options["end"], "--end") if options["end"] else None
+        if options["days"] is not None:
+            if options["days"] < 1:
+                raise CommandError("--days must be positive.")
+            end = timezone.localdate()
+            start = end - timedelta(days=options["days"] - 1)
+        if start and end and start > end:
+            raise CommandError("--start must not be after --end.")
+
+        profiles = PlayerProfile.objects.select_related("user").order_by("pk")
+        if options["usernames"]:
+            profiles = profiles.filter(user__username__in=options["usernames"])
+
+        totals = {"created": 0, "updated": 0, "deleted": 0}
+        for profile in profiles.iterator():
+            result = rebuild_rollups(
+                profile, start=start, end=end, dry_run=options["dry_run"]
+            )
+            if any(result.values()):
+                self.stdout.write(
+                    f"  {profile.user.username}: {result['created']} created, "
+                    f"{result['updated']} updated, {result['deleted']} deleted"
+                )
+            for key, count in result.items():
+                totals[key] += count
+
+        summary = (
+            f"{totals['created']} created, {totals['updated']} updated, "
+            f"{totals['deleted']} deleted."
+        )
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"Dry run: {summary}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Rollups repaired: {summary}"))
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tasks.services.partitions import (
+    MONTHS_AHEAD,
+    archive_partitions,
+    ensure_partitions,
+    list_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Maintains the monthly partitions of the task log table. "
+        "By default, creates the partitions of the coming months "
+        "(and of the months found in the default partition): run it daily. "
+        "--archive-before detaches the older months without a long lock."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=MONTHS_AHEAD,
+            help="Number of future months to create.",
+        )
+        parser.add_argument(
+            "--archive-before",
+            help=(
+                "Detach the partitions older than this month (YYYY-MM). "
+                "They are renamed tasks_tasklog_archive_YYYY_MM, to dump and drop."
+            ),
+        )
+        parser.add_argument(
+            "--lock-timeout",
+            type=int,
+            default=5000,
+            help="Milliseconds to wait for the table locks (attach and detach).",
+        )
+        parser.add_argument(
+            "--list", action="store_true", help="Only list the partitions."
+        )
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for name, rows in list_partitions():
+                self.stdout.write(f"  {name:<32} ~{rows} row(s)")
+            return
+
+        if options["ahead"] < 0:
+            raise CommandError("--ahead must not be negative.")
+
+        created = ensure_partitions(
+            months_ahead=options["ahead"], lock_timeout_ms=options["lock_timeout"]
+        )
+        for name in created:
+            self.stdout.write(f"  Created {name}")
+
+        if options["archive_before"]:
+            try:
+                before = datetime.strptime(options["archive_before"], "%Y-%m").date()
+            except ValueError:
+                raise CommandError("Invalid --archive-before, expected YYYY-MM.")
+
+            for name in archive_partitions(before, options["lock_timeout"]):
+                self.stdout.write(f"  Archived {name}")
+
+        self.stdout.write(self.style.SUCCESS("Task log partitions are up to date."))
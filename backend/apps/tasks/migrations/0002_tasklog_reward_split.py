@@ -0,0 +1,70 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+STAT_KEYS = ['STR', 'INT', 'CHA', 'WIL', 'WIS']
+
+
+def stat_split_sql(stat):
+    """Same 60/40 rule as Task.xp_distribution, applied to the logged XP."""
+    return (
+        f"{stat.lower()}_xp = CASE "
+        f"WHEN t.secondary_stat IS NULL OR t.secondary_stat = '' OR t.secondary_stat = t.primary_stat "
+        f"THEN CASE WHEN t.primary_stat = '{stat}' THEN l.xp_earned ELSE 0 END "
+        f"WHEN t.primary_stat = '{stat}' THEN l.xp_earned * 6 / 10 "
+        f"WHEN t.secondary_stat = '{stat}' THEN l.xp_earned - l.xp_earned * 6 / 10 "
+        f"ELSE 0 END"
+    )
+
+
+BACKFILL_SQL = (
+    "UPDATE tasks_tasklog AS l SET profile_id = t.profile_id, "
+    + ", ".join(stat_split_sql(stat) for stat in STAT_KEYS)
+    + " FROM tasks_task AS t WHERE l.task_id = t.id;"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0003_stat_affinity_counters'),
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tasklog',
+            name='profile',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='task_logs', to='profiles.playerprofile'),
+        ),
+        migrations.AddField(
+            model_name='tasklog',
+            name='cha_xp',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Charisma XP'),
+        ),
+        migrations.AddField(
+            model_name='tasklog',
+            name='int_xp',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Intellect XP'),
+        ),
+        migrations.AddField(
+            model_name='tasklog',
+            name='str_xp',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Physique XP'),
+        ),
+        migrations.AddField(
+            model_name='tasklog',
+            name='wil_xp',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Discipline XP'),
+        ),
+        migrations.AddField(
+            model_name='tasklog',
+            name='wis_xp',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='Psyche XP'),
+        ),
+        # Existing logs: owner from the Task, split from the Task's current stats.
+        # NOT NULL is set by the next migration, in its own transaction: ALTER TABLE
+        # can't run while the UPDATE has pending FK trigger events.
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
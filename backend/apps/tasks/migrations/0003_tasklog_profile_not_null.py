@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_tasklog_reward_split'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tasklog',
+            name='profile',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='task_logs', to='profiles.playerprofile'),
+        ),
+    ]
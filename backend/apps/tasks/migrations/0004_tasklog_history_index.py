@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_player_data_version'),
+        ('tasks', '0003_tasklog_profile_not_null'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tasklog',
+            index=models.Index(fields=['profile', '-completed_at', '-id'], name='tasklog_profile_history_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_player_data_version'),
+        ('tasks', '0004_tasklog_history_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tasklog',
+            index=models.Index(fields=['task', '-completed_at', '-id'], name='tasklog_task_history_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.3 on 2026-10-19 12:30
+
+import django.db.models.functions.comparison
+import django.db.models.lookups
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_player_data_version'),
+        ('tasks', '0005_tasklog_task_history_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='primary_xp',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(models.Q(('secondary_stat__isnull', True), ('secondary_stat', ''), ('secondary_stat', models.F('primary_stat')), _connector='OR'), then=models.Case(models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('E')), then=models.Value(15)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('D')), then=models.Value(35)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('C')), then=models.Value(75)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('B')), then=models.Value(150)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('A')), then=models.Value(350)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('S')), then=models.Value(700)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('SS')), then=models.Value(1200)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('Monarch')), then=models.Value(1500)), default=models.Value(15))), default=models.Case(models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('E')), then=models.Value(9)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('D')), then=models.Value(21)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('C')), then=models.Value(45)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('B')), then=models.Value(90)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('A')), then=models.Value(210)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('S')), then=models.Value(420)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('SS')), then=models.Value(720)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('Monarch')), then=models.Value(900)), default=models.Value(9))), output_field=models.PositiveIntegerField(), verbose_name='Primary Stat XP'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='rank',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), output_field=models.CharField(choices=[('E', 'E-Rank'), ('D', 'D-Rank'), ('C', 'C-Rank'), ('B', 'B-Rank'), ('A', 'A-Rank'), ('S', 'S-Rank'), ('SS', 'SS-Rank'), ('Monarch', 'Shadow Monarch')], max_length=10), verbose_name='Final Rank'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='reward_xp',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('E')), then=models.Value(15)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('D')), then=models.Value(35)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('C')), then=models.Value(75)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('B')), then=models.Value(150)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('A')), then=models.Value(350)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('S')), then=models.Value(700)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('SS')), then=models.Value(1200)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('Monarch')), then=models.Value(1500)), default=models.Value(15)), output_field=models.PositiveIntegerField(), verbose_name='XP Reward'),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='secondary_xp',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(models.Q(('secondary_stat__isnull', True), ('secondary_stat', ''), ('secondary_stat', models.F('primary_stat')), _connector='OR'), then=models.Value(0)), default=models.Case(models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('E')), then=models.Value(6)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('D')), then=models.Value(14)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('C')), then=models.Value(30)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('B')), then=models.Value(60)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('A')), then=models.Value(140)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('S')), then=models.Value(280)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('SS')), then=models.Value(480)), models.When(django.db.models.lookups.Exact(django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf(models.F('manual_rank'), models.Value('')), models.F('computed_rank')), models.Value('Monarch')), then=models.Value(600)), default=models.Value(6))), output_field=models.PositiveIntegerField(), verbose_name='Secondary Stat XP'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['rank'], name='task_rank_idx'),
+        ),
+    ]
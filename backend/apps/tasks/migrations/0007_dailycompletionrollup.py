@@ -0,0 +1,60 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+STAT_COLUMNS = ['str_xp', 'int_xp', 'cha_xp', 'wil_xp', 'wis_xp']
+
+# Counters of the existing history, per local day.
+# 'habits_due' needs the schedules: filled by 'manage.py repair_rollups'.
+BACKFILL_SQL = f"""
+INSERT INTO tasks_dailycompletionrollup
+    (profile_id, date, completions, habit_completions, habits_due, xp, {", ".join(STAT_COLUMNS)})
+SELECT
+    l.profile_id,
+    (l.completed_at AT TIME ZONE '{settings.TIME_ZONE}')::date,
+    COUNT(*),
+    COUNT(s.id),
+    0,
+    SUM(l.xp_earned),
+    {", ".join(f"SUM(l.{column})" for column in STAT_COLUMNS)}
+FROM tasks_tasklog AS l
+LEFT JOIN tasks_taskschedule AS s ON s.task_id = l.task_id
+GROUP BY 1, 2;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_player_data_version'),
+        ('tasks', '0006_task_stored_rewards'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyCompletionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('completions', models.PositiveIntegerField(default=0, verbose_name='Completions')),
+                ('habit_completions', models.PositiveIntegerField(default=0, verbose_name='Habits Done')),
+                ('habits_due', models.PositiveSmallIntegerField(default=0, verbose_name='Habits Due')),
+                ('xp', models.PositiveIntegerField(default=0, verbose_name='XP Earned')),
+                ('str_xp', models.PositiveIntegerField(default=0, verbose_name='Physique XP')),
+                ('int_xp', models.PositiveIntegerField(default=0, verbose_name='Intellect XP')),
+                ('cha_xp', models.PositiveIntegerField(default=0, verbose_name='Charisma XP')),
+                ('wil_xp', models.PositiveIntegerField(default=0, verbose_name='Discipline XP')),
+                ('wis_xp', models.PositiveIntegerField(default=0, verbose_name='Psyche XP')),
+                ('profile', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_rollups', to='profiles.playerprofile')),
+            ],
+            options={
+                'verbose_name': 'Daily Completion Rollup',
+                'verbose_name_plural': 'Daily Completion Rollups',
+                'ordering': ['-date'],
+                'constraints': [models.UniqueConstraint(fields=('profile', 'date'), name='unique_daily_rollup')],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
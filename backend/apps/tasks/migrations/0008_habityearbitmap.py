@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0007_dailycompletionrollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HabitYearBitmap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(verbose_name='Jalali Year')),
+                ('bits', models.BinaryField(verbose_name='Bits')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='bitmaps', to='tasks.task')),
+            ],
+            options={
+                'verbose_name': 'Habit Year Bitmap',
+                'verbose_name_plural': 'Habit Year Bitmaps',
+                'constraints': [models.UniqueConstraint(fields=('task', 'year'), name='unique_habit_year')],
+            },
+        ),
+    ]
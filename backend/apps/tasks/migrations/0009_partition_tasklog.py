@@ -0,0 +1,137 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:30
+
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import migrations
+
+# Converts tasks_tasklog into a table range partitioned by month of completed_at
+# (see apps.tasks.services.partitions). The table is locked while the rows are
+# copied: run it in a maintenance window on large histories.
+#
+# Postgres requires the partition key in every unique constraint, so the
+# primary key becomes (id, completed_at). For Django, 'id' stays the primary key:
+# ids still come from a single sequence, so they stay unique.
+
+MONTHS_AHEAD = 3
+
+INDEXES = [
+    ("tasks_tasklog_task_id_94d5b7eb", "(task_id)"),
+    ("tasks_tasklog_profile_id_5e72deb5", "(profile_id)"),
+    ("tasklog_profile_history_idx", "(profile_id, completed_at DESC, id DESC)"),
+    ("tasklog_task_history_idx", "(task_id, completed_at DESC, id DESC)"),
+]
+
+FOREIGN_KEYS = [
+    ("tasks_tasklog_task_id_94d5b7eb_fk_tasks_task_id", "task_id", "tasks_task"),
+    (
+        "tasks_tasklog_profile_id_5e72deb5_fk_profiles_playerprofile_id",
+        "profile_id",
+        "profiles_playerprofile",
+    ),
+]
+
+
+def month_start(month):
+    return datetime.combine(month, datetime.min.time(), ZoneInfo(settings.TIME_ZONE))
+
+
+def next_month(month):
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def finish_table(execute, sequence):
+    """Keys, foreign keys and indexes of the (renamed) tasks_tasklog table."""
+    execute(f"ALTER SEQUENCE {sequence} OWNED BY tasks_tasklog.id")
+    execute(f"ALTER SEQUENCE {sequence} RENAME TO tasks_tasklog_id_seq")
+    for name, column, table in FOREIGN_KEYS:
+        execute(
+            f"ALTER TABLE tasks_tasklog ADD CONSTRAINT {name} FOREIGN KEY ({column}) "
+            f"REFERENCES {table} (id) DEFERRABLE INITIALLY DEFERRED"
+        )
+    for name, columns in INDEXES:
+        execute(f"CREATE INDEX {name} ON tasks_tasklog {columns}")
+
+
+def partition(apps, schema_editor):
+    execute = schema_editor.execute
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT min(completed_at), COALESCE(max(id), 0) FROM tasks_tasklog"
+        )
+        first, last_id = cursor.fetchone()
+
+    execute(
+        "CREATE TABLE tasks_tasklog_new "
+        "(LIKE tasks_tasklog INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (completed_at)"
+    )
+    # Identity columns aren't supported on partitioned tables before Postgres 17
+    execute("CREATE SEQUENCE tasks_tasklog_new_id_seq")
+    execute(f"SELECT setval('tasks_tasklog_new_id_seq', {last_id + 1}, false)")
+    execute(
+        "ALTER TABLE tasks_tasklog_new "
+        "ALTER COLUMN id SET DEFAULT nextval('tasks_tasklog_new_id_seq')"
+    )
+
+    # One partition per month, from the first completion to a few months ahead
+    tz = ZoneInfo(settings.TIME_ZONE)
+    month = (first.astimezone(tz) if first else datetime.now(tz)).date().replace(day=1)
+    last = datetime.now(tz).date().replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = next_month(last)
+    while month <= last:
+        execute(
+            f"CREATE TABLE tasks_tasklog_p{month:%Y_%m} PARTITION OF tasks_tasklog_new "
+            f"FOR VALUES FROM ('{month_start(month).isoformat()}') "
+            f"TO ('{month_start(next_month(month)).isoformat()}')"
+        )
+        month = next_month(month)
+    execute("CREATE TABLE tasks_tasklog_default PARTITION OF tasks_tasklog_new DEFAULT")
+
+    execute("INSERT INTO tasks_tasklog_new SELECT * FROM tasks_tasklog")
+    execute("DROP TABLE tasks_tasklog")
+    execute("ALTER TABLE tasks_tasklog_new RENAME TO tasks_tasklog")
+    execute(
+        "ALTER TABLE tasks_tasklog "
+        "ADD CONSTRAINT tasks_tasklog_pkey PRIMARY KEY (id, completed_at)"
+    )
+    finish_table(execute, "tasks_tasklog_new_id_seq")
+
+
+def unpartition(apps, schema_editor):
+    """Back to a plain table (archived partitions are left aside)."""
+    execute = schema_editor.execute
+    execute(
+        "CREATE TABLE tasks_tasklog_old "
+        "(LIKE tasks_tasklog INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    execute("CREATE SEQUENCE tasks_tasklog_old_id_seq")
+    execute(
+        "SELECT setval('tasks_tasklog_old_id_seq', "
+        "(SELECT COALESCE(max(id), 0) + 1 FROM tasks_tasklog), false)"
+    )
+    execute(
+        "ALTER TABLE tasks_tasklog_old "
+        "ALTER COLUMN id SET DEFAULT nextval('tasks_tasklog_old_id_seq')"
+    )
+    execute("INSERT INTO tasks_tasklog_old SELECT * FROM tasks_tasklog")
+    execute("DROP TABLE tasks_tasklog")  # With its partitions
+    execute("ALTER TABLE tasks_tasklog_old RENAME TO tasks_tasklog")
+    execute(
+        "ALTER TABLE tasks_tasklog ADD CONSTRAINT tasks_tasklog_pkey PRIMARY KEY (id)"
+    )
+    finish_table(execute, "tasks_tasklog_old_id_seq")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_player_data_version'),
+        ('tasks', '0008_habityearbitmap'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition, unpartition),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_player_data_version'),
+        ('tasks', '0009_partition_tasklog'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyTaskSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(verbose_name='Month')),
+                ('completions', models.PositiveIntegerField(default=0, verbose_name='Completions')),
+                ('days', models.BinaryField(verbose_name='Completed Days')),
+                ('xp_earned', models.PositiveIntegerField(default=0, verbose_name='XP Earned')),
+                ('str_xp', models.PositiveIntegerField(default=0, verbose_name='Physique XP')),
+                ('int_xp', models.PositiveIntegerField(default=0, verbose_name='Intellect XP')),
+                ('cha_xp', models.PositiveIntegerField(default=0, verbose_name='Charisma XP')),
+                ('wil_xp', models.PositiveIntegerField(default=0, verbose_name='Discipline XP')),
+                ('wis_xp', models.PositiveIntegerField(default=0, verbose_name='Psyche XP')),
+                ('profile', models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='monthly_summaries', to='profiles.playerprofile')),
+                ('task', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_summaries', to='tasks.task')),
+            ],
+            options={
+                'verbose_name': 'Monthly Task Summary',
+                'verbose_name_plural': 'Monthly Task Summaries',
+                'ordering': ['-month'],
+                'indexes': [models.Index(fields=['profile', 'month'], name='summary_profile_month_idx')],
+                'constraints': [models.UniqueConstraint(fields=('task', 'month'), name='unique_task_month_summary')],
+            },
+        ),
+    ]
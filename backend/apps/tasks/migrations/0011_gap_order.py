@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:30
+
+from django.db import migrations
+
+# Spreads the existing keys 1024 apart (apps.tasks.ordering.ORDER_GAP),
+# keeping the displayed order (creation order for equal keys)
+RENUMBER_SQL = """
+UPDATE tasks_task AS t SET "order" = ranked.position * 1024
+FROM (
+    SELECT id, row_number() OVER (
+        PARTITION BY profile_id, parent_id ORDER BY "order", created_at, id
+    ) AS position
+    FROM tasks_task
+) AS ranked
+WHERE t.id = ranked.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0010_monthlytasksummary'),
+    ]
+
+    operations = [
+        migrations.RunSQL(RENUMBER_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0004_player_data_version'),
+        ('tasks', '0011_gap_order'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_active', True), ('parent__isnull', True)), fields=['profile', 'order', 'created_at', 'id'], name='task_top_level_page_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-19 04:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0012_task_top_level_page_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='habityearbitmap',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Version'),
+        ),
+        migrations.AlterField(
+            model_name='habityearbitmap',
+            name='bits',
+            field=models.BinaryField(null=True, verbose_name='Bits'),
+        ),
+    ]
@@ -1,8 +1,14 @@
+from apps.tasks.models.heatmap import HabitYearBitmap
 from apps.tasks.models.log import TaskLog
+from apps.tasks.models.rollup import DailyCompletionRollup
 from apps.tasks.models.schedule import TaskSchedule
+from apps.tasks.models.summary import MonthlyTaskSummary
 from apps.tasks.models.tasks import Habit, OneTimeTask, Task
 
 __all__ = [
+    "DailyCompletionRollup",
+    "HabitYearBitmap",
+    "MonthlyTaskSummary",
     "TaskLog",
     "TaskSchedule",
     "Habit",
@@ -0,0 +1,30 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.tasks.models.tasks import Task
+
+
+class HabitYearBitmap(models.Model):
+    """
+    Cached completions of a habit over one Jalali year: bit N is set if the
+    habit was completed on day N of the year (see apps.tasks.services.heatmap).
+    Stored in the database so every worker shares it; when a completion of that
+    habit-year changes, 'bits' is cleared and 'version' bumped, and the bits are
+    rebuilt on the next read.
+    """
+
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="bitmaps")
+    year = models.PositiveSmallIntegerField(_("Jalali Year"))
+    bits = models.BinaryField(_("Bits"), null=True)  # NULL: to rebuild
+    # Readers only store bits built since the last invalidation (same version)
+    version = models.PositiveIntegerField(_("Version"), default=0, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["task", "year"], name="unique_habit_year"),
+        ]
+        verbose_name = "Habit Year Bitmap"
+        verbose_name_plural = "Habit Year Bitmaps"
+
+    def __str__(self):
+        return f"{self.task_id} @ {self.year}"
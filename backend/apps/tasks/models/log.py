@@ -2,6 +2,7 @@ from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from apps.profiles.models import PlayerStats
 from apps.tasks.models.tasks import Task
 
 
@@ -9,19 +10,75 @@ class TaskLog(models.Model):
     """
     Unified History.
     Tracks every time a Task (or Routine Item) is completed.
+    The table is partitioned by month of 'completed_at' (see services.partitions):
+    filter on date ranges, not 'completed_at__date', to only scan those months.
     """
 
     task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name="logs")
+    # Denormalized owner: lets undo/aggregates skip the join to Task
+    profile = models.ForeignKey(
+        "profiles.PlayerProfile",
+        on_delete=models.CASCADE,
+        related_name="task_logs",
+        editable=False,
+    )
     completed_at = models.DateTimeField(_("Completed At"), default=timezone.now)
 
     # Snapshot of the reward at the moment of completion
     # (In case you change the Task rank later, history remains accurate)
     xp_earned = models.PositiveIntegerField(_("XP Earned"), default=0)
 
+    # Exact per-stat split awarded (sums to xp_earned). Undo reverts exactly this.
+    str_xp = models.PositiveSmallIntegerField(_("Physique XP"), default=0)
+    int_xp = models.PositiveSmallIntegerField(_("Intellect XP"), default=0)
+    cha_xp = models.PositiveSmallIntegerField(_("Charisma XP"), default=0)
+    wil_xp = models.PositiveSmallIntegerField(_("Discipline XP"), default=0)
+    wis_xp = models.PositiveSmallIntegerField(_("Psyche XP"), default=0)
+
+    # Columns written together when the reward is snapshotted
+    REWARD_FIELDS = ["xp_earned", "str_xp", "int_xp", "cha_xp", "wil_xp", "wis_xp"]
+
     class Meta:
         ordering = ["-completed_at"]
+        indexes = [
+            # Per-player history, newest first (keyset pagination)
+            models.Index(
+                fields=["profile", "-completed_at", "-id"],
+                name="tasklog_profile_history_idx",
+            ),
+            # Per-task history (admin history panel)
+            models.Index(
+                fields=["task", "-completed_at", "-id"],
+                name="tasklog_task_history_idx",
+            ),
+        ]
         verbose_name = "Task Log"
         verbose_name_plural = "Task Logs"
 
     def __str__(self):
         return f"{self.task.title} @ {self.completed_at.strftime('%Y-%m-%d %H:%M')}"
+
+    @property
+    def xp_distribution(self):
+        """
+        The split stored at completion time.
+        Returns a dict like Task.xp_distribution: {'STR': 45, 'INT': 30}
+        """
+        distribution = {}
+        for stat_key in PlayerStats.StatType.values:
+            amount = getattr(self, f"{stat_key.lower()}_xp")
+            if amount:
+                distribution[stat_key] = amount
+        return distribution
+
+    def set_rewards(self, xp_earned, distribution):
+        """Snapshots the total reward and its per-stat split onto the log."""
+        self.xp_earned = xp_earned
+        for stat_key in PlayerStats.StatType.values:
+            setattr(self, f"{stat_key.lower()}_xp", distribution.get(stat_key, 0))
+
+    def save(self, *args, **kwargs):
+        # Inherit the owner from the Task
+        if not self.profile_id:
+            self.profile_id = self.task.profile_id
+        super().save(*args, **kwargs)
@@ -0,0 +1,56 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class DailyCompletionRollup(models.Model):
+    """
+    Per-player, per-day totals of the completion history (local dates).
+    Kept up to date by the completion services (apps.tasks.services.rollup),
+    so charts over months or years read one row per day instead of every log.
+    Rebuilt from TaskLog by 'manage.py repair_rollups'.
+    """
+
+    profile = models.ForeignKey(
+        "profiles.PlayerProfile",
+        on_delete=models.CASCADE,
+        related_name="daily_rollups",
+        editable=False,
+    )
+    date = models.DateField(_("Date"))
+
+    completions = models.PositiveIntegerField(_("Completions"), default=0)
+    habit_completions = models.PositiveIntegerField(_("Habits Done"), default=0)
+    # Active habits scheduled that day, as of the last write
+    habits_due = models.PositiveSmallIntegerField(_("Habits Due"), default=0)
+
+    xp = models.PositiveIntegerField(_("XP Earned"), default=0)
+    str_xp = models.PositiveIntegerField(_("Physique XP"), default=0)
+    int_xp = models.PositiveIntegerField(_("Intellect XP"), default=0)
+    cha_xp = models.PositiveIntegerField(_("Charisma XP"), default=0)
+    wil_xp = models.PositiveIntegerField(_("Discipline XP"), default=0)
+    wis_xp = models.PositiveIntegerField(_("Psyche XP"), default=0)
+
+    # Summed from the TaskLog columns of the same name (xp <- xp_earned)
+    COUNTER_FIELDS = [
+        "completions",
+        "habit_completions",
+        "xp",
+        "str_xp",
+        "int_xp",
+        "cha_xp",
+        "wil_xp",
+        "wis_xp",
+    ]
+
+    class Meta:
+        ordering = ["-date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["profile", "date"], name="unique_daily_rollup"
+            ),
+        ]
+        verbose_name = "Daily Completion Rollup"
+        verbose_name_plural = "Daily Completion Rollups"
+
+    def __str__(self):
+        return f"{self.profile_id} @ {self.date}: {self.completions}"
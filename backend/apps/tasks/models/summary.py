@@ -0,0 +1,65 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.tasks.models.tasks import Task
+
+
+class MonthlyTaskSummary(models.Model):
+    """
+    Compacted history: the TaskLogs of one task over one (local) month, folded
+    into a single row by 'manage.py compact_task_logs' once they are old enough.
+    Bit N-1 of 'days' (byte (N-1) // 8, least significant bit first) is set
+    if the task was completed on day N of the month.
+    The reward columns have the TaskLog names, summed over the month.
+    """
+
+    task = models.ForeignKey(
+        Task, on_delete=models.CASCADE, related_name="monthly_summaries"
+    )
+    # Denormalized owner, like TaskLog.profile
+    profile = models.ForeignKey(
+        "profiles.PlayerProfile",
+        on_delete=models.CASCADE,
+        related_name="monthly_summaries",
+        editable=False,
+    )
+    month = models.DateField(_("Month"))  # First day of the month
+
+    completions = models.PositiveIntegerField(_("Completions"), default=0)
+    days = models.BinaryField(_("Completed Days"))
+
+    xp_earned = models.PositiveIntegerField(_("XP Earned"), default=0)
+    str_xp = models.PositiveIntegerField(_("Physique XP"), default=0)
+    int_xp = models.PositiveIntegerField(_("Intellect XP"), default=0)
+    cha_xp = models.PositiveIntegerField(_("Charisma XP"), default=0)
+    wil_xp = models.PositiveIntegerField(_("Discipline XP"), default=0)
+    wis_xp = models.PositiveIntegerField(_("Psyche XP"), default=0)
+
+    # Summed from the TaskLog columns of the same name
+    COUNTER_FIELDS = [
+        "completions",
+        "xp_earned",
+        "str_xp",
+        "int_xp",
+        "cha_xp",
+        "wil_xp",
+        "wis_xp",
+    ]
+
+    class Meta:
+        ordering = ["-month"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["task", "month"], name="unique_task_month_summary"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["profile", "month"], name="summary_profile_month_idx"
+            ),
+        ]
+        verbose_name = "Monthly Task Summary"
+        verbose_name_plural = "Monthly Task Summaries"
+
+    def __str__(self):
+        return f"{self.task_id} @ {self.month:%Y-%m}: {self.completions}"
@@ -1,10 +1,67 @@
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Coalesce, NullIf
+from django.db.models.lookups import Exact
 from django.utils.translation import gettext_lazy as _
 from tinymce.models import HTMLField
 
 from apps.profiles.models import PlayerStats
+from apps.tasks.ordering import get_next_order
+
+
+# XP reward of each Rank (from Scenario), default for unknown ranks
+RANK_XP = {
+    "E": 15,
+    "D": 35,
+    "C": 75,
+    "B": 150,
+    "A": 350,
+    "S": 700,
+    "SS": 1200,
+    "Monarch": 1500,
+}
+DEFAULT_XP = 15
+# Share of the primary stat when there is a secondary one (60/40)
+PRIMARY_SHARE = 0.60
+
+
+def primary_amount(total_xp):
+    return int(total_xp * PRIMARY_SHARE)
+
+
+def secondary_amount(total_xp):
+    # The remainder avoids rounding loss (e.g. 75 XP -> 45 + 30)
+    return total_xp - primary_amount(total_xp)
+
+
+def final_rank_expression():
+    """SQL mirror of Task.final_rank: the manual rank if set, else the computed one."""
+    return Coalesce(NullIf(F("manual_rank"), Value("")), F("computed_rank"))
+
+
+def rank_xp_expression(amount=None):
+    """
+    SQL mirror of Task.xp_reward, optionally mapped through 'amount' (e.g. the 60% share).
+    The amounts are computed here in Python, so both sides always agree.
+    """
+    amount = amount or (lambda xp: xp)
+    return Case(
+        *[
+            When(Exact(final_rank_expression(), Value(rank)), then=Value(amount(xp)))
+            for rank, xp in RANK_XP.items()
+        ],
+        default=Value(amount(DEFAULT_XP)),
+    )
+
+
+# No secondary stat (or the same as the primary): 100% to the primary
+SINGLE_STAT = (
+    Q(secondary_stat__isnull=True)
+    | Q(secondary_stat="")
+    | Q(secondary_stat=F("primary_stat"))
+)
 
 
 class Task(models.Model):
@@ -39,7 +96,7 @@ class Task(models.Model):
         help_text=_("If set, this task will be a subtask"),
     )
 
-    # Order within the routine (0, 1, 2...)
+    # Order within the routine: gap-based keys (1024, 2048...), see apps.tasks.ordering
     order = models.PositiveIntegerField(
         default=0, help_text=_("Order of execution within the routine.")
     )
@@ -115,6 +172,41 @@ class Task(models.Model):
         help_text=_("Automatically computed based on task parameters."),
     )
 
+    # --- Stored Rewards ---
+    # Computed by the database from the columns above, so lists, filters and
+    # reports can sort/aggregate in SQL. The properties below are their
+    # in-memory mirrors (valid before save, and after in-memory edits).
+    rank = models.GeneratedField(
+        expression=final_rank_expression(),
+        output_field=models.CharField(max_length=10, choices=Rank.choices),
+        db_persist=True,
+        verbose_name=_("Final Rank"),
+    )
+    reward_xp = models.GeneratedField(
+        expression=rank_xp_expression(),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+        verbose_name=_("XP Reward"),
+    )
+    primary_xp = models.GeneratedField(
+        expression=Case(
+            When(SINGLE_STAT, then=rank_xp_expression()),
+            default=rank_xp_expression(primary_amount),
+        ),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+        verbose_name=_("Primary Stat XP"),
+    )
+    secondary_xp = models.GeneratedField(
+        expression=Case(
+            When(SINGLE_STAT, then=Value(0)),
+            default=rank_xp_expression(secondary_amount),
+        ),
+        output_field=models.PositiveIntegerField(),
+        db_persist=True,
+        verbose_name=_("Secondary Stat XP"),
+    )
+
     # --- Status ---
     # is_active controls visibility. If False, it's archived.
     is_active = models.BooleanField(
@@ -129,6 +221,15 @@ class Task(models.Model):
 
     class Meta:
         ordering = ["order", "created_at"]
+        indexes = [
+            models.Index(fields=["rank"], name="task_rank_idx"),
+            # Gate task list: keyset pages of the top-level tasks
+            models.Index(
+                fields=["profile", "order", "created_at", "id"],
+                condition=Q(parent__isnull=True, is_active=True),
+                name="task_top_level_page_idx",
+            ),
+        ]
         verbose_name = _("Task")
         verbose_name_plural = _("Tasks")
 
@@ -173,18 +274,7 @@ class Task(models.Model):
         """
         Returns the XP value based on the Task's Rank (from Scenario).
         """
-        rank_xp = {
-            self.Rank.E_RANK: 15,
-            self.Rank.D_RANK: 35,
-            self.Rank.C_RANK: 75,
-            self.Rank.B_RANK: 150,
-            self.Rank.A_RANK: 350,
-            self.Rank.S_RANK: 700,
-            self.Rank.SS_RANK: 1200,
-            self.Rank.MONARCH: 1500,
-        }
-        base_xp = rank_xp.get(self.final_rank, 15)
-        return base_xp
+        return RANK_XP.get(self.final_rank, DEFAULT_XP)
 
     @property
     def xp_distribution(self):
@@ -199,13 +289,9 @@ class Task(models.Model):
             return {self.primary_stat: total_xp}
 
         # Case 2: Split 60/40
-        primary_amount = int(total_xp * 0.60)
-        # Give the remainder to secondary to avoid rounding loss (e.g. 75 XP -> 45 + 30)
-        secondary_amount = total_xp - primary_amount
-
         return {
-            self.primary_stat: primary_amount,
-            self.secondary_stat: secondary_amount,
+            self.primary_stat: primary_amount(total_xp),
+            self.secondary_stat: secondary_amount(total_xp),
         }
 
     # --- Methods ---
@@ -220,6 +306,21 @@ class Task(models.Model):
         return base * self.fear_factor
 
     def save(self, *args, **kwargs):
+        self.prepare_for_save()
+        # New rows go last among their siblings
+        if self._state.adding and not self.order:
+            self.order = get_next_order(self.get_siblings())
+        super().save(*args, **kwargs)
+
+    def get_siblings(self):
+        """The tasks ordered with this one: same routine, or the player's top level."""
+        return Task.objects.filter(profile_id=self.profile_id, parent_id=self.parent_id)
+
+    def prepare_for_save(self):
+        """
+        Normalizes the fields and computes the rank, as save() does.
+        Call it on instances written with bulk_create() (which skips save()).
+        """
         # --- Capitalize Title ---
         if self.title:
             self.title = self.title.strip().title()
@@ -250,8 +351,6 @@ class Task(models.Model):
         else:
             self.computed_rank = self.Rank.MONARCH
 
-        super().save(*args, **kwargs)
-
     def clean(self):
         # 1. Self-Parenting Check
         if self.parent == self:
@@ -0,0 +1,131 @@
+from django.db import transaction
+from django.db.models import Max, Min
+
+# Gap-based ordering keys ('order' columns of subtasks and highlights):
+# siblings are numbered ORDER_GAP apart, so a row moved between two
+# neighbours takes a key in the middle and is the only row written.
+ORDER_GAP = 1024
+
+# Groups with neighbours closer than this are renumbered by 'rebalance_order'
+MIN_GAP = 8
+
+# PositiveIntegerField limit: renumber before the keys get there
+MAX_ORDER = 2**31 - 1 - ORDER_GAP
+
+# Display order of siblings with equal keys (e.g. rows created before the gaps)
+TIE_BREAKERS = ("created_at", "pk")
+
+
+def get_next_order(siblings):
+    """Key for a row appended after 'siblings' (a queryset)."""
+    last = siblings.aggregate(last=Max("order"))["last"]
+    return ORDER_GAP if last is None else last + ORDER_GAP
+
+
+def get_order_between(low, high):
+    """
+    A key strictly between two neighbours' keys (None: no neighbour on that side),
+    or None if there is no room left between them.
+    """
+    if low is None and high is None:
+        return ORDER_GAP
+    if low is None:
+        key = high - ORDER_GAP if high > ORDER_GAP else high // 2
+        return key if 0 < key < high else None
+    if high is None:
+        key = low + ORDER_GAP
+        return key if key <= MAX_ORDER else None
+    return (low + high) // 2 if high - low > 1 else None
+
+
+def move_after(obj, siblings, after=None):
+    """
+    Moves 'obj' right after 'after' (one of 'siblings', or None for the first
+    place). Only obj's row is written, unless its new neighbours have no room
+    left between their keys: then the group is renumbered (one bulk UPDATE).
+    Returns True if the group was renumbered.
+    """
+    siblings = siblings.exclude(pk=obj.pk)
+    with transaction.atomic():
+        if after is None:
+            low = None
+            high = siblings.aggregate(first=Min("order"))["first"]
+        else:
+            low = after.order
+            # Siblings with the same key as 'after' leave no room: renumbered below
+            high = (
+                siblings.filter(order__gte=low)
+                .exclude(pk=after.pk)
+                .aggregate(next=Min("order"))["next"]
+            )
+
+        key = get_order_between(low, high)
+        if key is not None:
+            obj.order = key
+            type(obj).objects.filter(pk=obj.pk).update(order=key)
+            return False
+
+        rows = list(siblings.order_by("order", *TIE_BREAKERS))
+        position = [row.pk for row in rows].index(after.pk) + 1 if after else 0
+        rows.insert(position, obj)
+        renumber(rows)
+        return True
+
+
+def renumber(rows):
+    """
+    Spreads the keys of 'rows' (in display order) ORDER_GAP apart.
+    Returns the number of rows changed.
+    """
+    changed = []
+    for position, row in enumerate(rows, start=1):
+        if row.order != position * ORDER_GAP:
+            row.order = position * ORDER_GAP
+            changed.append(row)
+    if changed:
+        type(changed[0]).objects.bulk_update(changed, ["order"])
+    return len(changed)
+
+
+def needs_rebalance(keys):
+    """True if the sorted 'keys' are crowded (ties, gaps under MIN_GAP) or too high."""
+    if not keys:
+        return False
+    if keys[0] < MIN_GAP or keys[-1] > MAX_ORDER:
+        return True
+    return any(high - low < MIN_GAP for low, high in zip(keys, keys[1:]))
+
+
+def rebalance(queryset, group_by, force=False, dry_run=False):
+    """
+    Renumbers the crowded sibling groups of 'queryset' (rows grouped by the
+    'group_by' fields), or every group with 'force'.
+    Returns {'groups', 'rows'}: the renumbered groups and rows written.
+    """
+    rows = (
+        queryset.order_by(*group_by, "order", *TIE_BREAKERS)
+        .only("pk", "order", *group_by)
+        .iterator(chunk_size=2000)
+    )
+    report = {"groups": 0, "rows": 0}
+
+    def flush(group):
+        if group and (force or needs_rebalance([row.order for row in group])):
+            report["groups"] += 1
+            if dry_run:
+                report["rows"] += sum(
+                    row.order != position * ORDER_GAP
+                    for position, row in enumerate(group, start=1)
+                )
+            else:
+                report["rows"] += renumber(group)
+
+    group, key = [], None
+    for row in rows:
+        row_key = tuple(getattr(row, field) for field in group_by)
+        if row_key != key:
+            flush(group)
+            group, key = [], row_key
+        group.append(row)
+    flush(group)
+    return report
@@ -0,0 +1,180 @@
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+
+from django.db import connection, transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from apps.tasks.models import MonthlyTaskSummary, TaskLog
+from apps.tasks.services.partitions import next_month, start_of_day
+
+# Completions older than this are folded into MonthlyTaskSummary rows
+COMPACT_AFTER_DAYS = 365
+
+COUNTER_FIELDS = MonthlyTaskSummary.COUNTER_FIELDS
+DAYS_BYTES = 4  # 31 bits
+
+
+# --- Days bitmap ---
+def get_days(month, days):
+    """The dates set in a summary's 'days' bitmap."""
+    bits = int.from_bytes(bytes(days), "little")
+    return [month.replace(day=n + 1) for n in range(31) if bits >> n & 1]
+
+
+def set_days(days, dates):
+    """'days' bitmap with the given dates (of the same month) added."""
+    bits = int.from_bytes(bytes(days or b""), "little")
+    for day in dates:
+        bits |= 1 << (day.day - 1)
+    return bits.to_bytes(DAYS_BYTES, "little")
+
+
+def iter_compacted_days(summaries, newest_first=False, chunk_size=2000):
+    """
+    Yields (date, task_id, task title) for every completed day of a
+    MonthlyTaskSummary queryset, in (date, task_id) order, or reversed.
+    The summaries are read month by month through a server-side cursor.
+    """
+    prefix = "-" if newest_first else ""
+    rows = (
+        summaries.order_by(f"{prefix}month")
+        .values_list("month", "task_id", "task__title", "days")
+        .iterator(chunk_size=chunk_size)
+    )
+    for month, group in groupby(rows, key=itemgetter(0)):
+        yield from sorted(
+            (
+                (day, task_id, title)
+                for _, task_id, title, days in group
+                for day in get_days(month, days)
+            ),
+            reverse=newest_first,
+        )
+
+
+def get_compacted_days(task_ids, months):
+    """{(task_id, date)} of the completions already folded into summaries."""
+    summaries = MonthlyTaskSummary.objects.filter(
+        task_id__in=task_ids, month__in=months
+    ).values_list("task_id", "month", "days")
+    return {
+        (task_id, day)
+        for task_id, month, days in summaries
+        for day in get_days(month, days)
+    }
+
+
+# --- Compaction ---
+def get_cutoff(older_than_days=COMPACT_AFTER_DAYS, today=None):
+    """
+    First day of the oldest month left as raw logs: only whole months are
+    compacted, so a month is never split between the two forms.
+    """
+    return ((today or timezone.localdate()) - timedelta(days=older_than_days)).replace(
+        day=1
+    )
+
+
+def summarize_month(month, profile=None, delete=True):
+    """
+    Per-(task, day) totals of a month's logs, as {(task_id, profile_id): {...}}.
+    With 'delete', the rows are removed by the same statement (DELETE ... RETURNING):
+    exactly the summarized rows go, even if logs are written meanwhile.
+    The DELETE skips the TaskLog signals: rewards and rollups are left as they are.
+    """
+    table = TaskLog._meta.db_table
+    source = f"DELETE FROM {table} WHERE" if delete else f"SELECT * FROM {table} WHERE"
+    params = [start_of_day(month), start_of_day(next_month(month))]
+    condition = "completed_at >= %s AND completed_at < %s"
+    if profile is not None:
+        condition += " AND profile_id = %s"
+        params.append(profile.pk)
+    if delete:
+        condition += " RETURNING *"
+
+    sums = ", ".join(
+        f"sum({field})" for field in COUNTER_FIELDS if field != "completions"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            WITH logs AS ({source} {condition})
+            SELECT task_id, profile_id, (completed_at AT TIME ZONE %s)::date, count(*), {sums}
+            FROM logs
+            GROUP BY 1, 2, 3
+            """,
+            [*params, timezone.get_current_timezone_name()],
+        )
+        rows = cursor.fetchall()
+
+    totals = {}
+    for task_id, profile_id, day, *counts in rows:
+        row = totals.setdefault(
+            (task_id, profile_id), {**dict.fromkeys(COUNTER_FIELDS, 0), "dates": []}
+        )
+        row["dates"].append(day)
+        for field, count in zip(COUNTER_FIELDS, counts):
+            row[field] += count
+    return totals
+
+
+def merge_summaries(month, totals):
+    """Adds per-task totals (see summarize_month) to the month's summaries."""
+    existing = {
+        summary.task_id: summary
+        for summary in MonthlyTaskSummary.objects.select_for_update().filter(
+            task_id__in=[task_id for task_id, _ in totals], month=month
+        )
+    }
+
+    to_create, to_update = [], []
+    for (task_id, profile_id), row in totals.items():
+        summary = existing.get(task_id)
+        if summary is None:
+            summary = MonthlyTaskSummary(
+                task_id=task_id, profile_id=profile_id, month=month
+            )
+            to_create.append(summary)
+        else:
+            to_update.append(summary)
+        summary.days = set_days(summary.days, row["dates"])
+        for field in COUNTER_FIELDS:
+            setattr(summary, field, getattr(summary, field) + row[field])
+
+    MonthlyTaskSummary.objects.bulk_create(to_create)
+    MonthlyTaskSummary.objects.bulk_update(to_update, ["days", *COUNTER_FIELDS])
+    return len(to_create) + len(to_update)
+
+
+def compact_logs(before, profile=None, dry_run=False):
+    """
+    Folds the logs completed before the month of 'before' (a date) into
+    per-task monthly summaries, one month and one transaction at a time
+    (a month is one partition of the log table).
+    Months compacted earlier are merged into, e.g. after importing old history.
+    Returns {'months', 'logs', 'summaries'}.
+    """
+    before = before.replace(day=1)
+    logs = TaskLog.objects.filter(completed_at__lt=start_of_day(before))
+    if profile is not None:
+        logs = logs.filter(profile=profile)
+    first = logs.aggregate(first=Min("completed_at"))["first"]
+
+    report = {"months": 0, "logs": 0, "summaries": 0}
+    if first is None:
+        return report
+
+    month = timezone.localdate(first).replace(day=1)
+    while month < before:
+        with transaction.atomic():
+            totals = summarize_month(month, profile, delete=not dry_run)
+            if totals:
+                report["months"] += 1
+                report["logs"] += sum(row["completions"] for row in totals.values())
+                report["summaries"] += (
+                    len(totals) if dry_run else merge_summaries(month, totals)
+                )
+        month = next_month(month)
+    return report
@@ -0,0 +1,90 @@
+from datetime import datetime
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.tasks.models import TaskLog
+from apps.tasks.services.heatmap import invalidate_bitmaps
+from apps.tasks.services.partitions import completed_on
+from apps.tasks.services.rewards import grant_logs, snapshot_rewards, undo_logs
+from apps.tasks.services.rollup import record_logs
+
+
+def complete(task, completed_at=None):
+    """Completes one Task and applies its reward. Returns the new TaskLog."""
+    return complete_many([task], completed_at=completed_at)[0]
+
+
+def uncomplete(task, date):
+    """
+    Undoes every completion of a Task on the given date.
+    Returns the number of removed logs.
+    """
+    return uncomplete_many(TaskLog.objects.filter(task=task, **completed_on(date)))
+
+
+def complete_many(tasks, completed_at=None):
+    """
+    Completes many Tasks in one pass:
+    rewards are snapshotted in memory, the logs are written with one INSERT
+    and each affected profile is updated once.
+    Returns the created TaskLogs (in the order of 'tasks').
+    """
+    completed_at = completed_at or timezone.now()
+    return save_completions(
+        [TaskLog(task=task, completed_at=completed_at) for task in tasks]
+    )
+
+
+def save_completions(logs):
+    """
+    Saves unsaved TaskLogs (task and completed_at already set, e.g. entered
+    in the admin) like complete_many: rewards snapshotted from their Task,
+    one INSERT, each affected profile updated once.
+    Returns the created TaskLogs.
+    """
+    logs = [snapshot_rewards(log, log.task) for log in logs]
+    if not logs:
+        return []
+
+    with transaction.atomic():
+        # bulk_create doesn't fire post_save, so the signal shim stays out of the way
+        logs = TaskLog.objects.bulk_create(logs)
+        grant_logs(logs)
+        record_logs(logs)
+        invalidate_bitmaps(logs)
+
+    return logs
+
+
+def uncomplete_many(logs):
+    """
+    Undoes many completions: one aggregated reward reversal and one DELETE.
+    Returns the number of removed logs.
+    """
+    return undo_logs(logs)
+
+
+def toggle(task, date):
+    """
+    Completes the Task on 'date', or undoes it if already completed that day.
+    Returns the new status ('added' or 'removed').
+    """
+    if uncomplete(task, date):
+        return "removed"
+
+    complete(task, completed_at=completion_time(date))
+    return "added"
+
+
+def completion_time(date):
+    """
+    Timestamp used when completing a Task on 'date'.
+    Now for today, mid-day otherwise (avoids timezone edge cases).
+    """
+    now = timezone.now()
+    if date == now.date():
+        return now
+    return timezone.make_aware(
+        datetime.combine(date, datetime.min.time().replace(hour=12))
+    )
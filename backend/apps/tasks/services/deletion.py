@@ -0,0 +1,79 @@
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from apps.profiles.services.player import bump_data_version
+from apps.tasks.models import MonthlyTaskSummary, Task, TaskLog
+from apps.tasks.services.rewards import revoke_logs
+from apps.tasks.services.rollup import forget_logs
+from core.db import raw_delete
+
+
+def collect_task_tree_ids(tasks):
+    """
+    Returns the ids of the given tasks and all their descendants (subtasks cascade).
+    One query per tree level.
+    """
+    task_ids = set(tasks.values_list("pk", flat=True))
+    frontier = task_ids
+
+    while frontier:
+        frontier = set(
+            Task.objects.filter(parent_id__in=frontier).values_list("pk", flat=True)
+        ) - task_ids
+        task_ids |= frontier
+
+    return task_ids
+
+
+def get_deletion_summary(tasks):
+    """
+    What delete_tasks would remove, for confirmation pages:
+    {'tasks': tasks incl. subtasks, 'logs': completions, 'xp': XP they granted}.
+    """
+    task_ids = collect_task_tree_ids(tasks)
+    logs = TaskLog.objects.filter(task_id__in=task_ids).aggregate(
+        count=Count("id"), xp=Sum("xp_earned")
+    )
+    summaries = MonthlyTaskSummary.objects.filter(task_id__in=task_ids).aggregate(
+        count=Sum("completions"), xp=Sum("xp_earned")
+    )
+    return {
+        "tasks": len(task_ids),
+        "logs": logs["count"] + (summaries["count"] or 0),
+        "xp": (logs["xp"] or 0) + (summaries["xp"] or 0),
+    }
+
+
+def delete_tasks(tasks, revoke_xp=False):
+    """
+    Fast cascade delete for Tasks.
+    The completion history is removed with a single DELETE (no per-log signals).
+    If 'revoke_xp' is True, the XP of that history (compacted months included)
+    is reverted in aggregated passes; otherwise the player keeps what was earned.
+    Returns the number of deleted logs.
+    """
+    with transaction.atomic():
+        task_ids = collect_task_tree_ids(tasks)
+        logs = TaskLog.objects.filter(task_id__in=task_ids)
+
+        if revoke_xp:
+            revoke_logs(logs)
+            # Same reward columns: the compacted months are reverted alike
+            revoke_logs(MonthlyTaskSummary.objects.filter(task_id__in=task_ids))
+        forget_logs(logs)
+
+        deleted_logs = raw_delete(logs)
+        doomed = Task.objects.filter(pk__in=task_ids)
+        bump_data_version(tasks__in=doomed)
+        doomed.delete()
+
+    return deleted_logs
+
+
+def purge_profile_logs(profile_ids):
+    """
+    Removes the whole completion history of the given profiles with one DELETE.
+    Used before deleting users/profiles: their XP is going away with them,
+    so there is nothing to revert.
+    """
+    return raw_delete(TaskLog.objects.filter(profile_id__in=profile_ids))
@@ -0,0 +1,183 @@
+import base64
+from datetime import timedelta
+
+import jdatetime
+from django.db import connection
+from django.db.models import BinaryField, Case, Q, QuerySet, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.tasks.models import HabitYearBitmap, MonthlyTaskSummary, Task, TaskLog
+from apps.tasks.services.compaction import get_days
+from apps.tasks.services.partitions import completed_on
+
+
+def jalali_year_of(date_obj):
+    return jdatetime.date.fromgregorian(date=date_obj).year
+
+
+def get_year_bounds(year):
+    """(first Gregorian day, number of days) of a Jalali year (365 or 366)."""
+    first = jdatetime.date(year, 1, 1)
+    length = (jdatetime.date(year + 1, 1, 1) - first).days
+    return first.togregorian(), length
+
+
+def build_bitmaps(task_ids, year):
+    """
+    {task_id: bytes} for a Jalali year, from one grouped query over the logs
+    and one over the compacted months.
+    Bit N (byte N // 8, least significant bit first) is day N of the year.
+    """
+    start, length = get_year_bounds(year)
+    end = start + timedelta(days=length - 1)
+    bitmaps = {task_id: bytearray((length + 7) // 8) for task_id in task_ids}
+
+    days = list(
+        TaskLog.objects.filter(task_id__in=task_ids, **completed_on(start, end))
+        .order_by()
+        .annotate(day=TruncDate("completed_at"))
+        .values_list("task_id", "day")
+        .distinct()
+    )
+    for task_id, month, bits in MonthlyTaskSummary.objects.filter(
+        task_id__in=task_ids, month__range=(start.replace(day=1), end)
+    ).values_list("task_id", "month", "days"):
+        days += [(task_id, day) for day in get_days(month, bits) if day >= start]
+
+    for task_id, day in days:
+        if day > end:
+            continue
+        index = (day - start).days
+        bitmaps[task_id][index // 8] |= 1 << (index % 8)
+
+    return {task_id: bytes(bits) for task_id, bits in bitmaps.items()}
+
+
+def get_bitmaps(task_ids, year):
+    """
+    {task_id: bytes}: the stored bitmaps, the missing ones built together
+    (one query) and stored for the next read.
+    """
+    stored = {
+        task_id: (bits, version)
+        for task_id, bits, version in HabitYearBitmap.objects.filter(
+            task_id__in=task_ids, year=year
+        ).values_list("task_id", "bits", "version")
+    }
+    bitmaps = {
+        task_id: bytes(bits)
+        for task_id, (bits, _) in stored.items()
+        if bits is not None
+    }
+
+    missing = [task_id for task_id in task_ids if task_id not in bitmaps]
+    if missing:
+        built = build_bitmaps(missing, year)
+        store_bitmaps(
+            year,
+            built,
+            {task_id: stored[task_id][1] for task_id in missing if task_id in stored},
+        )
+        bitmaps.update(built)
+
+    return bitmaps
+
+
+def store_bitmaps(year, built, versions):
+    """
+    Stores built bitmaps, unless a completion invalidated them meanwhile:
+    a row is only filled if its version is still the one read before building
+    ('versions'), a new row only if no invalidation created it first.
+    A pending invalidation holds the row lock, so this waits for its commit
+    and then skips the row: bits built from older logs are never kept.
+    """
+    HabitYearBitmap.objects.bulk_create(
+        [
+            HabitYearBitmap(task_id=task_id, year=year, bits=bits)
+            for task_id, bits in built.items()
+            if task_id not in versions
+        ],
+        ignore_conflicts=True,  # Stored or invalidated meanwhile
+    )
+
+    if versions:
+        condition = Q()
+        for task_id, version in versions.items():
+            condition |= Q(task_id=task_id, version=version)
+        HabitYearBitmap.objects.filter(condition, year=year, bits__isnull=True).update(
+            bits=Case(
+                *[
+                    When(task_id=task_id, then=Value(built[task_id]))
+                    for task_id in versions
+                ],
+                output_field=BinaryField(),
+            )
+        )
+
+
+def invalidate_bitmaps(logs):
+    """
+    Clears the stored bitmaps of the habit-years touched by 'logs'
+    (TaskLog instances or a queryset, read before it is deleted) and bumps
+    their version; a row is created if none is stored yet, so a reader
+    building the bitmap at the same time can't store it (see store_bitmaps).
+    Runs in the writer's transaction. Returns the number of rows.
+    """
+    if isinstance(logs, QuerySet):
+        logs = logs.order_by().values_list("task_id", "completed_at").distinct()
+    else:
+        logs = [(log.task_id, log.completed_at) for log in logs]
+
+    keys = sorted(  # Same lock order in every transaction
+        {
+            (task_id, jalali_year_of(timezone.localdate(completed_at)))
+            for task_id, completed_at in logs
+        }
+    )
+    if not keys:
+        return 0
+
+    table = HabitYearBitmap._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (task_id, year, bits, version)
+            VALUES {", ".join(["(%s, %s, NULL, 0)"] * len(keys))}
+            ON CONFLICT (task_id, year)
+            DO UPDATE SET bits = NULL, version = {table}.version + 1
+            """,
+            [value for key in keys for value in key],
+        )
+        return cursor.rowcount
+
+
+def get_year_heatmap(profile, year=None):
+    """
+    Completions of every active habit over a Jalali year (default: the current one),
+    one base64 bitmap per habit instead of one object per cell.
+    """
+    year = year or jalali_year_of(timezone.localdate())
+    start, length = get_year_bounds(year)
+
+    habits = list(
+        Task.objects.filter(
+            profile=profile, is_active=True, schedule__isnull=False
+        ).values_list("id", "title")
+    )
+    bitmaps = get_bitmaps([task_id for task_id, _ in habits], year)
+
+    return {
+        "year": year,
+        "start": start,
+        "days": length,
+        "habits": [
+            {
+                "id": task_id,
+                "title": title,
+                "completions": int.from_bytes(bitmaps[task_id], "little").bit_count(),
+                "bitmap": base64.b64encode(bitmaps[task_id]).decode(),
+            }
+            for task_id, title in habits
+        ],
+    }
@@ -0,0 +1,175 @@
+import heapq
+from datetime import datetime
+from itertools import islice
+
+from django.db.models import Count, DateField, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services.compaction import iter_compacted_days
+from apps.tasks.services.partitions import start_of_day
+
+HISTORY_PAGE_SIZE = 50
+
+
+def encode_cursor(log):
+    """Position of a log in the history: '<completed_at ISO>_<id>'."""
+    return f"{log.completed_at.isoformat()}_{log.pk}"
+
+
+def decode_cursor(cursor):
+    """Returns (completed_at, id), or None if the cursor is malformed."""
+    try:
+        completed_at, pk = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(completed_at), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def get_history_page(logs, cursor=None, page_size=HISTORY_PAGE_SIZE):
+    """
+    Keyset pagination over a TaskLog queryset, newest first.
+    Each page is one indexed range scan, however far back it is.
+    Returns (logs, next_cursor); next_cursor is None on the last page.
+    """
+    logs = logs.order_by("-completed_at", "-id")
+
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        completed_at, pk = position
+        logs = logs.filter(
+            Q(completed_at__lt=completed_at) | Q(completed_at=completed_at, id__lt=pk)
+        )
+
+    # One extra row tells whether there is a next page
+    page = list(logs[: page_size + 1])
+    if len(page) > page_size:
+        page = page[:page_size]
+        return page, encode_cursor(page[-1])
+    return page, None
+
+
+# --- Whole history: raw logs and compacted days ---
+def get_feed_key(log):
+    """
+    Position in the whole history: (completed_at, 1, id) for a log,
+    (start of the day, 0, task_id) for a compacted day (see get_feed_page).
+    """
+    if log.pk is None:
+        return log.completed_at, 0, log.task_id
+    return log.completed_at, 1, log.pk
+
+
+def encode_feed_cursor(log):
+    """'<completed_at ISO>_<1 for a log, 0 for a compacted day>_<id>'."""
+    completed_at, kind, pk = get_feed_key(log)
+    return f"{completed_at.isoformat()}_{kind}_{pk}"
+
+
+def decode_feed_cursor(cursor):
+    """Returns (completed_at, kind, id), or None if the cursor is malformed."""
+    try:
+        completed_at, kind, pk = cursor.split("_")
+        if kind not in ("0", "1"):
+            return None
+        return datetime.fromisoformat(completed_at), int(kind), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def get_compacted_logs(summaries, before=None):
+    """
+    Yields the completed days of 'summaries' (MonthlyTaskSummary queryset),
+    newest first, as unsaved TaskLogs: the task, 'completed_at' at the start
+    of the day and no reward (only the month's totals are kept).
+    'before' is a feed position (see get_feed_key): only older days are yielded.
+    """
+    if before:
+        summaries = summaries.filter(month__lte=timezone.localdate(before[0]))
+    for day, task_id, title in iter_compacted_days(summaries, newest_first=True):
+        log = TaskLog(
+            task=Task(pk=task_id, title=title),
+            completed_at=start_of_day(day),
+            xp_earned=None,
+        )
+        if before is None or get_feed_key(log) < before:
+            yield log
+
+
+def get_feed_page(logs, summaries, cursor=None, page_size=HISTORY_PAGE_SIZE):
+    """
+    Keyset pagination over a player's whole history, newest first: the logs
+    (TaskLog queryset) merged with the completed days of the compacted months
+    (MonthlyTaskSummary queryset), so compaction doesn't cut the history short.
+    A compacted day is one unsaved TaskLog (pk None) per task and day.
+    Returns (logs, next_cursor); next_cursor is None on the last page.
+    """
+    logs = logs.order_by("-completed_at", "-id")
+
+    position = decode_feed_cursor(cursor) if cursor else None
+    if position:
+        completed_at, kind, pk = position
+        older = Q(completed_at__lt=completed_at)
+        if kind:
+            older |= Q(completed_at=completed_at, id__lt=pk)
+        logs = logs.filter(older)
+
+    # One extra row tells whether there is a next page
+    merged = heapq.merge(
+        logs[: page_size + 1],
+        get_compacted_logs(summaries, position),
+        key=get_feed_key,
+        reverse=True,
+    )
+    page = list(islice(merged, page_size + 1))
+    if len(page) > page_size:
+        page = page[:page_size]
+        return page, encode_feed_cursor(page[-1])
+    return page, None
+
+
+def get_monthly_summary(logs, summaries=None):
+    """
+    Completions and XP per month, newest first (one grouped query),
+    plus the compacted months of 'summaries' (MonthlyTaskSummary queryset).
+    Returns a list of {'month', 'completions', 'xp'}.
+    """
+    months = {
+        row["month"]: row
+        for row in logs.order_by()
+        .annotate(month=TruncMonth("completed_at", output_field=DateField()))
+        .values("month")
+        .annotate(completions=Count("id"), xp=Sum("xp_earned"))
+    }
+    if summaries is not None:
+        for row in (
+            summaries.order_by()
+            .values("month")
+            .annotate(completions=Sum("completions"), xp=Sum("xp_earned"))
+        ):
+            total = months.setdefault(
+                row["month"], {"month": row["month"], "completions": 0, "xp": 0}
+            )
+            total["completions"] += row["completions"]
+            total["xp"] = (total["xp"] or 0) + row["xp"]
+    return sorted(months.values(), key=lambda row: row["month"], reverse=True)
+
+
+def get_task_history(task, cursor=None, page_size=HISTORY_PAGE_SIZE):
+    """
+    History panel of a Task: one page of logs, plus the monthly summary
+    (compacted months included) on the first page.
+    """
+    logs = TaskLog.objects.filter(task=task)
+    page, next_cursor = get_history_page(logs, cursor, page_size)
+    for log in page:
+        log.task = task  # __str__ needs it, skip the query
+
+    return {
+        "logs": page,
+        "next_cursor": next_cursor,
+        "months": (
+            None if cursor else get_monthly_summary(logs, task.monthly_summaries.all())
+        ),
+    }
@@ -0,0 +1,217 @@
+import csv
+import json
+import time
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.profiles.services.player import bump_data_version
+from apps.tasks.forms import HistoryImportRowForm
+from apps.tasks.models import Task, TaskLog, TaskSchedule
+from apps.tasks.ordering import ORDER_GAP, get_next_order
+from apps.tasks.services.compaction import get_compacted_days
+from apps.tasks.services.heatmap import invalidate_bitmaps
+from apps.tasks.services.rewards import grant_totals, snapshot_rewards, sum_rewards
+from apps.tasks.services.rollup import record_logs
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_FORMATS = ["csv", "json", "jsonl"]
+
+
+def read_rows(stream, file_format):
+    """
+    Yields (line_number, row dict) from a text stream.
+    csv: a header line, then one completion per line.
+    json: a list of objects. jsonl: one object per line.
+    Malformed JSON lines are yielded as None (reported as failed rows).
+    """
+    if file_format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif file_format == "json":
+        for index, row in enumerate(json.load(stream), start=1):
+            yield index, row if isinstance(row, dict) else None
+    else:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else None
+
+
+def task_key(title):
+    """Titles are matched the way Task.save() normalizes them."""
+    return title.strip().title()
+
+
+class HistoryImporter:
+    """
+    Imports completions for one player in batches:
+    each batch is validated, then its new tasks, schedules and logs are
+    written with one bulk_create each (no per-row reward signals).
+    The rewards are summed along the way and granted once at the end,
+    so the profile and stats are locked and saved a single time.
+    """
+
+    def __init__(self, profile, batch_size=IMPORT_BATCH_SIZE):
+        self.profile = profile
+        self.batch_size = batch_size
+        self.tasks = {}
+        self.totals = {}
+        self.report = {
+            "rows": 0,
+            "imported": 0,
+            "duplicates": 0,
+            "tasks_created": 0,
+            "schedules_created": 0,
+            "failed": [],  # (line_number, errors)
+            "seconds": 0.0,
+        }
+
+    def run(self, rows, dry_run=False):
+        """
+        Imports an iterable of (line_number, row dict) and returns the report.
+        Invalid rows are skipped and listed in report["failed"].
+        Everything is written in one transaction; 'dry_run' rolls it back.
+        """
+        started = time.perf_counter()
+        rows = iter(rows)
+
+        with transaction.atomic():
+            self.load_tasks()
+            while batch := list(islice(rows, self.batch_size)):
+                self.import_batch(batch)
+
+            grant_totals(self.totals)
+            if self.report["tasks_created"]:
+                bump_data_version(pk=self.profile.pk)
+
+            if dry_run:
+                transaction.set_rollback(True)
+
+        self.report["seconds"] = time.perf_counter() - started
+        return self.report
+
+    def load_tasks(self):
+        """Existing top-level tasks of the player, by normalized title."""
+        for task in Task.objects.filter(profile=self.profile, parent__isnull=True):
+            self.tasks.setdefault(task_key(task.title), task)
+
+    def import_batch(self, batch):
+        self.report["rows"] += len(batch)
+
+        completions = self.validate(batch)
+        self.create_tasks(completions)
+
+        logs = []
+        for data in completions:
+            task = self.tasks[task_key(data["task"])]
+            log = TaskLog(task=task, completed_at=data["completed_at"])
+            logs.append(snapshot_rewards(log, task))
+        logs = self.drop_duplicates(logs)
+
+        TaskLog.objects.bulk_create(logs)
+        sum_rewards(logs, self.totals)
+        record_logs(logs)
+        invalidate_bitmaps(logs)
+        self.report["imported"] += len(logs)
+
+    def validate(self, batch):
+        """Returns the cleaned data of the valid rows, records the others."""
+        completions = []
+        for line_number, row in batch:
+            if row is None:
+                error = {"message": "Malformed row.", "code": "invalid"}
+                self.report["failed"].append((line_number, {"row": [error]}))
+                continue
+
+            form = HistoryImportRowForm(data=row)
+            if form.is_valid():
+                completions.append(form.cleaned_data)
+            else:
+                self.report["failed"].append((line_number, form.errors.get_json_data()))
+        return completions
+
+    def create_tasks(self, completions):
+        """Creates the tasks (and schedules) of the batch that don't exist yet."""
+        new_tasks = {}
+        schedules = {}
+        for data in completions:
+            key = task_key(data["task"])
+            if key in self.tasks or key in new_tasks:
+                continue
+
+            task = Task(
+                profile=self.profile,
+                title=data["task"],
+                secondary_stat=data["secondary_stat"] or None,
+                manual_rank=data["rank"] or None,
+            )
+            if data["primary_stat"]:
+                task.primary_stat = data["primary_stat"]
+            task.prepare_for_save()  # bulk_create skips save()
+            new_tasks[key] = task
+            if data["frequency"]:
+                schedules[key] = data["frequency"]
+
+        if not new_tasks:
+            return
+
+        # Appended after the player's tasks (bulk_create skips save())
+        order = get_next_order(Task.objects.filter(profile=self.profile, parent=None))
+        for position, task in enumerate(new_tasks.values()):
+            task.order = order + position * ORDER_GAP
+        Task.objects.bulk_create(new_tasks.values())
+        TaskSchedule.objects.bulk_create(
+            TaskSchedule(task=new_tasks[key], frequency=frequency)
+            for key, frequency in schedules.items()
+        )
+        self.tasks.update(new_tasks)
+        self.report["tasks_created"] += len(new_tasks)
+        self.report["schedules_created"] += len(schedules)
+
+    def drop_duplicates(self, logs):
+        """
+        Skips completions already recorded (same task and time), in the
+        database or earlier in the file, so an import can be run again safely.
+        Compacted months only know the days: any completion on such a day is skipped.
+        """
+        if not logs:
+            return logs
+
+        task_ids = {log.task_id for log in logs}
+        existing = set(
+            TaskLog.objects.filter(
+                task__in=task_ids,
+                completed_at__in={log.completed_at for log in logs},
+            ).values_list("task_id", "completed_at")
+        )
+        compacted = get_compacted_days(
+            task_ids,
+            {timezone.localdate(log.completed_at).replace(day=1) for log in logs},
+        )
+
+        unique = []
+        for log in logs:
+            key = (log.task_id, log.completed_at)
+            if key in existing or (
+                (log.task_id, timezone.localdate(log.completed_at)) in compacted
+            ):
+                self.report["duplicates"] += 1
+                continue
+            existing.add(key)
+            unique.append(log)
+        return unique
+
+
+def import_history(
+    profile, stream, file_format, batch_size=IMPORT_BATCH_SIZE, dry_run=False
+):
+    """Imports a CSV/JSON/JSONL text stream of completions. Returns the report."""
+    importer = HistoryImporter(profile, batch_size=batch_size)
+    return importer.run(read_rows(stream, file_format), dry_run=dry_run)
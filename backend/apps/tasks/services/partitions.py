@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+# TaskLog is range partitioned by month of 'completed_at' (local time),
+# see migration 0009. Rows outside every month land in the default partition.
+PARENT_TABLE = "tasks_tasklog"
+DEFAULT_PARTITION = "tasks_tasklog_default"
+PARTITION_PREFIX = "tasks_tasklog_p"
+ARCHIVE_PREFIX = "tasks_tasklog_archive_"
+
+MONTHS_AHEAD = 3
+
+
+# --- Date-bounded filters (let Postgres prune the partitions) ---
+def start_of_day(date_obj):
+    """Aware datetime for 00:00 of the given date in the current timezone."""
+    return timezone.make_aware(datetime.combine(date_obj, datetime.min.time()))
+
+
+def completed_on(start, end=None):
+    """
+    Filter kwargs for the logs completed from 'start' to 'end' (local dates,
+    inclusive; default: that single day). A plain range on the partition key,
+    unlike 'completed_at__date', so only the matching months are scanned.
+    """
+    end = end or start
+    return {
+        "completed_at__gte": start_of_day(start),
+        "completed_at__lt": start_of_day(end + timedelta(days=1)),
+    }
+
+
+# --- Partition management ---
+def next_month(month):
+    return (month + timedelta(days=32)).replace(day=1)
+
+
+def partition_name(month):
+    return f"{PARTITION_PREFIX}{month:%Y_%m}"
+
+
+def partition_month(name):
+    """The month of a partition (or archive) table name, None for others."""
+    for prefix in (PARTITION_PREFIX, ARCHIVE_PREFIX):
+        if name.startswith(prefix):
+            try:
+                return datetime.strptime(name[len(prefix) :], "%Y_%m").date()
+            except ValueError:
+                return None
+    return None
+
+
+def month_bounds(month):
+    """SQL literals of [first instant of the month, first instant of the next)."""
+    return (
+        f"'{start_of_day(month).isoformat()}'",
+        f"'{start_of_day(next_month(month)).isoformat()}'",
+    )
+
+
+def list_partitions():
+    """[(table name, estimated rows)] of the attached partitions, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname, child.reltuples::bigint
+            FROM pg_inherits
+            JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            ORDER BY child.relname
+            """,
+            [PARENT_TABLE],
+        )
+        return [(name, max(rows, 0)) for name, rows in cursor.fetchall()]
+
+
+def get_default_months():
+    """Months that have rows in the default partition (e.g. imported history)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT DISTINCT date_trunc('month', completed_at AT TIME ZONE %s)::date
+            FROM {DEFAULT_PARTITION}
+            """,
+            [timezone.get_current_timezone_name()],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def create_partition(month, lock_timeout_ms=5000):
+    """
+    Creates the partition of a month: the empty table is filled with the month's
+    rows from the default partition, then attached.
+    ATTACH takes SHARE UPDATE EXCLUSIVE on the parent, but ACCESS EXCLUSIVE on
+    the default partition, which Postgres scans to check that none of its rows
+    belong in the new range: out-of-range rows (imports, dates beyond the
+    created months) wait for that scan. This is why ensure_partitions creates
+    the months ahead of time, so the default partition normally stays empty.
+    """
+    name = partition_name(month)
+    start, end = month_bounds(month)
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Give up rather than queue behind long queries (and block the table)
+        cursor.execute(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}")
+        cursor.execute(
+            f"CREATE TABLE {name} "
+            f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        # Proves the bounds up front, so ATTACH doesn't scan the table
+        cursor.execute(
+            f"ALTER TABLE {name} ADD CONSTRAINT {name}_bounds "
+            f"CHECK (completed_at >= {start} AND completed_at < {end})"
+        )
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            f"WHERE completed_at >= {start} AND completed_at < {end} RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        )
+        cursor.execute(
+            f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM ({start}) TO ({end})"
+        )
+        cursor.execute(f"ALTER TABLE {name} DROP CONSTRAINT {name}_bounds")
+    return name
+
+
+def ensure_partitions(months_ahead=MONTHS_AHEAD, today=None, lock_timeout_ms=5000):
+    """
+    Creates the missing partitions: this month and the next 'months_ahead',
+    plus any month that has rows waiting in the default partition.
+    Returns the names of the created partitions.
+    """
+    month = (today or timezone.localdate()).replace(day=1)
+    wanted = set(get_default_months())
+    for _ in range(months_ahead + 1):
+        wanted.add(month)
+        month = next_month(month)
+
+    existing = {partition_month(name) for name, _ in list_partitions()}
+    return [
+        create_partition(month, lock_timeout_ms)
+        for month in sorted(wanted - existing)
+    ]
+
+
+def archive_partitions(before, lock_timeout_ms=5000):
+    """
+    Detaches the partitions of the months before 'before' (a date) and renames
+    them 'tasks_tasklog_archive_YYYY_MM': the rows leave the live table with a
+    metadata-only change, ready to be dumped and dropped.
+    Rewards and rollups are unaffected (they are stored separately).
+    Returns the names of the archive tables.
+    """
+    before = before.replace(day=1)
+    archived = []
+    for name, _ in list_partitions():
+        month = partition_month(name)
+        if month is None or month >= before:
+            continue
+
+        archive = f"{ARCHIVE_PREFIX}{month:%Y_%m}"
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Give up rather than queue behind long queries (and block the table)
+            cursor.execute(f"SET LOCAL lock_timeout = {int(lock_timeout_ms)}")
+            cursor.execute(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}")
+            cursor.execute(f"ALTER TABLE {name} RENAME TO {archive}")
+        archived.append(archive)
+    return archived
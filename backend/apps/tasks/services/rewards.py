@@ -0,0 +1,134 @@
+from django.db import transaction
+from django.db.models import Sum
+
+from apps.profiles.models import PlayerProfile, PlayerStats
+from apps.profiles.services.progression import grant_xp, revoke_xp
+from apps.tasks.models import TaskLog
+from apps.tasks.services.heatmap import invalidate_bitmaps
+from apps.tasks.services.rollup import forget_logs
+from core.db import raw_delete
+
+STAT_KEYS = PlayerStats.StatType.values
+
+
+def snapshot_rewards(log, task):
+    """Stores the Task's current reward (and its exact split) on the log."""
+    log.set_rewards(task.xp_reward, task.xp_distribution)
+    if not log.profile_id:
+        log.profile_id = task.profile_id
+    return log
+
+
+def grant_logs(logs):
+    """
+    Applies the rewards already snapshotted on many TaskLogs.
+    Rewards are summed per profile in Python, then each profile is
+    locked, updated and saved once.
+    Returns the number of profiles updated.
+    """
+    return grant_totals(sum_rewards(logs))
+
+
+def sum_rewards(logs, totals=None):
+    """
+    Adds the rewards of 'logs' to the per-profile 'totals' (a new dict if None):
+    {profile_id: {"xp", "distribution", "gained_at"}}.
+    Lets long imports accumulate batch after batch, then grant once.
+    """
+    totals = {} if totals is None else totals
+    for log in logs:
+        row = totals.setdefault(
+            log.profile_id, {"xp": 0, "distribution": {}, "gained_at": {}}
+        )
+        row["xp"] += log.xp_earned
+        for stat_key, amount in log.xp_distribution.items():
+            row["distribution"][stat_key] = row["distribution"].get(stat_key, 0) + amount
+            last = row["gained_at"].get(stat_key)
+            if last is None or log.completed_at > last:
+                row["gained_at"][stat_key] = log.completed_at
+    return totals
+
+
+def grant_totals(totals):
+    """
+    Applies per-profile totals (see sum_rewards): each profile is
+    locked, updated and saved once. Returns the number of profiles updated.
+    """
+    if not totals:
+        return 0
+
+    updated = 0
+    with transaction.atomic():
+        profiles = (
+            PlayerProfile.objects.select_for_update(of=("self",))
+            .select_related("stats")
+            .filter(pk__in=totals)
+            .order_by("pk")
+        )
+        for profile in profiles:
+            row = totals[profile.pk]
+            stats = profile.stats
+            grant_xp(
+                profile,
+                stats,
+                row["xp"],
+                row["distribution"],
+                gained_at=row["gained_at"],
+            )
+
+            profile.save()
+            stats.save()
+            updated += 1
+
+    return updated
+
+
+def revoke_logs(logs):
+    """
+    Reverts the rewards of many TaskLogs with one aggregated query.
+    Uses only the split stored on each log (no join to Task).
+    Returns the number of profiles updated.
+    """
+    totals = (
+        logs.order_by()
+        .values("profile")
+        .annotate(
+            xp=Sum("xp_earned"),
+            **{key: Sum(f"{key.lower()}_xp") for key in STAT_KEYS},
+        )
+    )
+
+    updated = 0
+    with transaction.atomic():
+        for row in totals:
+            profile = (
+                PlayerProfile.objects.select_for_update(of=("self",))
+                .select_related("stats")
+                .filter(pk=row["profile"])
+                .first()
+            )
+            if not profile:
+                continue
+
+            distribution = {key: row[key] for key in STAT_KEYS if row[key]}
+            stats = profile.stats
+            revoke_xp(profile, stats, row["xp"] or 0, distribution)
+
+            profile.save()
+            stats.save()
+            updated += 1
+
+    return updated
+
+
+def undo_logs(logs):
+    """
+    Bulk undo: reverts the aggregated rewards, then deletes the logs
+    in a single DELETE without firing the per-row undo signal.
+    Returns the number of deleted logs.
+    """
+    with transaction.atomic():
+        revoke_logs(logs)
+        forget_logs(logs)
+        invalidate_bitmaps(logs)
+        return raw_delete(logs)
@@ -0,0 +1,257 @@
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DateField, F, Min, Q, Sum, Value
+from django.db.models.functions import Greatest, Trunc, TruncDate
+from django.utils import timezone
+
+from apps.profiles.models import PlayerStats
+from apps.tasks.models import (
+    DailyCompletionRollup,
+    MonthlyTaskSummary,
+    TaskLog,
+    TaskSchedule,
+)
+from apps.tasks.services.partitions import completed_on
+
+COUNTER_FIELDS = DailyCompletionRollup.COUNTER_FIELDS
+STAT_FIELDS = [f"{key.lower()}_xp" for key in PlayerStats.StatType.values]
+
+SERIES_BUCKETS = ["day", "month", "year"]
+
+
+# --- Deltas: {(profile_id, date): {counter: amount}} ---
+def count_logs(logs):
+    """Deltas of TaskLog instances (e.g. just created), in Python."""
+    logs = list(logs)
+    habit_ids = set(
+        TaskSchedule.objects.filter(
+            task_id__in={log.task_id for log in logs}
+        ).values_list("task_id", flat=True)
+    )
+
+    deltas = {}
+    for log in logs:
+        key = (log.profile_id, timezone.localdate(log.completed_at))
+        row = deltas.setdefault(key, dict.fromkeys(COUNTER_FIELDS, 0))
+        row["completions"] += 1
+        row["habit_completions"] += log.task_id in habit_ids
+        row["xp"] += log.xp_earned
+        for field in STAT_FIELDS:
+            row[field] += getattr(log, field)
+    return deltas
+
+
+def aggregate_logs(logs):
+    """Deltas of a TaskLog queryset, with one grouped query."""
+    rows = (
+        logs.order_by()
+        .annotate(day=TruncDate("completed_at"))
+        .values("profile", "day")
+        .annotate(
+            completions=Count("id"),
+            habit_completions=Count("id", filter=Q(task__schedule__isnull=False)),
+            xp=Sum("xp_earned"),
+            **{field: Sum(field) for field in STAT_FIELDS},
+        )
+    )
+    return {
+        (row["profile"], row["day"]): {field: row[field] for field in COUNTER_FIELDS}
+        for row in rows
+    }
+
+
+def count_due_habits(profile_id, dates):
+    """{date: number of active habits scheduled that day}, one query."""
+    schedules = list(
+        TaskSchedule.objects.filter(
+            task__profile_id=profile_id, task__is_active=True
+        ).only("frequency", "weekdays", "start_time")
+    )
+    due = {}
+    for day in dates:
+        due[day] = sum(
+            1
+            for schedule in schedules
+            if schedule.is_due(day)
+            and not (
+                schedule.start_time and day < timezone.localdate(schedule.start_time)
+            )
+        )
+    return due
+
+
+# --- Incremental updates (called by the completion paths) ---
+def record_logs(logs):
+    """Adds new TaskLog instances to the rollups."""
+    add_deltas(count_logs(logs))
+
+
+def forget_logs(logs):
+    """Removes a TaskLog queryset from the rollups. Call it before the DELETE."""
+    subtract_deltas(aggregate_logs(logs))
+
+
+def add_deltas(deltas):
+    """
+    One UPDATE per (player, day) with F() increments, so concurrent
+    completions never lose a count; the first completion of a day creates its row.
+    """
+    with transaction.atomic():
+        for profile_id, days in group_by_profile(deltas).items():
+            due = count_due_habits(profile_id, days)
+            for day in sorted(days):
+                counts = deltas[(profile_id, day)]
+                changes = {field: F(field) + counts[field] for field in COUNTER_FIELDS}
+                rollup = DailyCompletionRollup.objects.filter(
+                    profile_id=profile_id, date=day
+                )
+                if rollup.update(habits_due=due[day], **changes):
+                    continue
+                try:
+                    with transaction.atomic():
+                        DailyCompletionRollup.objects.create(
+                            profile_id=profile_id,
+                            date=day,
+                            habits_due=due[day],
+                            **counts,
+                        )
+                except IntegrityError:
+                    # Created meanwhile by a concurrent completion
+                    rollup.update(habits_due=due[day], **changes)
+
+
+def subtract_deltas(deltas):
+    """Decrements the rollups (never below zero: a drifted row stays valid)."""
+    with transaction.atomic():
+        for (profile_id, day), counts in sorted(deltas.items()):
+            DailyCompletionRollup.objects.filter(profile_id=profile_id, date=day).update(
+                **{
+                    field: Greatest(F(field) - counts[field], Value(0))
+                    for field in COUNTER_FIELDS
+                    if counts[field]
+                }
+            )
+
+
+def group_by_profile(deltas):
+    days = {}
+    for profile_id, day in deltas:
+        days.setdefault(profile_id, []).append(day)
+    return days
+
+
+# --- Repair ---
+def rebuild_rollups(profile, start=None, end=None, dry_run=False):
+    """
+    Recomputes a player's rollups from TaskLog and fixes the rows that drifted.
+    Days with completions or due habits get a row; the others have none.
+    'start'/'end' default to the first completion and today.
+    Returns {'created', 'updated', 'deleted'}.
+    """
+    logs = TaskLog.objects.filter(profile=profile)
+    end = end or timezone.localdate()
+    start = start or timezone.localdate(
+        logs.aggregate(first=Min("completed_at"))["first"] or timezone.now()
+    )
+    # Compacted months have no logs left to count: their rollups are kept as is
+    compacted = set(
+        MonthlyTaskSummary.objects.filter(
+            profile=profile, month__range=(start.replace(day=1), end)
+        ).values_list("month", flat=True)
+    )
+    days = [
+        day
+        for day in (start + timedelta(days=n) for n in range((end - start).days + 1))
+        if day.replace(day=1) not in compacted
+    ]
+
+    counts = aggregate_logs(logs.filter(**completed_on(start, end)))
+    due = count_due_habits(profile.pk, days)
+
+    expected = {}
+    for day in days:
+        row = counts.get((profile.pk, day))
+        if row is None and not due[day]:
+            continue
+        expected[day] = {
+            **(row or dict.fromkeys(COUNTER_FIELDS, 0)),
+            "habits_due": due[day],
+        }
+
+    existing = {
+        rollup.date: rollup
+        for rollup in DailyCompletionRollup.objects.filter(
+            profile=profile, date__range=(start, end)
+        )
+        if rollup.date.replace(day=1) not in compacted
+    }
+
+    to_create, to_update = [], []
+    for day, values in expected.items():
+        rollup = existing.get(day)
+        if rollup is None:
+            to_create.append(
+                DailyCompletionRollup(profile=profile, date=day, **values)
+            )
+        elif any(getattr(rollup, field) != value for field, value in values.items()):
+            for field, value in values.items():
+                setattr(rollup, field, value)
+            to_update.append(rollup)
+    stale = [rollup.pk for day, rollup in existing.items() if day not in expected]
+
+    if not dry_run:
+        with transaction.atomic():
+            DailyCompletionRollup.objects.bulk_create(to_create)
+            DailyCompletionRollup.objects.bulk_update(
+                to_update, [*COUNTER_FIELDS, "habits_due"]
+            )
+            DailyCompletionRollup.objects.filter(pk__in=stale).delete()
+
+    return {"created": len(to_create), "updated": len(to_update), "deleted": len(stale)}
+
+
+# --- Charts ---
+def get_completion_series(profile, start, end, bucket="day"):
+    """
+    Totals per day, month or year between 'start' and 'end' (inclusive),
+    read from the rollups only. Periods without activity are filled with zeros.
+    Returns a list of {'period', 'completions', 'habit_completions',
+    'habits_due', 'xp', 'str_xp', ...}.
+    """
+    rows = (
+        DailyCompletionRollup.objects.filter(profile=profile, date__range=(start, end))
+        .annotate(period=Trunc("date", bucket, output_field=DateField()))
+        .values("period")
+        .annotate(
+            habits_due=Sum("habits_due"),
+            **{field: Sum(field) for field in COUNTER_FIELDS},
+        )
+        .order_by("period")
+    )
+    totals = {row["period"]: row for row in rows}
+
+    empty = dict.fromkeys(["habits_due", *COUNTER_FIELDS], 0)
+    return [
+        totals.get(period, {"period": period, **empty})
+        for period in iter_periods(start, end, bucket)
+    ]
+
+
+def iter_periods(start, end, bucket):
+    """First day of each day/month/year period from 'start' to 'end'."""
+    if bucket == "day":
+        period = start
+    elif bucket == "month":
+        period = start.replace(day=1)
+    else:
+        period = start.replace(month=1, day=1)
+
+    while period <= end:
+        yield period
+        if bucket == "day":
+            period += timedelta(days=1)
+        elif bucket == "month":
+            period = (period + timedelta(days=32)).replace(day=1)
+        else:
+            period = period.replace(year=period.year + 1)
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.tests.utils import make_player, plain_static
+
+
+def get_form_data(response):
+    """POST data of an admin change form, as rendered (main form and inlines)."""
+    data = {}
+
+    def add(form):
+        for name, field in form.fields.items():
+            value = form[name].value()
+            if value is None or field.disabled:
+                continue
+            if isinstance(value, (list, tuple)):
+                data[form.add_prefix(name)] = [str(v) for v in value]
+            elif isinstance(value, bool):
+                if value:
+                    data[form.add_prefix(name)] = "on"
+            else:
+                data[form.add_prefix(name)] = str(value)
+
+    add(response.context["adminform"].form)
+    for inline in response.context["inline_admin_formsets"]:
+        formset = inline.formset
+        add(formset.management_form)
+        for form in formset.forms:
+            add(form)
+    return data
+
+
+@plain_static
+class CompletionFormsetTests(TestCase):
+    def setUp(self):
+        self.admin = make_player("admin", is_staff=True, is_superuser=True)
+        self.task = Task.objects.create(
+            profile=self.admin, title="Run", primary_stat="STR", manual_rank="D"
+        )
+        self.client.force_login(self.admin.user)
+        self.url = reverse("admin:tasks_onetimetask_change", args=[self.task.pk])
+
+    def post(self, changes):
+        data = get_form_data(self.client.get(self.url))
+        data.update(changes)
+        response = self.client.post(self.url, data)
+        self.assertEqual(response.status_code, 302)
+        return response
+
+    def test_new_row_keeps_the_entered_time_and_grants_once(self):
+        completed_at = timezone.localtime() - timedelta(days=3)
+
+        self.post(
+            {
+                "logs-TOTAL_FORMS": "1",
+                "logs-0-task": str(self.task.pk),
+                "logs-0-completed_at_0": completed_at.strftime("%Y-%m-%d"),
+                "logs-0-completed_at_1": completed_at.strftime("%H:%M:%S"),
+            }
+        )
+
+        log = TaskLog.objects.get(task=self.task)
+        self.assertEqual(
+            log.completed_at.replace(microsecond=0),
+            completed_at.replace(microsecond=0),
+        )
+        self.assertEqual(log.xp_earned, 35)
+        self.admin.stats.refresh_from_db()
+        self.assertEqual(self.admin.stats.str_xp, 35)
+
+    def test_saved_rows_are_read_only(self):
+        log = completion.complete(self.task)
+        tomorrow = timezone.localtime() + timedelta(days=1)
+
+        self.post(
+            {
+                "logs-0-completed_at_0": tomorrow.strftime("%Y-%m-%d"),
+                "logs-0-xp_earned": "9999",
+            }
+        )
+
+        self.assertEqual(TaskLog.objects.get().completed_at, log.completed_at)
+        self.assertEqual(TaskLog.objects.get().xp_earned, 35)
+
+    def test_deleted_row_is_undone(self):
+        completion.complete(self.task)
+
+        self.post({"logs-0-DELETE": "on"})
+
+        self.assertFalse(TaskLog.objects.exists())
+        self.admin.stats.refresh_from_db()
+        self.assertEqual(self.admin.stats.str_xp, 0)
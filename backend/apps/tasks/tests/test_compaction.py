@@ -0,0 +1,117 @@
+from datetime import date
+
+from django.test import TestCase
+
+from apps.tasks.models import MonthlyTaskSummary, Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.compaction import (
+    compact_logs,
+    get_days,
+    merge_summaries,
+    set_days,
+    summarize_month,
+)
+from apps.tasks.tests.utils import at, make_player
+
+AUGUST = date(2024, 8, 1)
+
+
+class DaysBitmapTests(TestCase):
+    def test_round_trip(self):
+        dates = [AUGUST, AUGUST.replace(day=9), AUGUST.replace(day=31)]
+
+        days = set_days(None, dates)
+
+        self.assertEqual(len(days), 4)
+        self.assertEqual(get_days(AUGUST, days), dates)
+
+    def test_set_days_adds_to_the_bitmap(self):
+        days = set_days(set_days(None, [AUGUST]), [AUGUST.replace(day=2), AUGUST])
+
+        self.assertEqual(get_days(AUGUST, days), [AUGUST, AUGUST.replace(day=2)])
+
+
+class CompactionTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.read = Task.objects.create(
+            profile=self.profile, title="Read", manual_rank="E"
+        )
+        self.run = Task.objects.create(
+            profile=self.profile, title="Run", manual_rank="D"
+        )
+        completion.save_completions(
+            [
+                # Twice on the 3rd: one bit, two completions
+                TaskLog(task=self.read, completed_at=at(date(2024, 8, 3), 7)),
+                TaskLog(task=self.read, completed_at=at(date(2024, 8, 3), 21)),
+                TaskLog(task=self.read, completed_at=at(date(2024, 8, 31), 23)),
+                TaskLog(task=self.run, completed_at=at(date(2024, 8, 10))),
+                TaskLog(task=self.run, completed_at=at(date(2024, 9, 1), 0)),
+                TaskLog(task=self.run, completed_at=at(date(2025, 1, 5))),
+            ]
+        )
+
+    def summaries(self):
+        return {
+            (summary.task_id, summary.month): (
+                summary.completions,
+                summary.xp_earned,
+                get_days(summary.month, summary.days),
+            )
+            for summary in MonthlyTaskSummary.objects.all()
+        }
+
+    def test_summarize_then_merge_round_trip(self):
+        merge_summaries(AUGUST, summarize_month(AUGUST, delete=False))
+
+        self.assertEqual(
+            self.summaries(),
+            {
+                (self.read.pk, AUGUST): (
+                    3,
+                    45,
+                    [date(2024, 8, 3), date(2024, 8, 31)],
+                ),
+                (self.run.pk, AUGUST): (1, 35, [date(2024, 8, 10)]),
+            },
+        )
+        # Without 'delete' the logs stay
+        self.assertEqual(TaskLog.objects.count(), 6)
+
+    def test_compaction_folds_whole_months_before_the_cutoff(self):
+        self.profile.refresh_from_db()
+        xp = self.profile.xp_current
+
+        report = compact_logs(date(2024, 10, 15))
+
+        self.assertEqual(report, {"months": 2, "logs": 5, "summaries": 3})
+        self.assertEqual(
+            list(TaskLog.objects.values_list("completed_at", flat=True)),
+            [at(date(2025, 1, 5))],
+        )
+        self.assertEqual(
+            self.summaries()[(self.run.pk, date(2024, 9, 1))],
+            (1, 35, [date(2024, 9, 1)]),
+        )
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.xp_current, xp)
+
+    def test_later_compaction_merges_into_the_month(self):
+        compact_logs(date(2024, 9, 1))
+        completion.complete(self.read, at(date(2024, 8, 4)))
+
+        report = compact_logs(date(2024, 9, 1))
+
+        self.assertEqual(report, {"months": 1, "logs": 1, "summaries": 1})
+        self.assertEqual(
+            self.summaries()[(self.read.pk, AUGUST)],
+            (4, 60, [date(2024, 8, 3), date(2024, 8, 4), date(2024, 8, 31)]),
+        )
+
+    def test_dry_run_keeps_the_logs(self):
+        report = compact_logs(date(2024, 10, 1), dry_run=True)
+
+        self.assertEqual(report["logs"], 5)
+        self.assertEqual(TaskLog.objects.count(), 6)
+        self.assertFalse(MonthlyTaskSummary.objects.exists())
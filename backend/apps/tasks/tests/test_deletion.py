@@ -0,0 +1,110 @@
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.auth.models import Permission
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.deletion import delete_tasks, get_deletion_summary
+from apps.tasks.tests.utils import make_player, plain_static
+
+
+class DeleteTasksTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.routine = Task.objects.create(
+            profile=self.profile, title="Morning", manual_rank="E"
+        )
+        self.subtask = Task.objects.create(
+            profile=self.profile, parent=self.routine, title="Stretch", manual_rank="D"
+        )
+        self.kept = Task.objects.create(
+            profile=self.profile, title="Read", primary_stat="INT", manual_rank="E"
+        )
+        completion.complete_many([self.routine, self.subtask, self.subtask, self.kept])
+
+    def player_state(self):
+        self.profile.refresh_from_db()
+        self.profile.stats.refresh_from_db()
+        return self.profile.level, self.profile.xp_current, self.profile.stats.str_xp
+
+    def test_summary_covers_the_subtasks(self):
+        summary = get_deletion_summary(Task.objects.filter(pk=self.routine.pk))
+
+        self.assertEqual(summary, {"tasks": 2, "logs": 3, "xp": 15 + 35 * 2})
+
+    def test_cascade_keeps_the_earned_xp(self):
+        before = self.player_state()
+
+        deleted = delete_tasks(Task.objects.filter(pk=self.routine.pk))
+
+        self.assertEqual(deleted, 3)
+        self.assertEqual(self.player_state(), before)
+        self.assertQuerySetEqual(
+            Task.objects.values_list("pk", flat=True), [self.kept.pk]
+        )
+        self.assertEqual(TaskLog.objects.get().task_id, self.kept.pk)
+
+    def test_cascade_with_revoke_takes_the_xp_back(self):
+        deleted = delete_tasks(
+            Task.objects.filter(pk=self.routine.pk), revoke_xp=True
+        )
+
+        self.assertEqual(deleted, 3)
+        self.profile.refresh_from_db()
+        self.profile.stats.refresh_from_db()
+        # Only the kept task's completion is left
+        self.assertEqual((self.profile.level, self.profile.xp_current), (1, 15))
+        self.assertEqual(self.profile.stats.str_xp, 0)
+        self.assertEqual(self.profile.stats.int_xp, 15)
+
+    def test_plain_orm_delete_keeps_the_earned_xp(self):
+        before = self.player_state()
+
+        self.routine.delete()
+
+        self.assertEqual(self.player_state(), before)
+        self.assertEqual(TaskLog.objects.count(), 1)
+
+
+@plain_static
+class DeleteAndRevokeActionTests(TestCase):
+    def setUp(self):
+        self.admin = make_player("admin", is_staff=True, is_superuser=True)
+        self.task = Task.objects.create(profile=self.admin, title="Run")
+        completion.complete(self.task)
+        self.client.force_login(self.admin.user)
+        self.url = reverse("admin:tasks_onetimetask_changelist")
+        self.data = {
+            "action": "delete_and_revoke_xp",
+            ACTION_CHECKBOX_NAME: [self.task.pk],
+        }
+
+    def test_asks_for_confirmation_first(self):
+        response = self.client.post(self.url, self.data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "This can't be undone")
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
+
+    def test_deletes_and_revokes_once_confirmed(self):
+        response = self.client.post(self.url, {**self.data, "post": "yes"})
+
+        self.assertRedirects(response, self.url)
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+        self.admin.refresh_from_db()
+        self.assertEqual(self.admin.xp_current, 0)
+
+    def test_requires_the_delete_permission(self):
+        user = self.admin.user
+        user.is_superuser = False
+        user.save()
+        user.user_permissions.set(
+            Permission.objects.filter(
+                codename__in=["view_onetimetask", "change_onetimetask"]
+            )
+        )
+
+        self.client.post(self.url, {**self.data, "post": "yes"})
+
+        self.assertTrue(Task.objects.filter(pk=self.task.pk).exists())
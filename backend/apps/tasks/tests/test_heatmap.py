@@ -0,0 +1,100 @@
+import base64
+from datetime import timedelta
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.tasks.models import HabitYearBitmap, Task, TaskSchedule
+from apps.tasks.services import completion, heatmap
+from apps.tasks.services.compaction import compact_logs
+from apps.tasks.services.heatmap import get_year_bounds, get_year_heatmap
+from apps.tasks.tests.utils import at, make_player
+
+YEAR = 1403
+
+
+class YearHeatmapTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.habit = Task.objects.create(profile=self.profile, title="Read")
+        TaskSchedule.objects.create(task=self.habit)
+        self.start, self.length = get_year_bounds(YEAR)
+
+    def complete(self, days_after_start, hour=8):
+        day = self.start + timedelta(days=days_after_start)
+        completion.complete(self.habit, at(day, hour))
+
+    def get_bits(self):
+        (row,) = get_year_heatmap(self.profile, YEAR)["habits"]
+        bits = int.from_bytes(base64.b64decode(row["bitmap"]), "little")
+        return row, [n for n in range(bits.bit_length()) if bits >> n & 1]
+
+    def test_one_bit_per_completed_day(self):
+        for days_after_start in [0, 9, 9, self.length - 1, self.length, -1]:
+            self.complete(days_after_start)
+
+        row, bits = self.get_bits()
+
+        self.assertEqual(bits, [0, 9, self.length - 1])
+        self.assertEqual(row["completions"], 3)
+        self.assertEqual(len(base64.b64decode(row["bitmap"])), (self.length + 7) // 8)
+
+    def test_compacted_days_are_included(self):
+        self.complete(-3)
+        self.complete(1, hour=23)
+        compact_logs(self.start + timedelta(days=40))
+
+        _, bits = self.get_bits()
+
+        self.assertEqual(bits, [1])
+
+    def test_bitmap_is_stored_until_a_completion_changes_it(self):
+        self.complete(0)
+        self.get_bits()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get_bits()
+        self.assertFalse(
+            [query for query in queries if "tasks_tasklog" in query["sql"]]
+        )
+
+        self.complete(2)
+        self.assertIsNone(HabitYearBitmap.objects.get().bits)
+        _, bits = self.get_bits()
+        self.assertEqual(bits, [0, 2])
+
+    def complete_while_building(self):
+        """A completion lands after the reader built its bits, before it stores them."""
+        build = heatmap.build_bitmaps
+
+        def build_then_complete(task_ids, year):
+            bitmaps = build(task_ids, year)
+            self.complete(5)
+            return bitmaps
+
+        return mock.patch.object(heatmap, "build_bitmaps", build_then_complete)
+
+    def test_bits_built_before_a_completion_are_not_stored(self):
+        self.complete(0)
+
+        with self.complete_while_building():
+            _, stale = self.get_bits()
+
+        _, bits = self.get_bits()
+        self.assertEqual(stale, [0])
+        self.assertEqual(bits, [0, 5])
+
+    def test_rebuilt_bits_older_than_the_version_are_not_stored(self):
+        self.complete(0)
+        self.get_bits()
+        self.complete(1)  # Clears the stored bits
+
+        with self.complete_while_building():
+            self.get_bits()
+
+        bitmap = HabitYearBitmap.objects.get()
+        self.assertIsNone(bitmap.bits)
+        self.assertEqual(bitmap.version, 2)
+        self.assertEqual(self.get_bits()[1], [0, 1, 5])
@@ -0,0 +1,126 @@
+from datetime import date, datetime, timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.tasks.models import MonthlyTaskSummary, Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.compaction import compact_logs
+from apps.tasks.services.history import (
+    get_feed_page,
+    get_history_page,
+    get_task_history,
+)
+from apps.tasks.tests.utils import make_player
+
+
+class HistoryPageTests(TestCase):
+    def setUp(self):
+        self.task = Task.objects.create(
+            profile=make_player("hunter"), title="Read", manual_rank="E"
+        )
+        start = timezone.make_aware(datetime(2025, 9, 28, 8))
+        # Two completions share each instant: the id breaks the tie
+        self.logs = completion.save_completions(
+            [
+                TaskLog(task=self.task, completed_at=start + timedelta(days=n // 2))
+                for n in range(7)
+            ]
+        )
+
+    def walk(self, page_size):
+        pages, cursor = [], None
+        while True:
+            page, cursor = get_history_page(TaskLog.objects.all(), cursor, page_size)
+            pages.append([log.pk for log in page])
+            if cursor is None:
+                return pages
+
+    def test_pages_cover_every_log_once_newest_first(self):
+        pages = self.walk(page_size=2)
+
+        newest_first = sorted(
+            self.logs, key=lambda log: (log.completed_at, log.pk), reverse=True
+        )
+        self.assertEqual([len(page) for page in pages], [2, 2, 2, 1])
+        self.assertEqual(sum(pages, []), [log.pk for log in newest_first])
+
+    def test_exact_last_page_has_no_cursor(self):
+        page, cursor = get_history_page(TaskLog.objects.all(), page_size=7)
+
+        self.assertEqual(len(page), 7)
+        self.assertIsNone(cursor)
+
+    def test_malformed_cursor_starts_over(self):
+        page, _ = get_history_page(TaskLog.objects.all(), "garbage", page_size=2)
+        first, _ = get_history_page(TaskLog.objects.all(), page_size=2)
+
+        self.assertEqual(page, first)
+
+    def test_monthly_summary_only_on_the_first_page(self):
+        history = get_task_history(self.task, page_size=3)
+        following = get_task_history(self.task, history["next_cursor"], page_size=3)
+
+        self.assertEqual(
+            [(row["month"].month, row["completions"]) for row in history["months"]],
+            [(10, 1), (9, 6)],
+        )
+        self.assertIsNone(following["months"])
+
+
+class HistoryFeedTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.read = Task.objects.create(profile=self.profile, title="Read")
+        self.run = Task.objects.create(profile=self.profile, title="Run")
+        old = timezone.make_aware(datetime(2024, 8, 3, 8))
+        completion.save_completions(
+            [
+                TaskLog(task=self.read, completed_at=old),
+                TaskLog(task=self.read, completed_at=old + timedelta(hours=2)),
+                TaskLog(task=self.run, completed_at=old),
+                TaskLog(task=self.run, completed_at=old + timedelta(days=1)),
+            ]
+        )
+        compact_logs(date(2024, 9, 1))
+        self.recent = completion.save_completions(
+            [
+                TaskLog(task=self.read, completed_at=timezone.make_aware(when))
+                for when in [datetime(2025, 1, 5, 8), datetime(2025, 1, 6, 0)]
+            ]
+        )
+
+    def walk(self, page_size):
+        entries, cursor = [], None
+        while True:
+            page, cursor = get_feed_page(
+                TaskLog.objects.filter(profile=self.profile),
+                MonthlyTaskSummary.objects.filter(profile=self.profile),
+                cursor,
+                page_size,
+            )
+            entries += [
+                (log.pk, log.task_id, timezone.localtime(log.completed_at).date())
+                for log in page
+            ]
+            if cursor is None:
+                return entries
+
+    def test_compacted_days_follow_the_logs(self):
+        entries = self.walk(page_size=2)
+
+        newer, older = self.recent[1], self.recent[0]
+        self.assertEqual(
+            entries,
+            [
+                (newer.pk, self.read.pk, date(2025, 1, 6)),
+                (older.pk, self.read.pk, date(2025, 1, 5)),
+                # One entry per task and day: no id, time or reward left
+                (None, self.run.pk, date(2024, 8, 4)),
+                (None, self.run.pk, date(2024, 8, 3)),
+                (None, self.read.pk, date(2024, 8, 3)),
+            ],
+        )
+
+    def test_any_page_size_gives_the_same_feed(self):
+        self.assertEqual(self.walk(page_size=1), self.walk(page_size=50))
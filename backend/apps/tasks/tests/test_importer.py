@@ -0,0 +1,92 @@
+import json
+from datetime import date
+from io import StringIO
+
+from django.test import TestCase
+
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.services.compaction import compact_logs
+from apps.tasks.services.importer import import_history
+from apps.tasks.tests.utils import at, make_player
+
+
+def jsonl(*rows):
+    return StringIO(
+        "\n".join(
+            row if isinstance(row, str) else json.dumps(row, default=str)
+            for row in rows
+        )
+    )
+
+
+class HistoryImportTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.read = Task.objects.create(
+            profile=self.profile, title="Read", manual_rank="E"
+        )
+        # August 2024 is compacted (days only), January 2025 stays raw
+        completion.complete(self.read, at(date(2024, 8, 3)))
+        compact_logs(date(2024, 9, 1))
+        completion.complete(self.read, at(date(2025, 1, 5)))
+
+    def import_rows(self, *rows, **kwargs):
+        return import_history(self.profile, jsonl(*rows), "jsonl", **kwargs)
+
+    def test_duplicates_of_raw_and_compacted_days_are_skipped(self):
+        report = self.import_rows(
+            {"task": "read", "completed_at": at(date(2025, 1, 5))},
+            # Compacted day: any time that day is a duplicate
+            {"task": "Read", "completed_at": at(date(2024, 8, 3), 20)},
+            {"task": "Read", "completed_at": at(date(2024, 8, 4))},
+            {"task": "Read", "completed_at": at(date(2024, 8, 4))},
+        )
+
+        self.assertEqual((report["imported"], report["duplicates"]), (1, 3))
+        self.assertEqual(
+            list(TaskLog.objects.values_list("completed_at", flat=True)),
+            [at(date(2025, 1, 5)), at(date(2024, 8, 4))],
+        )
+
+    def test_rerun_imports_nothing(self):
+        row = {"task": "Run", "completed_at": at(date(2025, 2, 1)), "rank": "d"}
+        self.import_rows(row)
+
+        report = self.import_rows(row)
+
+        self.assertEqual((report["imported"], report["duplicates"]), (0, 1))
+        self.assertEqual(Task.objects.filter(title="Run").count(), 1)
+
+    def test_new_tasks_and_rewards_are_granted_once(self):
+        self.profile.refresh_from_db()
+        self.profile.stats.refresh_from_db()
+        lifetime = self.profile.stats.str_affinity_lifetime
+
+        report = self.import_rows(
+            {"task": "Run", "completed_at": at(date(2025, 2, 1)), "frequency": "daily"},
+            {"task": "Run", "completed_at": at(date(2025, 2, 2))},
+            "not json",
+            {"task": "Swim", "completed_at": "yesterday"},
+            batch_size=2,
+        )
+
+        self.profile.stats.refresh_from_db()
+        run = Task.objects.get(title="Run")
+        self.assertEqual(report["imported"], 2)
+        self.assertEqual(report["tasks_created"], 1)
+        self.assertEqual(report["schedules_created"], 1)
+        self.assertEqual([line for line, _ in report["failed"]], [3, 4])
+        self.assertTrue(run.is_habit)
+        self.assertEqual(
+            self.profile.stats.str_affinity_lifetime - lifetime, 2 * run.xp_reward
+        )
+
+    def test_dry_run_saves_nothing(self):
+        report = self.import_rows(
+            {"task": "Run", "completed_at": at(date(2025, 2, 1))}, dry_run=True
+        )
+
+        self.assertEqual(report["imported"], 1)
+        self.assertFalse(Task.objects.filter(title="Run").exists())
+        self.assertEqual(TaskLog.objects.count(), 1)
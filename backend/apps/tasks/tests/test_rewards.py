@@ -0,0 +1,85 @@
+from django.test import TestCase
+
+from apps.tasks.models import Task, TaskLog
+from apps.tasks.services import completion
+from apps.tasks.tests.utils import make_player
+
+
+class RewardSnapshotTests(TestCase):
+    def setUp(self):
+        self.profile = make_player("hunter")
+        self.task = Task.objects.create(
+            profile=self.profile,
+            title="Study",
+            primary_stat="INT",
+            secondary_stat="WIS",
+            manual_rank="C",
+        )
+
+    def reload(self):
+        self.profile.refresh_from_db()
+        self.profile.stats.refresh_from_db()
+        return self.profile, self.profile.stats
+
+    def test_log_stores_the_split(self):
+        log = completion.complete(self.task)
+
+        self.assertEqual(log.profile_id, self.profile.pk)
+        self.assertEqual(log.xp_earned, 75)
+        self.assertEqual(log.xp_distribution, {"INT": 45, "WIS": 30})
+
+    def test_undo_reverts_the_snapshot_not_the_current_task(self):
+        _, stats = self.reload()
+        before = (
+            self.profile.level,
+            self.profile.xp_current,
+            stats.int_xp,
+            stats.wis_xp,
+        )
+
+        log = completion.complete(self.task)
+        # Editing the task later doesn't change what its history granted
+        self.task.primary_stat = "STR"
+        self.task.secondary_stat = None
+        self.task.manual_rank = "S"
+        self.task.save()
+
+        removed = completion.uncomplete_many(TaskLog.objects.filter(pk=log.pk))
+
+        profile, stats = self.reload()
+        self.assertEqual(removed, 1)
+        self.assertEqual(
+            (profile.level, profile.xp_current, stats.int_xp, stats.wis_xp), before
+        )
+        self.assertEqual(stats.str_xp, 0)
+
+    def test_bulk_completion_grants_the_sum_once(self):
+        tasks = [
+            Task.objects.create(
+                profile=self.profile, title=f"Task {n}", manual_rank="E"
+            )
+            for n in range(3)
+        ]
+
+        logs = completion.complete_many(tasks)
+
+        profile, stats = self.reload()
+        self.assertEqual(len(logs), 3)
+        self.assertEqual(sum(log.xp_earned for log in logs), 45)
+        self.assertEqual(stats.str_affinity_lifetime, 45)
+        self.assertEqual(TaskLog.objects.filter(profile=profile).count(), 3)
+
+    def test_bulk_undo_is_aggregated_per_profile(self):
+        other = make_player("other")
+        other_task = Task.objects.create(profile=other, title="Run", manual_rank="E")
+        completion.complete_many([self.task, self.task, other_task])
+
+        removed = completion.uncomplete_many(TaskLog.objects.all())
+
+        profile, stats = self.reload()
+        other.stats.refresh_from_db()
+        self.assertEqual(removed, 3)
+        self.assertEqual((profile.level, profile.xp_current), (1, 0))
+        self.assertEqual((stats.int_xp, stats.wis_xp), (0, 0))
+        self.assertEqual(other.stats.str_xp, 0)
+        self.assertFalse(TaskLog.objects.exists())
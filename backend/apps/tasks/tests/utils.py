@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.profiles.services.player import get_player
+
+# Pages rendered in tests: no collectstatic manifest to look the files up in
+plain_static = override_settings(
+    STORAGES={
+        **settings.STORAGES,
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    }
+)
+
+
+def make_player(username, **extra):
+    """A user and its player profile (with stats)."""
+    return get_player(get_user_model().objects.create(username=username, **extra))
+
+
+def at(day, hour=8):
+    """Aware datetime of 'day' at 'hour' (local time)."""
+    return timezone.make_aware(datetime(day.year, day.month, day.day, hour))
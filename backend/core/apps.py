@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """Project-wide code: settings, URLs and the project's management commands."""
+
+    name = "core"
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+def raw_delete(queryset):
+    """
+    Deletes the rows of 'queryset' with a single DELETE: no cascade collection,
+    no signals. Callers handle the side effects (rewards, rollups, caches) first.
+    Returns the number of deleted rows.
+    """
+    # QuerySet._raw_delete is private API (Django 5.2, see uv.lock): keep every
+    # use behind this helper and re-check it when upgrading Django.
+    return queryset.order_by()._raw_delete(queryset.db)
+
+
+def is_cascade(instance, origin):
+    """
+    True if the deletion of 'instance' was started from another model
+    (e.g. its Task or User), from the post_delete 'origin' argument.
+    """
+    if origin is None:
+        return False
+    if isinstance(origin, models.QuerySet):
+        return origin.model is not type(instance)
+    return not isinstance(origin, type(instance))
@@ -0,0 +1,181 @@
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter (python -X importtime), so nothing is cached yet.
+# Prints a JSON report on stdout; the import times go to stderr.
+PROBE = """
+import json, resource, sys, time
+
+started = time.perf_counter()
+
+import django
+from django.apps.config import AppConfig
+
+apps_report = {}
+
+
+def timed(entry, phase, func):
+    def wrapper(*args, **kwargs):
+        phase_started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            apps_report[entry][phase] += time.perf_counter() - phase_started
+
+    return wrapper
+
+
+create = AppConfig.create.__func__
+
+
+def timed_create(cls, entry):
+    apps_report[entry] = {"import": 0.0, "models": 0.0, "ready": 0.0}
+    config = timed(entry, "import", create)(cls, entry)
+    config.import_models = timed(entry, "models", config.import_models)
+    config.ready = timed(entry, "ready", config.ready)
+    return config
+
+
+AppConfig.create = classmethod(timed_create)
+
+setup_started = time.perf_counter()
+django.setup()
+setup = time.perf_counter() - setup_started
+
+urls = None
+if "--urls" in sys.argv:
+    from django.urls import get_resolver
+
+    urls_started = time.perf_counter()
+    get_resolver().url_patterns
+    urls = time.perf_counter() - urls_started
+
+print(json.dumps({
+    "total": time.perf_counter() - started,
+    "setup": setup,
+    "urls": urls,
+    "apps": apps_report,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+}))
+"""
+
+
+def parse_import_times(output):
+    """
+    Parses the '-X importtime' report.
+    Returns a list of (module, self_us, cumulative_us) in import order.
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Header line
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def ms(seconds):
+    return f"{seconds * 1000:8.1f} ms"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures a cold start: import time per module and package, "
+        "and the time each app takes to load (import, models, ready). "
+        "Use --settings to compare profiles (e.g. core.settings.web)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=15,
+            help="Number of rows in each ranking.",
+        )
+        parser.add_argument(
+            "--skip-urls",
+            action="store_true",
+            help="Don't load the URLconf (workers load it on their first request).",
+        )
+
+    def handle(self, *args, **options):
+        if options["limit"] < 1:
+            raise CommandError("--limit must be positive.")
+
+        command = [sys.executable, "-X", "importtime", "-c", PROBE]
+        if not options["skip_urls"]:
+            command.append("--urls")
+
+        result = subprocess.run(
+            command,
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE},
+        )
+        if result.returncode != 0:
+            errors = [
+                line
+                for line in result.stderr.splitlines()
+                if not line.startswith("import time:")
+            ]
+            raise CommandError("Startup failed:\n" + "\n".join(errors[-20:]))
+
+        report = json.loads(result.stdout.strip().splitlines()[-1])
+        modules = parse_import_times(result.stderr)
+        self.print_summary(report, modules)
+        self.print_packages(modules, options["limit"])
+        self.print_modules(modules, options["limit"])
+        self.print_apps(report["apps"], options["limit"])
+
+    def print_summary(self, report, modules):
+        self.stdout.write(self.style.MIGRATE_HEADING(settings.SETTINGS_MODULE))
+        self.stdout.write(f"  Total startup    {ms(report['total'])}")
+        self.stdout.write(f"  django.setup()   {ms(report['setup'])}")
+        if report["urls"] is not None:
+            self.stdout.write(f"  URLconf          {ms(report['urls'])}")
+        imports = sum(self_us for _, self_us, _ in modules) / 1_000_000
+        self.stdout.write(f"  Imports          {ms(imports)} ({len(modules)} modules)")
+        self.stdout.write(f"  Peak memory      {report['max_rss_kb'] / 1024:8.1f} MB")
+
+    def print_packages(self, modules, limit):
+        """Self time summed per top-level package (adds up to the import time)."""
+        packages = defaultdict(lambda: [0, 0])
+        for name, self_us, _ in modules:
+            package = packages[name.split(".")[0]]
+            package[0] += self_us
+            package[1] += 1
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Packages (self time)"))
+        ranking = sorted(packages.items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_us, count) in ranking[:limit]:
+            self.stdout.write(f"  {ms(self_us / 1_000_000)}  {name} ({count})")
+
+    def print_modules(self, modules, limit):
+        self.stdout.write(self.style.MIGRATE_HEADING("Slowest imports (cumulative)"))
+        ranking = sorted(modules, key=lambda module: module[2], reverse=True)
+        for name, _, cumulative_us in ranking[:limit]:
+            self.stdout.write(f"  {ms(cumulative_us / 1_000_000)}  {name}")
+
+    def print_apps(self, apps_report, limit):
+        self.stdout.write(
+            self.style.MIGRATE_HEADING("Apps (import + models + ready)")
+        )
+        ranking = sorted(
+            apps_report.items(), key=lambda item: sum(item[1].values()), reverse=True
+        )
+        for entry, phases in ranking[:limit]:
+            self.stdout.write(
+                f"  {ms(sum(phases.values()))}  {entry} "
+                f"(import {phases['import'] * 1000:.1f}, "
+                f"models {phases['models'] * 1000:.1f}, "
+                f"ready {phases['ready'] * 1000:.1f})"
+            )
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from django.templatetags.static import static
 from django.urls import reverse_lazy
 from dotenv import load_dotenv
@@ -15,6 +16,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 SECRET_KEY = os.environ.get("SECRET_KEY")
 # Debug Status
 DEBUG = os.environ.get("DEBUG") == "True"
+# App Version (part of the pages' ETags: change it on deploy to drop cached pages)
+APP_VERSION = os.environ.get("APP_VERSION", "1.0.0")
 # User
 AUTH_USER_MODEL = "accounts.User"
 
@@ -34,6 +37,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     # Project Apps
+    "core",  # Project-wide management commands
     "apps.accounts",
     "apps.api",
     "apps.tasks",
@@ -58,6 +62,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.profiles.middleware.PlayerMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -100,9 +105,32 @@ DATABASES = {
         "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
         "HOST": os.environ.get("DB_HOST"),
         "PORT": os.environ.get("DB_PORT"),
+        # Persistent connections: reused across requests, checked before reuse
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Under ASGI (SERVER_INTERFACE=asgi, see gunicorn.conf.py) each request runs in
+# its own context and sync code in executor threads: persistent connections are
+# never reused there and pile up, so they are closed after every request and
+# the pool is on by default to avoid reconnecting.
+SERVER_INTERFACE = os.environ.get("SERVER_INTERFACE", "wsgi")
+if SERVER_INTERFACE == "asgi":
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+
+# Optional psycopg3 connection pool (per worker process).
+# Replaces persistent connections, so CONN_MAX_AGE must be 0.
+DB_POOL = os.environ.get("DB_POOL", str(SERVER_INTERFACE == "asgi")) == "True"
+if DB_POOL:
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 2)),
+            "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 4)),
+        }
+    }
+
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -144,9 +172,30 @@ SPECTACULAR_SETTINGS = {
     "DESCRIPTION": "Project APIs",
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
+    # Primary/Secondary stats share one choice set
+    "ENUM_NAME_OVERRIDES": {"StatEnum": "apps.profiles.models.PlayerStats.StatType"},
     # OTHER SETTINGS
 }
 
+# Serve the dashboard with AsyncIndexView (concurrent sections, best under ASGI).
+# A load holds ASYNC_DASHBOARD_CONNECTIONS connections at once (one per threaded
+# section, plus the async ORM's thread): without the pool each of them would be a
+# new Postgres connection per request, so DB_POOL is required and sized for it.
+ASYNC_DASHBOARD = os.environ.get("ASYNC_DASHBOARD") == "True"
+ASYNC_DASHBOARD_CONNECTIONS = 4
+if ASYNC_DASHBOARD:
+    if not DB_POOL:
+        raise ImproperlyConfigured("ASYNC_DASHBOARD=True requires DB_POOL=True.")
+    pool = DATABASES["default"]["OPTIONS"]["pool"]
+    if "DB_POOL_MAX_SIZE" not in os.environ:
+        # Room for two concurrent dashboard loads per worker
+        pool["max_size"] = max(pool["max_size"], 2 * ASYNC_DASHBOARD_CONNECTIONS)
+    if pool["max_size"] < ASYNC_DASHBOARD_CONNECTIONS:
+        raise ImproperlyConfigured(
+            f"ASYNC_DASHBOARD=True requires DB_POOL_MAX_SIZE >= "
+            f"{ASYNC_DASHBOARD_CONNECTIONS}."
+        )
+
 # Auth Redirects
 LOGIN_URL = "login"  # If not logged in, go here
 LOGIN_REDIRECT_URL = "gate:index"  # After login, go here (Index Page)
@@ -0,0 +1,37 @@
+"""
+Slim profile for the web workers (DJANGO_SETTINGS_MODULE=core.settings.web).
+
+Same as dev/prod, minus the apps only the Admin Panel and the API docs use.
+Their routes are dropped too (see core/urls.py and apps/api/urls.py),
+so run the admin, migrations and other management commands with the full profile.
+Measure the difference with: manage.py profile_startup --settings core.settings.web
+"""
+
+from core.settings.base import DEBUG
+
+if DEBUG:
+    from .dev import *
+else:
+    from .prod import *
+
+# Admin Panel (+ theme) and API schema/docs
+WEB_EXCLUDED_APPS = [
+    "unfold",
+    "unfold.contrib.filters",
+    "unfold.contrib.forms",
+    "unfold.contrib.import_export",
+    "django.contrib.admin",
+    "drf_spectacular",
+    "taggit",  # Only managed from the Admin Panel
+]
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in WEB_EXCLUDED_APPS]
+
+# Its sidebar links reverse 'admin:' URLs, which don't exist here
+del UNFOLD
+
+# DRF default: the drf_spectacular one is only needed to build the schema
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    "DEFAULT_SCHEMA_CLASS": "rest_framework.schemas.openapi.AutoSchema",
+}
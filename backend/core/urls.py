@@ -3,23 +3,29 @@ from core.settings.base import DEBUG
 if DEBUG:
     from debug_toolbar.toolbar import debug_toolbar_urls
 from apps.accounts.views import register
+from django.apps import apps
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib import admin
 from django.urls import include, path
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
     # Auth Routes
     path("accounts/register/", register, name="register"),
     path(
         "accounts/", include("django.contrib.auth.urls")
     ),  # Provides login, logout, password_change
     path("", include("apps.gate.urls")),
+    path("api/", include("apps.api.urls")),
     path("api-auth/", include("rest_framework.urls")),
     path("tinymce/", include("tinymce.urls")),
 ]
 
+# Not installed in the slim web profile (core/settings/web.py)
+if apps.is_installed("django.contrib.admin"):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
+
 if DEBUG:
     urlpatterns += debug_toolbar_urls()
 
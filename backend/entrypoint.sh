@@ -1,13 +1,28 @@
 #!/bin/sh
+# Usage: ./entrypoint.sh [web|migrate|dev]
+#   web     - production server (gunicorn, see gunicorn.conf.py). Default.
+#   migrate - apply migrations and exit (run it once per deploy, before 'web').
+#   dev     - Django's runserver with auto-reload.
+set -e
 
-echo "Making migrations..."
-uv run manage.py makemigrations
+case "${1:-web}" in
+    migrate)
+        echo "Applying migrations..."
+        uv run manage.py migrate --noinput
+        ;;
+    web)
+        # echo "Collecting static files..."
+        # uv run manage.py collectstatic --noinput
 
-echo "Applying migrations..."
-uv run manage.py migrate
-
-# echo "Collecting static files..."
-# uv run core/manage.py collectstatic --noinput
-
-echo "Starting server..."
-uv run manage.py runserver 0.0.0.0:8000
+        echo "Starting server..."
+        # exec: gunicorn becomes PID 1 and receives the stop/reload signals
+        exec uv run gunicorn --config gunicorn.conf.py
+        ;;
+    dev)
+        echo "Starting development server..."
+        exec uv run manage.py runserver 0.0.0.0:8000
+        ;;
+    *)
+        exec "$@"
+        ;;
+esac
@@ -0,0 +1,58 @@
+"""
+Gunicorn settings for the production server (see entrypoint.sh).
+Every value can be tuned from the environment.
+
+Graceful reload: send HUP to the master process
+(e.g. `docker compose kill -s HUP backend`). New workers are started
+with the new code, and the old ones finish their in-flight requests first.
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+
+# Concurrency scales with cores: (2 x cores) + 1 by default
+workers = int(
+    os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1)
+)
+threads = int(os.environ.get("GUNICORN_THREADS", 1))
+
+# SERVER_INTERFACE=asgi serves core/asgi.py with uvicorn workers
+# (the settings then drop persistent DB connections for the pool, see DATABASES)
+if os.environ.get("SERVER_INTERFACE", "wsgi") == "asgi":
+    wsgi_app = "core.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+else:
+    wsgi_app = "core.wsgi:application"
+    worker_class = "gthread" if threads > 1 else "sync"
+
+# WEB_SETTINGS_MODULE=core.settings.web runs the workers on the slim profile
+# (no Admin Panel / API docs). Management commands keep the full one.
+if os.environ.get("WEB_SETTINGS_MODULE"):
+    raw_env = [f"DJANGO_SETTINGS_MODULE={os.environ['WEB_SETTINGS_MODULE']}"]
+
+# Load the app once in the master, workers share its memory (copy-on-write).
+# Trade-off: HUP then restarts the workers with the code already loaded in the
+# master, so a graceful reload no longer deploys new code: restart the container.
+preload_app = os.environ.get("GUNICORN_PRELOAD") == "True"
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+
+# Recycle workers now and then (guards against slow memory growth)
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+
+def on_reload(server):
+    if preload_app:
+        server.log.warning(
+            "GUNICORN_PRELOAD=True: HUP restarts the workers with the preloaded "
+            "code, new code needs a full restart."
+        )
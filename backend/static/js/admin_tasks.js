@@ -182,6 +182,64 @@ class XPPreviewController {
     }
 }
 
+/**
+ * ==========================================
+ * MODULE: COMPLETION HISTORY CONTROLLER
+ * Loads the history panel on demand, and its
+ * older pages one at a time (keyset cursor).
+ * ==========================================
+ */
+class CompletionHistoryController {
+    constructor() {
+        this.panel = document.getElementById('completion-history-panel');
+
+        if (this.panel) {
+            this.init();
+        }
+    }
+
+    init() {
+        this.panel.addEventListener('click', (event) => {
+            const button = event.target.closest('button');
+            if (!button || button.disabled) return;
+
+            button.disabled = true;
+            if (button.dataset.historyMore) {
+                this.loadMore(button);
+            } else {
+                this.load();
+            }
+        });
+    }
+
+    async fetchFragment(url) {
+        const response = await fetch(url, { credentials: 'same-origin' });
+        if (!response.ok) throw new Error(`History request failed (${response.status})`);
+        return response.text();
+    }
+
+    async load() {
+        try {
+            this.panel.innerHTML = await this.fetchFragment(this.panel.dataset.historyUrl);
+        } catch (error) {
+            console.error(error);
+            this.panel.textContent = 'Could not load the history.';
+        }
+    }
+
+    async loadMore(button) {
+        const row = button.closest('tr');
+        try {
+            const rows = await this.fetchFragment(button.dataset.historyMore);
+            row.insertAdjacentHTML('afterend', rows);
+            row.remove();
+        } catch (error) {
+            console.error(error);
+            button.disabled = false;
+        }
+    }
+}
+
 /**
  * ==========================================
  * BOOTSTRAPPER
@@ -192,6 +250,7 @@ document.addEventListener('DOMContentLoaded', function() {
     
     new ScheduleVisibilityController();
     new XPPreviewController();
+    new CompletionHistoryController();
 });
 
 })();
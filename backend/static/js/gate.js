@@ -45,6 +45,21 @@ class GateAPI {
         }
     }
 
+    static async saveHighlights(url, payload) {
+        try {
+            const response = await fetch(url, {
+                method: "PUT",
+                headers: { ...this.headers, "Content-Type": "application/json" },
+                body: JSON.stringify(payload)
+            });
+            if (!response.ok) throw new Error(`Highlights rejected (${response.status})`);
+            return await response.json();
+        } catch (error) {
+            console.error("Save Highlights Failed:", error);
+            throw error;
+        }
+    }
+
     static async toggleTaskStatus(taskId) {
         const url = `/task/toggle/${taskId}/`; 
         
@@ -90,6 +105,18 @@ class GateAPI {
             throw error;
         }
     }
+
+    static async loadTasks(url) {
+        // Next page of the task list, as rendered rows (HTML)
+        try {
+            const response = await fetch(url, { headers: this.headers });
+            if (!response.ok) throw new Error(`Task list failed (${response.status})`);
+            return await response.text();
+        } catch (error) {
+            console.error("Load Tasks Failed:", error);
+            throw error;
+        }
+    }
 }
 
 /**
@@ -172,6 +199,12 @@ class DailyLogForm {
 
         // Debounce passing arguments correctly
         this.debouncedSave = this.debounce((statusEl) => this.performSave(statusEl), 1000);
+
+        // Highlights are saved on their own, as JSON (same locking as the form)
+        this.highlights = document.getElementById('highlights-section');
+        this.isSavingHighlights = false;
+        this.pendingHighlights = false;
+        this.debouncedHighlightSave = this.debounce((statusEl) => this.saveHighlights(statusEl), 1000);
         
         this.initAutoSave();
         this.initEmojiPicker();
@@ -202,7 +235,11 @@ class DailyLogForm {
         this.form.addEventListener('input', (e) => {
             if (['INPUT', 'TEXTAREA'].includes(e.target.tagName)) {
                 const statusEl = getStatusElement(e.target);
-                this.debouncedSave(statusEl);
+                if (e.target.closest('.js-highlight-list')) {
+                    this.debouncedHighlightSave(statusEl);
+                } else {
+                    this.debouncedSave(statusEl);
+                }
             }
         });
 
@@ -237,32 +274,6 @@ class DailyLogForm {
             const data = await GateAPI.autoSave(this.form);
             if (data.status === 'success') {
                 this.updateStatus(currentStatusEl, "Saved", "text-success");
-
-                // Sync backend IDs to frontend to prevent duplicates on next save
-                if (data.new_ids) {
-                    Object.entries(data.new_ids).forEach(([inputName, newId]) => {
-                        const idInput = this.form.querySelector(`input[name="${inputName}"]`);
-                        if (idInput) {
-                            idInput.value = newId;
-                        }
-                    });
-                }
-
-                // Update INITIAL_FORMS Counters
-                // This tells Django that these rows are now "Existing" records,
-                // preventing it from creating duplicates on the next save.
-                ['pos', 'neg'].forEach(prefix => {
-                    const initialInput = document.getElementById(`id_${prefix}-INITIAL_FORMS`);
-                    if (initialInput) {
-                        // Count how many rows now have a valid database ID
-                        const validIds = Array.from(
-                            this.form.querySelectorAll(`input[name^="${prefix}-"][name$="-id"]`)
-                        ).filter(input => input.value !== "").length;
-                        
-                        initialInput.value = validIds;
-                    }
-                });
-
                 setTimeout(() => this.updateStatus(currentStatusEl, "", ""), 2000);
             } else {
                 this.updateStatus(currentStatusEl, "Error", "text-danger");
@@ -282,6 +293,53 @@ class DailyLogForm {
         }
     }
 
+    // --- Highlights (one JSON request for the whole, ordered lists) ---
+    async saveHighlights(statusEl) {
+        if (!this.highlights) return;
+
+        // LOCK CHECK: same queueing as performSave
+        if (this.isSavingHighlights) {
+            this.pendingHighlights = true;
+            return;
+        }
+        this.isSavingHighlights = true;
+        this.updateStatus(statusEl, "Saving...", "text-secondary");
+
+        // Snapshot the rows: the returned ids come back in the same order.
+        // New rows stay unsaved until something is written in them.
+        const rows = {};
+        const payload = { date: this.form.querySelector('input[name="date"]').value };
+        this.highlights.querySelectorAll('.js-highlight-list').forEach(list => {
+            const category = list.dataset.category;
+            rows[category] = Array.from(list.querySelectorAll('.highlight-row'))
+                .filter(row => row.dataset.highlightId || row.querySelector('input').value.trim());
+            payload[category] = rows[category].map(row => ({
+                id: row.dataset.highlightId ? Number(row.dataset.highlightId) : null,
+                content: row.querySelector('input').value
+            }));
+        });
+
+        try {
+            const data = await GateAPI.saveHighlights(this.highlights.dataset.highlightsUrl, payload);
+            // Sync backend IDs, so the next save updates these rows
+            Object.entries(rows).forEach(([category, categoryRows]) => {
+                categoryRows.forEach((row, index) => {
+                    row.dataset.highlightId = data[category][index];
+                });
+            });
+            this.updateStatus(statusEl, "Saved", "text-success");
+            setTimeout(() => this.updateStatus(statusEl, "", ""), 2000);
+        } catch (error) {
+            this.updateStatus(statusEl, "Error", "text-danger");
+        } finally {
+            this.isSavingHighlights = false;
+            if (this.pendingHighlights) {
+                this.pendingHighlights = false;
+                this.saveHighlights(statusEl);
+            }
+        }
+    }
+
     updateStatus(element, text, colorClass) {
         if (!element) return;
         element.textContent = text;
@@ -297,7 +355,7 @@ class DailyLogForm {
 
         if (!input || !slot || !popover || !picker) return;
 
-        picker.dataSource = '/static/vendor/emoji-picker/data.json'; 
+        picker.dataSource = '/assets/emoji-data.json'; 
 
         slot.addEventListener('click', (e) => {
             if (popover.contains(e.target)) return;
@@ -350,27 +408,23 @@ class DailyLogForm {
             const delBtn = e.target.closest('.btn-delete-row');
             if (delBtn) {
                 const row = delBtn.closest('.highlight-row');
-                row.querySelector('input[name$="-DELETE"]').checked = true;
-                row.style.display = 'none';
-                
-                // Fix: Pass status element for immediate save
                 const statusEl = row.closest('.js-autosave-section')?.querySelector('.js-section-status');
-                this.performSave(statusEl);
+                const wasSaved = Boolean(row.dataset.highlightId);
+                row.remove();
+
+                // Missing rows are deleted by the next save
+                if (wasSaved) this.saveHighlights(statusEl);
             }
         });
     }
 
     addFormRow(prefix) {
         const container = document.getElementById(`${prefix}-container`);
-        const totalInput = document.getElementById(`id_${prefix}-TOTAL_FORMS`);
         const template = document.getElementById(`${prefix}-empty-form`);
 
-        if (!container || !totalInput || !template) return;
+        if (!container || !template) return;
 
-        const count = parseInt(totalInput.value);
-        const newHtml = template.innerHTML.replace(/__prefix__/g, count);
-        container.insertAdjacentHTML('beforeend', newHtml);
-        totalInput.value = count + 1;
+        container.insertAdjacentHTML('beforeend', template.innerHTML);
         
         const inputs = container.querySelectorAll('input[type="text"]');
         if (inputs.length) inputs[inputs.length - 1].focus();
@@ -389,6 +443,7 @@ class TaskManager {
             list: document.getElementById('gate-task-list'),
             form: document.getElementById('gate-add-task-form'),
             modalEl: document.getElementById('taskModal'),
+            filters: document.getElementById('gate-task-filters'),
         };
 
         // Initialize Bootstrap Modal Wrapper
@@ -397,9 +452,15 @@ class TaskManager {
             this.initCreator();
         }
 
-        // Initialize Archive Listeners
+        // Initialize Archive Listeners & Infinite Scroll
         if (this.dom.list) {
             this.initArchiver();
+            this.initLoader();
+        }
+
+        // Filters are applied by the server: reload on change
+        if (this.dom.filters) {
+            this.dom.filters.addEventListener('change', () => this.dom.filters.submit());
         }
     }
 
@@ -474,6 +535,42 @@ class TaskManager {
         });
     }
 
+    // --- Infinite Scroll ---
+    initLoader() {
+        if (!('IntersectionObserver' in window)) return;
+
+        this.loading = false;
+        this.observer = new IntersectionObserver((entries) => {
+            if (entries.some(entry => entry.isIntersecting)) this.loadMore();
+        }, { rootMargin: '200px' });
+        this.observeSentinel();
+    }
+
+    observeSentinel() {
+        // Each page ends with a sentinel holding the next page's URL
+        this.sentinel = this.dom.list.querySelector('.js-task-list-more');
+        if (this.sentinel) this.observer.observe(this.sentinel);
+    }
+
+    async loadMore() {
+        if (this.loading || !this.sentinel) return;
+        this.loading = true;
+
+        const sentinel = this.sentinel;
+        this.observer.unobserve(sentinel);
+        try {
+            const html = await GateAPI.loadTasks(sentinel.dataset.nextUrl);
+            sentinel.insertAdjacentHTML('beforebegin', html);
+            sentinel.remove();
+            this.observeSentinel();
+        } catch {
+            // Retry a bit later (observing again fires at once if still visible)
+            setTimeout(() => this.observer.observe(sentinel), 5000);
+        } finally {
+            this.loading = false;
+        }
+    }
+
     async handleArchive(taskId) {
         try {
             const data = await GateAPI.archiveTask(taskId);
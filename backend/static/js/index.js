@@ -36,7 +36,8 @@ class DashboardCharts {
         this.charts = {
             stats: null,
             sleep: null,
-            habits: null
+            habits: null,
+            affinity: null
         };
         this.styles = getComputedStyle(document.documentElement);
         this.primaryColor = this.styles.getPropertyValue('--apex-primary').trim() || '#0d6efd';
@@ -44,6 +45,7 @@ class DashboardCharts {
         this.initStatsChart();
         this.initSleepChart();
         this.initHabitChart();
+        this.initAffinityChart();
     }
 
     initStatsChart() {
@@ -126,6 +128,62 @@ class DashboardCharts {
         });
     }
 
+    initAffinityChart() {
+        const ctx = document.getElementById('affinityChart');
+        if (!ctx) return;
+
+        const primaryRgb = this.styles.getPropertyValue('--apex-primary-rgb').trim() || '13, 110, 253';
+
+        this.charts.affinity = new Chart(ctx, {
+            type: 'bar',
+            data: {
+                labels: this.config.statLabels,
+                datasets: [
+                    {
+                        label: 'This Level',
+                        data: this.config.affinityLevel,
+                        backgroundColor: this.primaryColor,
+                        borderRadius: 2
+                    },
+                    {
+                        label: 'Lifetime',
+                        data: this.config.affinityLifetime,
+                        backgroundColor: `rgba(${primaryRgb}, 0.35)`,
+                        borderRadius: 2
+                    }
+                ]
+            },
+            options: {
+                responsive: true,
+                maintainAspectRatio: false,
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        max: 100,
+                        grid: { color: '#333' },
+                        ticks: { callback: (value) => `${value}%` }
+                    },
+                    x: { grid: { display: false } }
+                },
+                plugins: {
+                    legend: { labels: { color: '#aaa' } },
+                    tooltip: {
+                        callbacks: {
+                            label: (context) => `${context.dataset.label}: ${context.parsed.y}%`
+                        }
+                    }
+                }
+            }
+        });
+    }
+
+    updateAffinity(affinity) {
+        if (!this.charts.affinity || !affinity) return;
+        this.charts.affinity.data.datasets[0].data = affinity.current_level;
+        this.charts.affinity.data.datasets[1].data = affinity.lifetime;
+        this.charts.affinity.update();
+    }
+
     updateStats(newValues) {
         if (!this.charts.stats) return;
         this.charts.stats.data.datasets[0].data = newValues;
@@ -176,6 +234,7 @@ class HabitGrid {
                 this.chartManager.updateHabitBar(dayIndex, data.daily_count, data.daily_titles);
             }
             this.chartManager.updateStats(data.new_stats);
+            this.chartManager.updateAffinity(data.new_affinity);
 
             // 3. Update Player Card
             this.updatePlayerCard(data);
@@ -1,3 +1,4 @@
+import gzip
 import os
 import shutil
 
@@ -76,4 +77,16 @@ for src, dest in files:
     shutil.copyfile(src, dest)
     print(f"✅ Updated: {dest}")
 
+# Pre-compressed variants, served from memory by the emoji data view
+# (apps/gate/services/assets.py), so workers don't compress at startup.
+precompressed = ["backend/static/vendor/emoji-picker/data.json"]
+
+for path in precompressed:
+    with open(path, "rb") as f:
+        content = f.read()
+
+    with open(f"{path}.gz", "wb") as f:
+        f.write(gzip.compress(content, compresslevel=9, mtime=0))
+    print(f"✅ Compressed: {path}.gz")
+
 print("🎉 Vendor files updated successfully!")